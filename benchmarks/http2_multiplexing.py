@@ -0,0 +1,177 @@
+"""Benchmark: HttpClient over HTTP/1.1 vs. HTTP/2 (h2c prior knowledge).
+
+Starts a local stub backend that speaks both HTTP/1.1 keep-alive and
+cleartext HTTP/2 on the same port (detected from the connection preface),
+answers every request after a fixed server-side latency, and counts the
+TCP connections it accepts. For each concurrency level it runs
+``concurrency * rounds`` GETs through ``HttpClient`` and prints
+requests/sec and connections opened, for:
+
+- ``http1``: default client (``BACKEND_API_HTTP2=false``)
+- ``http2``: opt-in HTTP/2 (``BACKEND_API_HTTP2=true``)
+
+Requires the ``h2`` package (``httpx[http2]``).
+
+Usage:
+    uv run python benchmarks/http2_multiplexing.py [--levels 50 200 1000] [--rounds 5] [--latency 0.02]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+import h2.config
+import h2.connection
+import h2.events
+
+# Isolate the transport: no response cache, coalescing or hedging
+os.environ["BACKEND_CACHE_ENABLED"] = "false"
+os.environ["BACKEND_COALESCE_GETS"] = "false"
+os.environ["BACKEND_HEDGE_PATHS"] = "[]"
+
+from mesaYA_mcp.shared.core import get_settings  # noqa: E402
+from mesaYA_mcp.shared.infrastructure.adapters.http_client import HttpClient  # noqa: E402
+
+_BODY = json.dumps(
+    {"id": "4f1c2b9e-8d7a-4e6b-9c3d-2a1b0f9e8d7c", "status": "confirmed"}
+).encode()
+_H2_PREFACE = b"PRI * HTTP/2.0"
+
+
+class StubBackend:
+    """HTTP/1.1 + h2c stub answering every request after ``latency``."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.connections = 0
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Dispatch a connection on its first bytes."""
+        self.connections += 1
+        try:
+            head = await reader.readexactly(len(_H2_PREFACE))
+            if head == _H2_PREFACE:
+                await self._serve_h2(head, reader, writer)
+            else:
+                await self._serve_http1(head, reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_http1(
+        self,
+        head: bytes,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Serve keep-alive HTTP/1.1 requests one at a time.
+
+        ``head`` (the start of the first request line) was already read.
+        """
+        while True:
+            await reader.readuntil(b"\r\n\r\n")
+            await asyncio.sleep(self.latency)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Content-Length: " + str(len(_BODY)).encode() + b"\r\n"
+                b"Connection: keep-alive\r\n\r\n" + _BODY
+            )
+            await writer.drain()
+
+    async def _serve_h2(
+        self,
+        head: bytes,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Serve multiplexed HTTP/2 streams on one connection."""
+        conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        responders: set[asyncio.Task] = set()
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(self.latency)
+            conn.send_headers(
+                stream_id,
+                [
+                    (":status", "200"),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(_BODY))),
+                ],
+            )
+            conn.send_data(stream_id, _BODY, end_stream=True)
+            writer.write(conn.data_to_send())
+
+        data = head
+        while True:
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    task = asyncio.create_task(respond(event.stream_id))
+                    responders.add(task)
+                    task.add_done_callback(responders.discard)
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            data = await reader.read(65535)
+            if not data:
+                return
+
+
+async def _run(label: str, base_url: str, stub: StubBackend, concurrency: int, rounds: int) -> None:
+    """Run one mode at one concurrency level and print the results."""
+    os.environ["BACKEND_API_HTTP2"] = "true" if label == "http2" else "false"
+    get_settings.cache_clear()
+    client = HttpClient(base_url=base_url)
+    await client.open()
+
+    total = concurrency * rounds
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def one(i: int) -> None:
+        nonlocal failures
+        async with semaphore:
+            if await client.get("/api/v1/reservations/1", params={"i": i}) is None:
+                failures += 1
+
+    stub.connections = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    elapsed = time.perf_counter() - start
+    await client.aclose()
+
+    print(
+        f"{label:<6} {concurrency:>5} {total / elapsed:>10.1f} req/s"
+        f"  {stub.connections:>5} connections  {failures} failed  ({elapsed:.2f}s)"
+    )
+
+
+async def main(levels: list[int], rounds: int, latency: float) -> None:
+    stub = StubBackend(latency)
+    server = await asyncio.start_server(stub.handle, "127.0.0.1", 0, backlog=2048)
+    port = server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}"
+
+    print(f"{'mode':<6} {'conc':>5} {'throughput':>16}  {'conns':>5}")
+    async with server:
+        for concurrency in levels:
+            for label in ("http1", "http2"):
+                await _run(label, base_url, stub, concurrency, rounds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--levels", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+    asyncio.run(main(args.levels, args.rounds, args.latency))
@@ -0,0 +1,88 @@
+"""Benchmark: pooled HttpClient vs. a new AsyncClient per request.
+
+Starts a minimal keep-alive HTTP/1.1 stub backend on localhost and measures
+requests/sec for:
+
+- ``per-request``: the previous behaviour, one ``httpx.AsyncClient`` per call
+- ``pooled``: the shared, lifecycle-managed ``HttpClient`` client
+
+Usage:
+    uv run python benchmarks/http_client_pool.py [--requests 2000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from mesaYA_mcp.shared.infrastructure.adapters.http_client import HttpClient
+
+_BODY = json.dumps(
+    {"id": "4f1c2b9e-8d7a-4e6b-9c3d-2a1b0f9e8d7c", "name": "Pizza Palace"}
+).encode()
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Serve keep-alive GET requests with a fixed JSON body."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if not head:
+                break
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Content-Length: " + str(len(_BODY)).encode() + b"\r\n"
+                b"Connection: keep-alive\r\n\r\n" + _BODY
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _run(label: str, call, total: int, concurrency: int) -> None:
+    """Run ``total`` calls with bounded concurrency and print requests/sec."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            await call()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {total / elapsed:>10.1f} req/s  ({elapsed:.2f}s)")
+
+
+async def main(total: int, concurrency: int) -> None:
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}"
+
+    async def per_request() -> None:
+        async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
+            response = await client.get("/api/v1/restaurants/1")
+            response.json()
+
+    pooled_client = HttpClient(base_url=base_url)
+
+    async def pooled() -> None:
+        await pooled_client.get("/api/v1/restaurants/1")
+
+    async with server:
+        await _run("per-request", per_request, total, concurrency)
+        await pooled_client.open()
+        await _run("pooled", pooled, total, concurrency)
+        await pooled_client.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
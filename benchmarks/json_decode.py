@@ -0,0 +1,140 @@
+"""Benchmark: JSON decode time and peak memory per decoder backend.
+
+Decodes sample backend payloads with every installed ``JsonDecoder``
+backend (orjson, msgspec, stdlib) and prints the median decode time and
+the peak memory allocated during one decode (tracemalloc).
+
+Pass recorded responses (e.g. saved with
+``curl -s $BACKEND/api/v1/restaurants?limit=100 > restaurants.json``) with
+``--payload``; without it, synthetic payloads shaped like the backend's
+restaurant list and menu responses are generated.
+
+Usage:
+    uv run python benchmarks/json_decode.py [--payload FILE ...] [--runs 200]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+from mesaYA_mcp.shared.infrastructure.adapters.json_decoder import JsonDecoder
+
+
+def _restaurants(count: int) -> bytes:
+    """Build a paginated restaurant list like GET /api/v1/restaurants."""
+    rng = random.Random(1)
+    data = [
+        {
+            "id": f"{i:08x}-8d7a-4e6b-9c3d-2a1b0f9e8d7c",
+            "name": f"Restaurante {i} {rng.choice(['Pizza', 'Sushi', 'Café', 'Parrilla'])}",
+            "description": "Cocina tradicional con ingredientes locales. " * 4,
+            "cuisineType": rng.choice(["italian", "japanese", "ecuadorian"]),
+            "address": {"street": f"Av. Amazonas {i}", "city": "Quito", "country": "EC"},
+            "location": {"lat": -0.18 + rng.random() / 10, "lng": -78.48 + rng.random() / 10},
+            "rating": round(rng.uniform(3, 5), 1),
+            "isActive": True,
+            "openingHours": [
+                {"day": day, "open": "12:00", "close": "22:00"} for day in range(7)
+            ],
+            "createdAt": "2025-01-01T12:00:00.000Z",
+        }
+        for i in range(count)
+    ]
+    return json.dumps(
+        {"data": data, "pagination": {"page": 1, "limit": count, "totalItems": count}}
+    ).encode()
+
+
+def _menu(dishes: int) -> bytes:
+    """Build a menu with dishes like GET /api/v1/menus/restaurant/{id}."""
+    rng = random.Random(2)
+    return json.dumps(
+        {
+            "results": [
+                {
+                    "id": "5f1c2b9e-8d7a-4e6b-9c3d-2a1b0f9e8d7c",
+                    "name": "Menú principal",
+                    "dishes": [
+                        {
+                            "id": f"{i:08x}-0000-4000-8000-000000000000",
+                            "name": f"Plato {i}",
+                            "description": "Preparado al momento con productos frescos. " * 3,
+                            "price": round(rng.uniform(3, 40), 2),
+                            "category": rng.choice(["entrada", "fuerte", "postre"]),
+                            "allergens": rng.sample(["gluten", "lactosa", "nueces", "soya"], 2),
+                            "isAvailable": rng.random() > 0.1,
+                        }
+                        for i in range(dishes)
+                    ],
+                }
+            ],
+            "total": 1,
+            "page": 1,
+        }
+    ).encode()
+
+
+def _decoders() -> list[JsonDecoder]:
+    """Instantiate every installed backend."""
+    decoders = []
+    for backend in ("orjson", "msgspec", "stdlib"):
+        try:
+            decoders.append(JsonDecoder(backend))
+        except ImportError:
+            print(f"({backend} not installed, skipped)")
+    return decoders
+
+
+def _median_time(decoder: JsonDecoder, payload: bytes, runs: int) -> float:
+    """Median wall time of one decode in milliseconds."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        decoder.decode(payload)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def _peak_memory(decoder: JsonDecoder, payload: bytes) -> int:
+    """Peak bytes allocated while decoding once."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    result = decoder.decode(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def main(paths: list[str], runs: int) -> None:
+    if paths:
+        payloads = {Path(path).name: Path(path).read_bytes() for path in paths}
+    else:
+        payloads = {
+            "restaurants x20": _restaurants(20),
+            "restaurants x500": _restaurants(500),
+            "menu x300 dishes": _menu(300),
+        }
+
+    decoders = _decoders()
+    print(f"{'payload':<22} {'size':>9} {'decoder':<8} {'median':>10} {'peak mem':>10}")
+    for label, payload in payloads.items():
+        for decoder in decoders:
+            elapsed = _median_time(decoder, payload, runs)
+            peak = _peak_memory(decoder, payload)
+            print(
+                f"{label:<22} {len(payload) / 1024:>7.0f}KB {decoder.name:<8}"
+                f" {elapsed:>8.3f}ms {peak / 1024:>8.0f}KB"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payload", nargs="*", default=[], help="Recorded JSON responses")
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+    main(args.payload, args.runs)
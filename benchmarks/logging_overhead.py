@@ -0,0 +1,131 @@
+"""Benchmark: per-call cost of disabled log calls and of JSON log formatting.
+
+With the logger at INFO, measures a DEBUG call as tools make it:
+
+- ``unguarded``: the record path taken before level gating (build the
+  extra dict, then ``logging.Logger.log``), with eager arguments
+- ``eager``: ``logger.debug`` with arguments computed at the call site
+- ``lazy``: ``logger.debug`` with the costly argument as a lambda
+- ``guarded``: ``if logger.is_enabled("debug"): logger.debug(...)``
+
+then the cost of formatting one tool log record as a JSON line with
+``json.dumps`` and with the adapter's formatter (orjson when installed).
+
+Usage:
+    uv run python benchmarks/logging_overhead.py [--calls 200000]
+"""
+
+import argparse
+import json
+import logging
+import time
+
+from mesaYA_mcp.shared.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+_RESPONSE = {"data": [{"id": i, "name": f"Restaurante {i}"} for i in range(20)]}
+_PARAMS = {"query": "pizza", "city": "Quito", "page": 1, "limit": 20}
+
+
+def _per_call_ns(fn, calls: int) -> float:
+    """Mean wall time of ``fn()`` in nanoseconds."""
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter_ns() - start) / calls
+
+
+def _disabled(calls: int) -> None:
+    """Cost of a DEBUG call while the logger is at INFO."""
+    logger = LoggerAdapter(name="bench.disabled", level=logging.INFO, queue_size=0)
+    raw = logging.getLogger("bench.disabled")
+
+    def unguarded() -> None:
+        meta = {
+            "response_type": type(_RESPONSE).__name__,
+            "names": [item["name"] for item in _RESPONSE["data"]],
+            "params": _PARAMS,
+        }
+        raw.log(
+            logging.DEBUG,
+            "Search response",
+            extra={"context": "bench", "meta": meta, "error": None},
+            exc_info=False,
+        )
+
+    def eager() -> None:
+        logger.debug(
+            "Search response",
+            context="bench",
+            response_type=type(_RESPONSE).__name__,
+            names=[item["name"] for item in _RESPONSE["data"]],
+            params=_PARAMS,
+        )
+
+    def lazy() -> None:
+        logger.debug(
+            "Search response",
+            context="bench",
+            response_type=lambda: type(_RESPONSE).__name__,
+            names=lambda: [item["name"] for item in _RESPONSE["data"]],
+            params=_PARAMS,
+        )
+
+    def guarded() -> None:
+        if logger.is_enabled("debug"):
+            logger.debug(
+                "Search response",
+                context="bench",
+                response_type=type(_RESPONSE).__name__,
+                names=[item["name"] for item in _RESPONSE["data"]],
+                params=_PARAMS,
+            )
+
+    print("disabled DEBUG call (logger at INFO)")
+    for label, fn in (
+        ("unguarded", unguarded),
+        ("eager", eager),
+        ("lazy", lazy),
+        ("guarded", guarded),
+    ):
+        print(f"  {label:<10} {_per_call_ns(fn, calls):>8.0f}ns/call")
+
+
+def _formatting(calls: int) -> None:
+    """Cost of turning one tool log record into a JSON line."""
+    formatter = LoggerAdapter._JsonFormatter()
+    record = logging.LogRecord(
+        "mesaYA_mcp", logging.INFO, __file__, 0, "Executing tool", None, None
+    )
+    record.context = "search_restaurants"
+    record.meta = {"params": _PARAMS, "items": 20, "cached": False}
+    record.error = None
+
+    def stdlib() -> None:
+        json.dumps(
+            {
+                "timestamp": formatter.formatTime(record),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+                "context": record.context,
+                "meta": record.meta,
+            },
+            default=str,
+        )
+
+    print("JSON log line formatting")
+    for label, fn in (("json", stdlib), ("adapter", lambda: formatter.format(record))):
+        print(f"  {label:<10} {_per_call_ns(fn, calls):>8.0f}ns/call")
+
+
+def main(calls: int) -> None:
+    _disabled(calls)
+    print()
+    _formatting(calls // 4)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000)
+    args = parser.parse_args()
+    main(args.calls)
@@ -0,0 +1,137 @@
+"""Benchmark: CPU time and output size of each response format.
+
+Encodes backend-shaped payloads with every response adapter (TOON,
+compact JSON, columnar JSON), without the encoded output cache, and
+reports the median CPU time per document and the output size in bytes:
+
+- ``restaurants``: a projected restaurant search page
+- ``reservations``: a reservation list (flat rows with dates and ids)
+- ``menu``: a menu with nested dishes
+
+Usage:
+    uv run python benchmarks/response_formats.py [--runs 200] [--rows 50]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta
+
+from mesaYA_mcp.shared.domain.output_format import OutputFormat
+from mesaYA_mcp.shared.infrastructure.adapters.columnar_response_adapter import (
+    ColumnarResponseAdapter,
+)
+from mesaYA_mcp.shared.infrastructure.adapters.json_response_adapter import (
+    JsonResponseAdapter,
+)
+from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
+    ToonResponseAdapter,
+)
+
+_ADAPTERS = {
+    OutputFormat.TOON: ToonResponseAdapter(),
+    OutputFormat.JSON: JsonResponseAdapter(),
+    OutputFormat.COLUMNAR: ColumnarResponseAdapter(),
+}
+
+
+def _restaurants(count: int) -> list[dict]:
+    """Build a projected restaurant list like search_restaurants returns."""
+    return [
+        {
+            "id": f"{i:08x}-8d7a-4e6b-9c3d-2a1b0f9e8d7c",
+            "name": f"Restaurante {i}",
+            "description": "Cocina tradicional con ingredientes locales.",
+            "cuisineType": "ecuadorian",
+            "address": f"Av. Amazonas {i}",
+            "city": "Quito",
+            "rating": 4.5,
+            "isActive": True,
+        }
+        for i in range(count)
+    ]
+
+
+def _reservations(count: int) -> list[dict]:
+    """Build a reservation list like list_reservations returns."""
+    rng = random.Random(3)
+    start = datetime(2025, 3, 1, 12, 0)
+    return [
+        {
+            "id": f"{i:08x}-3f2e-4c1b-8a9d-7e6f5a4b3c2d",
+            "restaurantId": "0000002a-8d7a-4e6b-9c3d-2a1b0f9e8d7c",
+            "userId": f"{rng.randrange(10**6):08x}-7c1e-4d2a-9b3f-5e6d7c8b9a0f",
+            "reservationDate": date(2025, 3, 1) + timedelta(days=i % 30),
+            "reservationTime": (start + timedelta(minutes=30 * (i % 20))).time(),
+            "numberOfGuests": rng.randint(1, 8),
+            "status": rng.choice(["PENDING", "CONFIRMED", "CANCELLED"]),
+            "createdAt": start + timedelta(hours=i),
+        }
+        for i in range(count)
+    ]
+
+
+def _menu(dishes: int) -> list[dict]:
+    """Build a menu with dishes like get_restaurant_menu returns."""
+    rng = random.Random(5)
+    return [
+        {
+            "id": "00000001-0000-4000-8000-000000000000",
+            "name": "Menú principal",
+            "isActive": True,
+            "dishes": [
+                {
+                    "id": f"{i:08x}-0000-4000-8000-000000000000",
+                    "name": f"Plato {i}",
+                    "description": "Preparado al momento con productos frescos.",
+                    "price": round(rng.uniform(3, 40), 2),
+                    "category": rng.choice(["entrada", "fuerte", "postre"]),
+                    "isAvailable": True,
+                }
+                for i in range(dishes)
+            ],
+        }
+    ]
+
+
+def _median_cpu_ms(fn, runs: int) -> float:
+    """Median CPU time of ``fn()`` in milliseconds."""
+    timings = []
+    for _ in range(runs):
+        start = time.process_time()
+        fn()
+        timings.append(time.process_time() - start)
+    return statistics.median(timings) * 1000
+
+
+def main(runs: int, rows: int) -> None:
+    payloads = {
+        "restaurants": (_restaurants(rows), "restaurant", "search"),
+        "reservations": (_reservations(rows), "reservation", "list"),
+        "menu": (_menu(rows), "menu", "get"),
+    }
+    print(f"{'payload':<13} {'format':<9} {'cpu':>10} {'bytes':>9} {'vs json':>8}")
+    for label, (data, entity, operation) in payloads.items():
+        json_size = len(
+            _ADAPTERS[OutputFormat.JSON]
+            .map_success(data, entity, operation, len(data))
+            .encode()
+        )
+        for output_format, adapter in _ADAPTERS.items():
+            size = len(adapter.map_success(data, entity, operation, len(data)).encode())
+            cpu_ms = _median_cpu_ms(
+                lambda: adapter.map_success(data, entity, operation, len(data)), runs
+            )
+            print(
+                f"{label:<13} {output_format.value:<9} {cpu_ms:>8.3f}ms"
+                f" {size:>9} {size / json_size:>7.0%}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=50)
+    args = parser.parse_args()
+    main(args.runs, args.rows)
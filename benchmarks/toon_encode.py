@@ -0,0 +1,156 @@
+"""Benchmark: TOON encode time with and without the encoded output cache.
+
+Measures ``ToonResponseAdapter.map_success`` on backend-shaped payloads
+(a restaurant list and a menu with dishes):
+
+- ``encode``: no cache, every call runs ``toon_format.encode``
+- ``miss``: cache enabled, first call (digest + encode + store)
+- ``hit``: cache enabled, repeated call on unchanged data (digest + lookup)
+
+then replays a skewed workload of reads over ``--entities`` menus, where
+``--change-rate`` of reads follow an update to the menu, and reports the
+hit rate and total time with and without the cache.
+
+Usage:
+    uv run python benchmarks/toon_encode.py [--runs 200] [--entities 50] [--reads 5000] [--change-rate 0.05]
+"""
+
+import argparse
+import copy
+import random
+import statistics
+import time
+
+from mesaYA_mcp.shared.infrastructure.adapters.encoded_output_cache import (
+    EncodedOutputCache,
+)
+from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
+    ToonResponseAdapter,
+)
+
+
+def _restaurants(count: int) -> list[dict]:
+    """Build a projected restaurant list like search_restaurants returns."""
+    return [
+        {
+            "id": f"{i:08x}-8d7a-4e6b-9c3d-2a1b0f9e8d7c",
+            "name": f"Restaurante {i}",
+            "description": "Cocina tradicional con ingredientes locales.",
+            "cuisineType": "ecuadorian",
+            "address": f"Av. Amazonas {i}",
+            "city": "Quito",
+            "rating": 4.5,
+            "isActive": True,
+        }
+        for i in range(count)
+    ]
+
+
+def _menu(dishes: int, seed: int = 0) -> list[dict]:
+    """Build a menu with dishes like get_restaurant_menu returns."""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"{seed:08x}-0000-4000-8000-000000000000",
+            "name": "Menú principal",
+            "isActive": True,
+            "dishes": [
+                {
+                    "id": f"{i:08x}-0000-4000-8000-000000000000",
+                    "name": f"Plato {i}",
+                    "description": "Preparado al momento con productos frescos.",
+                    "price": round(rng.uniform(3, 40), 2),
+                    "category": rng.choice(["entrada", "fuerte", "postre"]),
+                    "isAvailable": True,
+                }
+                for i in range(dishes)
+            ],
+        }
+    ]
+
+
+def _median_ms(fn, runs: int) -> float:
+    """Median wall time of ``fn()`` in milliseconds."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def _new_cache() -> EncodedOutputCache:
+    return EncodedOutputCache(max_entries=512, max_chars=16 * 1024 * 1024)
+
+
+def _micro(runs: int) -> None:
+    """Per-call cost of encode, cache miss and cache hit."""
+    payloads = {
+        "restaurants x50": (_restaurants(50), "restaurant", "search"),
+        "menu x100 dishes": (_menu(100), "menu", "get"),
+    }
+    plain = ToonResponseAdapter()
+    print(f"{'payload':<18} {'encode':>10} {'miss':>10} {'hit':>10}")
+    for label, (data, entity, operation) in payloads.items():
+        encode_ms = _median_ms(
+            lambda: plain.map_success(data, entity, operation, len(data)), runs
+        )
+
+        def miss() -> None:
+            ToonResponseAdapter(_new_cache()).map_success(
+                data, entity, operation, len(data)
+            )
+
+        miss_ms = _median_ms(miss, runs)
+
+        cached = ToonResponseAdapter(_new_cache())
+        cached.map_success(data, entity, operation, len(data))
+        hit_ms = _median_ms(
+            lambda: cached.map_success(data, entity, operation, len(data)), runs
+        )
+        print(f"{label:<18} {encode_ms:>8.3f}ms {miss_ms:>8.3f}ms {hit_ms:>8.3f}ms")
+
+
+def _workload(entities: int, reads: int, change_rate: float) -> None:
+    """Replay skewed reads with occasional updates, with and without cache."""
+    rng = random.Random(7)
+    menus = [_menu(60, seed=i) for i in range(entities)]
+    weights = [1 / (rank + 1) for rank in range(entities)]
+    sequence = []
+    for _ in range(reads):
+        index = rng.choices(range(entities), weights)[0]
+        if rng.random() < change_rate:
+            updated = copy.deepcopy(menus[index])
+            updated[0]["dishes"][0]["price"] = round(rng.uniform(3, 40), 2)
+            menus[index] = updated
+        sequence.append(menus[index])
+
+    for label, adapter in (
+        ("no cache", ToonResponseAdapter()),
+        ("cache", ToonResponseAdapter(_new_cache())),
+    ):
+        start = time.perf_counter()
+        for data in sequence:
+            adapter.map_success(data, "menu", "get", len(data))
+        elapsed = time.perf_counter() - start
+        hit_rate = adapter.stats().get("cache", {}).get("hit_rate", 0.0)
+        print(
+            f"{label:<9} {reads} reads in {elapsed:.2f}s"
+            f"  ({elapsed / reads * 1000:.3f}ms/read, hit rate {hit_rate:.1%})"
+        )
+
+
+def main(runs: int, entities: int, reads: int, change_rate: float) -> None:
+    _micro(runs)
+    print()
+    _workload(entities, reads, change_rate)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--entities", type=int, default=50)
+    parser.add_argument("--reads", type=int, default=5000)
+    parser.add_argument("--change-rate", type=float, default=0.05)
+    args = parser.parse_args()
+    main(args.runs, args.entities, args.reads, args.change_rate)
@@ -0,0 +1,126 @@
+"""Benchmark: buffered vs streamed TOON encoding of a paginated list.
+
+Serves ``--rows`` user rows from a simulated backend in pages of
+``--page-size`` (each page decoded from JSON after ``--latency-ms``), and
+produces the list response two ways:
+
+- ``buffered``: collect every row, then ``map_success`` (one ``encode``)
+- ``streamed``: ``map_stream`` over the page iterator, chunk by chunk
+
+Chunks are written to a byte counter rather than kept, as a streaming
+transport would. Reports total time, time until the first rows are out and
+the tracemalloc peak, and checks both produce the same document.
+
+Usage:
+    uv run python benchmarks/toon_stream.py [--rows 20000] [--page-size 100] [--latency-ms 2]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+
+from mesaYA_mcp.shared.infrastructure.adapters.page_iterator import PageIterator
+from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
+    ToonResponseAdapter,
+)
+
+_COLUMNS = ["id", "email", "firstName", "lastName", "role", "isActive"]
+
+
+def _backend(rows: int, latency: float):
+    """Build a paged GET function returning ``{data, pagination}``."""
+
+    async def fetch(path: str, params: dict) -> dict:
+        await asyncio.sleep(latency)
+        start = (params["page"] - 1) * params["limit"]
+        end = min(rows, start + params["limit"])
+        body = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": f"{i:08x}-7c1e-4d2a-9b3f-5e6d7c8b9a0f",
+                        "email": f"user{i}@mesaya.ec",
+                        "firstName": "María José",
+                        "lastName": f"Andrade {i}",
+                        "role": "USER",
+                        "isActive": i % 7 != 0,
+                        "createdAt": "2025-01-15T10:30:00Z",
+                    }
+                    for i in range(start, end)
+                ],
+                "pagination": {"totalItems": rows},
+            }
+        )
+        return json.loads(body)
+
+    return fetch
+
+
+async def _buffered(fetch, rows: int, page_size: int) -> str:
+    """Collect every page, then encode once."""
+    async with PageIterator(fetch, "/users", page_size=page_size) as pages:
+        users = [
+            {column: user[column] for column in _COLUMNS}
+            async for user in pages
+        ]
+    return ToonResponseAdapter().map_success(users, "user", "list", rows)
+
+
+async def _stream(fetch, rows: int, page_size: int):
+    """Yield document chunks encoded while the pages are fetched."""
+    async with PageIterator(fetch, "/users", page_size=page_size) as pages:
+        async for chunk in ToonResponseAdapter().map_stream(
+            pages, "user", "list", rows, rows, _COLUMNS
+        ):
+            yield chunk
+
+
+async def _measure(label: str, fetch, rows: int, page_size: int) -> None:
+    """Print total time, time to the first rows and peak memory of a path."""
+    sent = 0
+    first = None
+    tracemalloc.start()
+    start = time.perf_counter()
+    if label == "buffered":
+        sent = len((await _buffered(fetch, rows, page_size)).encode())
+    else:
+        async for chunk in _stream(fetch, rows, page_size):
+            if first is None and sent:
+                first = time.perf_counter() - start
+            sent += len(chunk.encode())
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    first = first or elapsed
+    print(
+        f"{label:<9} total {elapsed * 1000:>8.1f}ms  first rows {first * 1000:>8.1f}ms"
+        f"  peak {peak / 1024 / 1024:>6.2f}MiB  ({sent} bytes)"
+    )
+
+
+async def _check(page_size: int) -> None:
+    """Verify both paths produce the same document on a small list."""
+    rows = page_size * 3 + 7
+    small = _backend(rows, 0)
+    buffered = await _buffered(small, rows, page_size)
+    streamed = "".join([chunk async for chunk in _stream(small, rows, page_size)])
+    assert streamed == buffered, "streamed document differs from encode()"
+
+
+async def main(rows: int, page_size: int, latency_ms: float) -> None:
+    fetch = _backend(rows, latency_ms / 1000)
+    await _check(page_size)
+    print(f"{rows} rows, pages of {page_size}, {latency_ms}ms per page")
+    await _measure("buffered", fetch, rows, page_size)
+    await _measure("streamed", fetch, rows, page_size)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=2)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.page_size, args.latency_ms))
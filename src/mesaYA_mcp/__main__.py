@@ -18,9 +18,10 @@ Supports two transport modes:
 - get_restaurant_sections: Get restaurant floor plan sections
 - get_section_tables: Get tables in a section
 
-### Reservation Tools (10)
+### Reservation Tools (11)
 - create_reservation: Create a new reservation
 - get_reservation: Get reservation details
+- get_reservations_bulk: Get several reservations in one call
 - list_reservations: List reservations with filters
 - get_restaurant_reservations: Get all reservations for a restaurant
 - update_reservation_status: Update reservation status
@@ -30,15 +31,17 @@ Supports two transport modes:
 - complete_reservation: Mark reservation as completed
 - get_reservation_analytics: Get reservation statistics
 
-### Menu Tools (5)
+### Menu Tools (6)
 - get_menu: Get menu details
 - list_menus: List restaurant menus
 - search_dishes: Search dishes across restaurants
 - get_dish: Get dish details
+- get_dishes_bulk: Get several dishes in one call
 - get_menu_analytics: Get menu statistics
 
-### User Tools (3)
+### User Tools (4)
 - get_user: Get user profile
+- get_users_bulk: Get several user profiles in one call
 - list_users: List users with filters
 - get_user_analytics: Get user statistics
 """
@@ -50,6 +53,9 @@ from mesaYA_mcp.shared.core import get_logger, get_settings
 # The @mcp.tool() decorators execute on import, registering each tool
 import mesaYA_mcp.tools  # noqa: F401
 
+# Register the /health route (served in SSE / gateway mode)
+import mesaYA_mcp.health  # noqa: F401
+
 
 def main() -> None:
     """Main entry point for the MCP server.
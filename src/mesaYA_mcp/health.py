@@ -0,0 +1,49 @@
+"""Health endpoint - Liveness and upstream health for the MCP Gateway.
+
+Registers ``GET /health`` on the MCP server's HTTP app (SSE transport).
+The response reports each upstream's circuit breaker state, so load
+balancers and operators can see when the backend or payment MS is
+failing fast.
+"""
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from mesaYA_mcp.server import mcp
+from mesaYA_mcp.shared.core import get_http_client, get_logger, get_payment_client
+from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
+    get_encoding_stats,
+)
+
+
+@mcp.custom_route("/health", methods=["GET"])
+async def health(request: Request) -> JSONResponse:
+    """Report server liveness and upstream circuit states.
+
+    Status is "ok" when every circuit is closed and "degraded" otherwise;
+    the HTTP status is 200 either way since the gateway itself is up.
+
+    Args:
+        request: Incoming HTTP request.
+
+    Returns:
+        JSON with overall status, per-upstream circuit state, backend
+        client counters, response encoding counters and log queue and sampling counters.
+    """
+    backend = get_http_client().stats()
+    payment = get_payment_client().stats()
+    upstreams = {
+        "backend": backend["circuit"],
+        "payment": payment["circuit"],
+    }
+    degraded = any(circuit["state"] != "closed" for circuit in upstreams.values())
+
+    return JSONResponse(
+        {
+            "status": "degraded" if degraded else "ok",
+            "upstreams": upstreams,
+            "backend": backend,
+            "encoding": get_encoding_stats(),
+            "logging": get_logger().stats(),
+        }
+    )
@@ -4,13 +4,64 @@ This module creates the single FastMCP instance that all tool modules
 will import and register their tools with using the @mcp.tool() decorator.
 """
 
+import asyncio
+from collections.abc import Sequence
+from typing import Any
+
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.types import ContentBlock
 
-from mesaYA_mcp.shared.core import configure_dependencies, get_settings
+from mesaYA_mcp.shared.core import (
+    app_lifespan,
+    configure_dependencies,
+    get_settings,
+)
+from mesaYA_mcp.shared.domain import deadline_scope
 
 # Initialize settings and dependencies
 settings = get_settings()
 configure_dependencies(settings)
 
+
+class MesaYAMCP(FastMCP):
+    """FastMCP server that runs every tool call under a deadline.
+
+    The deadline is visible to resolvers and HTTP clients through
+    ``get_remaining_time()``, so nested backend calls shrink their
+    timeouts to fit, and the call is cancelled once the budget is spent.
+    """
+
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any]
+    ) -> Sequence[ContentBlock] | dict[str, Any]:
+        """Call a tool by name with arguments, within its deadline.
+
+        Args:
+            name: Tool name.
+            arguments: Tool arguments.
+
+        Returns:
+            The tool result.
+
+        Raises:
+            ToolError: If the tool fails or exceeds its deadline.
+        """
+        budget = settings.tool_deadlines.get(name, settings.tool_deadline)
+        if budget <= 0:
+            return await super().call_tool(name, arguments)
+
+        with deadline_scope(budget):
+            try:
+                async with asyncio.timeout(budget) as scope:
+                    return await super().call_tool(name, arguments)
+            except TimeoutError:
+                if not scope.expired():
+                    raise
+                raise ToolError(
+                    f"Tool '{name}' exceeded its {budget:g}s deadline"
+                ) from None
+
+
 # Create single MCP server instance - imported by all tool modules
-mcp = FastMCP(settings.app_name)
+mcp = MesaYAMCP(settings.app_name, lifespan=app_lifespan)
@@ -19,8 +19,26 @@ class LoggerPort(ABC):
     - Testing with mock loggers
     - Clean separation of concerns
     - Consistent logging interface across the application
+
+    Metadata values that are callables other than classes (e.g.
+    ``lambda: expensive()``, a bound method or ``functools.partial``) are
+    only called if the message is logged, so arguments that are costly to
+    build cost nothing when their level is disabled. For work that does
+    not fit in a metadata value, guard the call with ``is_enabled``.
     """
 
+    @abstractmethod
+    def is_enabled(self, level: str) -> bool:
+        """Check whether messages of a level would be logged.
+
+        Args:
+            level: Level name (verbose, debug, info, warn, error).
+
+        Returns:
+            True if a message at this level would be written.
+        """
+        pass
+
     @abstractmethod
     def info(self, message: str, context: str | None = None, **meta: Any) -> None:
         """Log an informational message.
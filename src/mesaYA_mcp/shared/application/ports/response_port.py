@@ -4,7 +4,7 @@ Defines the contract that all response adapters must implement.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterable, AsyncIterator
 
 
 class ResponsePort(ABC):
@@ -35,6 +35,75 @@ class ResponsePort(ABC):
         """
         pass
 
+    @abstractmethod
+    def map_page(
+        self,
+        data: list[Any],
+        entity_type: str,
+        operation: str,
+        count: int | None = None,
+    ) -> str:
+        """Map a list response to output format within the page budget.
+
+        Args:
+            data: The full list of rows.
+            entity_type: Type of entity (restaurant, reservation, menu, user).
+            operation: Operation performed (list, search, ...).
+            count: Optional total count for the list.
+
+        Returns:
+            Formatted string with the rows that fit and, if any were left
+            out, a continuation cursor for ``map_continuation``.
+        """
+        pass
+
+    @abstractmethod
+    def map_continuation(
+        self,
+        cursor: str,
+        entity_type: str,
+        operation: str,
+    ) -> str:
+        """Map the next slice of a list truncated by ``map_page``.
+
+        Args:
+            cursor: Continuation cursor from a previous page.
+            entity_type: Type of entity the calling tool returns.
+            operation: Operation the calling tool performs.
+
+        Returns:
+            Formatted page string, or an error if the cursor is invalid,
+            expired or was issued for a different entity/operation.
+        """
+        pass
+
+    @abstractmethod
+    def map_stream(
+        self,
+        rows: AsyncIterable[Any],
+        entity_type: str,
+        operation: str,
+        length: int,
+        count: int | None = None,
+        columns: list[str] | None = None,
+    ) -> AsyncIterator[str]:
+        """Map a list read from an async iterator to output chunks.
+
+        Args:
+            rows: Rows of the list, e.g. a backend page iterator.
+            entity_type: Type of entity (restaurant, reservation, menu, user).
+            operation: Operation performed (list, search, ...).
+            length: Number of rows to read and declare in the output.
+            count: Optional total count for the list.
+            columns: Fields of each row when rows are flat and uniform
+                (tabular output); None to accept rows of any shape.
+
+        Returns:
+            Async iterator of chunks that concatenate to a complete
+            document with the ``map_success`` envelope.
+        """
+        pass
+
     @abstractmethod
     def map_error(
         self,
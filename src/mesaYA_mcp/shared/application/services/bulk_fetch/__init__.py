@@ -0,0 +1,17 @@
+"""Bulk fetch service module.
+
+This module exports the helper bulk tools use to fetch several entities
+by ID and split them into found, missing and failed.
+"""
+
+from mesaYA_mcp.shared.application.services.bulk_fetch.bulk_fetch_result import (
+    BulkFetchResult,
+)
+from mesaYA_mcp.shared.application.services.bulk_fetch.fetch_by_ids import (
+    fetch_by_ids,
+)
+
+__all__ = [
+    "BulkFetchResult",
+    "fetch_by_ids",
+]
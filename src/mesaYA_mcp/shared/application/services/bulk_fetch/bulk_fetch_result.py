@@ -0,0 +1,21 @@
+"""Bulk fetch result."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class BulkFetchResult:
+    """Outcome of fetching several entities by ID.
+
+    Attributes:
+        requested: Distinct non-blank IDs that were fetched, in order.
+        items: Entities that were found.
+        not_found: IDs the backend reported as missing (404).
+        failed: IDs whose request failed (error, timeout, open circuit).
+    """
+
+    requested: list[str] = field(default_factory=list)
+    items: list[Any] = field(default_factory=list)
+    not_found: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
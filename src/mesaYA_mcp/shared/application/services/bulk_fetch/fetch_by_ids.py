@@ -0,0 +1,49 @@
+"""Fetch several entities by ID concurrently."""
+
+from collections.abc import Iterable
+
+from mesaYA_mcp.shared.core import get_http_client
+from mesaYA_mcp.shared.application.services.bulk_fetch.bulk_fetch_result import (
+    BulkFetchResult,
+)
+
+# Marks a 404 in get_many results, distinct from None (request failed)
+_NOT_FOUND = object()
+
+
+async def fetch_by_ids(ids: Iterable[str], path: str) -> BulkFetchResult:
+    """Fetch the entities behind a list of IDs.
+
+    IDs are stripped, blanks dropped and duplicates fetched once. Each ID
+    ends up in exactly one of ``items``, ``not_found`` or ``failed``, so
+    callers can tell missing entities from an unavailable backend.
+
+    Args:
+        ids: Entity IDs as given by the caller.
+        path: Endpoint path template with one ``{}`` for the ID
+            (e.g. ``"/api/v1/dishes/{}"``).
+
+    Returns:
+        The split result; ``requested`` is empty if every ID was blank.
+    """
+    http_client = get_http_client()
+    result = BulkFetchResult(
+        requested=list(dict.fromkeys(i.strip() for i in ids if i.strip()))
+    )
+    if not result.requested:
+        return result
+
+    paths = {entity_id: path.format(entity_id) for entity_id in result.requested}
+    responses = await http_client.get_many(
+        list(paths.values()), not_found=_NOT_FOUND
+    )
+
+    for entity_id, entity_path in paths.items():
+        response = responses[entity_path]
+        if response is _NOT_FOUND:
+            result.not_found.append(entity_id)
+        elif response is None:
+            result.failed.append(entity_id)
+        else:
+            result.items.append(response)
+    return result
@@ -4,6 +4,16 @@ This module provides functions to resolve user-friendly identifiers
 (like restaurant names, user emails) to internal UUIDs.
 """
 
+from mesaYA_mcp.shared.application.services.entity_resolver.cache import (
+    get_resolver_cache,
+    invalidate_restaurant,
+    invalidate_user,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.index import (
+    NameMatch,
+    get_restaurant_name_index,
+    get_section_index,
+)
 from mesaYA_mcp.shared.application.services.entity_resolver.restaurant import (
     resolve_restaurant,
     resolve_restaurant_id,
@@ -16,6 +26,10 @@ from mesaYA_mcp.shared.application.services.entity_resolver.section import (
     resolve_section,
     resolve_section_id,
 )
+from mesaYA_mcp.shared.application.services.entity_resolver.batch import (
+    EntityRef,
+    resolve_ids,
+)
 
 __all__ = [
     "resolve_restaurant",
@@ -24,4 +38,12 @@ __all__ = [
     "resolve_user_id",
     "resolve_section",
     "resolve_section_id",
+    "EntityRef",
+    "resolve_ids",
+    "get_resolver_cache",
+    "invalidate_restaurant",
+    "invalidate_user",
+    "NameMatch",
+    "get_restaurant_name_index",
+    "get_section_index",
 ]
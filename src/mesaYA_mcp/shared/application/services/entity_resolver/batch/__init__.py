@@ -0,0 +1,10 @@
+"""Batch resolver module."""
+
+from mesaYA_mcp.shared.application.services.entity_resolver.batch.entity_ref import (
+    EntityRef,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.batch.resolve_ids import (
+    resolve_ids,
+)
+
+__all__ = ["EntityRef", "resolve_ids"]
@@ -0,0 +1,19 @@
+"""Entity reference for batch resolution."""
+
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+
+@dataclass(frozen=True)
+class EntityRef:
+    """A user-friendly identifier to resolve to a UUID.
+
+    Attributes:
+        entity_type: Kind of entity the identifier refers to.
+        identifier: Name, email or UUID as given by the user.
+        restaurant: Restaurant name or UUID, used as context for sections.
+    """
+
+    entity_type: Literal["restaurant", "user", "section"]
+    identifier: str
+    restaurant: Optional[str] = None
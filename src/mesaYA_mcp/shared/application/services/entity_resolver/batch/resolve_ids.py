@@ -0,0 +1,70 @@
+"""Resolve several independent identifiers concurrently."""
+
+import asyncio
+from collections.abc import Mapping
+from typing import Optional
+
+from mesaYA_mcp.shared.domain import EntityLookupError, EntityNotFoundError
+from mesaYA_mcp.shared.application.services.entity_resolver.batch.entity_ref import (
+    EntityRef,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.restaurant import (
+    resolve_restaurant_id,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.section import (
+    resolve_section_id,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.user import (
+    resolve_user_id,
+)
+
+
+async def _resolve_one(ref: EntityRef) -> str:
+    """Resolve a single reference, raising if it does not resolve."""
+    entity_id: Optional[str]
+    if ref.entity_type == "restaurant":
+        entity_id = await resolve_restaurant_id(ref.identifier)
+    elif ref.entity_type == "user":
+        entity_id = await resolve_user_id(ref.identifier)
+    else:
+        entity_id = await resolve_section_id(ref.identifier, ref.restaurant)
+
+    if entity_id is None:
+        raise EntityNotFoundError(ref.entity_type, ref.identifier)
+    return entity_id
+
+
+async def resolve_ids(refs: Mapping[str, EntityRef]) -> dict[str, str]:
+    """Resolve a batch of heterogeneous identifiers to UUIDs concurrently.
+
+    All lookups run in one task group, so the batch takes as long as the
+    slowest lookup. The first lookup that does not resolve or fails cancels
+    the others and its error is raised.
+
+    Args:
+        refs: Mapping of caller-chosen names to entity references.
+
+    Returns:
+        Mapping of the same names to resolved UUIDs.
+
+    Raises:
+        EntityNotFoundError: If any identifier cannot be resolved.
+        EntityLookupError: If a backend lookup failed.
+
+    Example:
+        >>> ids = await resolve_ids({
+        ...     "restaurant": EntityRef("restaurant", "Pizza Palace"),
+        ...     "customer": EntityRef("user", "john@example.com"),
+        ... })
+        >>> ids["restaurant"], ids["customer"]
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = {
+                name: group.create_task(_resolve_one(ref))
+                for name, ref in refs.items()
+            }
+    except* (EntityNotFoundError, EntityLookupError) as errors:
+        raise errors.exceptions[0] from None
+
+    return {name: task.result() for name, task in tasks.items()}
@@ -0,0 +1,21 @@
+"""Resolver cache module."""
+
+from mesaYA_mcp.shared.application.services.entity_resolver.cache.resolver_cache import (
+    ResolverCache,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.cache.get_resolver_cache import (
+    get_resolver_cache,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.cache.invalidate_restaurant import (
+    invalidate_restaurant,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.cache.invalidate_user import (
+    invalidate_user,
+)
+
+__all__ = [
+    "ResolverCache",
+    "get_resolver_cache",
+    "invalidate_restaurant",
+    "invalidate_user",
+]
@@ -0,0 +1,26 @@
+"""Resolver cache provider."""
+
+from mesaYA_mcp.shared.core import Container, get_settings
+from mesaYA_mcp.shared.application.services.entity_resolver.cache.resolver_cache import (
+    ResolverCache,
+)
+
+
+def get_resolver_cache() -> ResolverCache:
+    """Get the shared resolver cache.
+
+    Lazily initializes and registers the cache on first call.
+
+    Returns:
+        ResolverCache: The shared resolver cache instance.
+    """
+    if not Container.has("resolver_cache"):
+        settings = get_settings()
+        cache = ResolverCache(
+            ttl=settings.resolver_cache_ttl,
+            negative_ttl=settings.resolver_cache_negative_ttl,
+            max_entries=settings.resolver_cache_max_entries,
+        )
+        Container.register("resolver_cache", cache)
+
+    return Container.resolve("resolver_cache")
@@ -0,0 +1,16 @@
+"""Invalidate cached restaurant resolutions."""
+
+from mesaYA_mcp.shared.application.services.entity_resolver.cache.get_resolver_cache import (
+    get_resolver_cache,
+)
+
+
+def invalidate_restaurant(restaurant_id: str) -> None:
+    """Forget a cached restaurant and the names resolving to it.
+
+    Call this after a restaurant is renamed, deleted or otherwise changed.
+
+    Args:
+        restaurant_id: Restaurant UUID.
+    """
+    get_resolver_cache().invalidate_entity("restaurant", restaurant_id)
@@ -0,0 +1,16 @@
+"""Invalidate cached user resolutions."""
+
+from mesaYA_mcp.shared.application.services.entity_resolver.cache.get_resolver_cache import (
+    get_resolver_cache,
+)
+
+
+def invalidate_user(user_id: str) -> None:
+    """Forget a cached user and the emails/names resolving to it.
+
+    Call this after a user's email or name changes or the user is deleted.
+
+    Args:
+        user_id: User UUID.
+    """
+    get_resolver_cache().invalidate_entity("user", user_id)
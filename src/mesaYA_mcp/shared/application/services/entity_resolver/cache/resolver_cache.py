@@ -0,0 +1,147 @@
+"""Resolver cache - TTL cache for entity resolution results.
+
+Maps normalized names/emails to entity IDs and entity IDs to entity dicts,
+so repeated lookups of the same restaurant or user skip the backend.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class ResolverCache:
+    """Bounded TTL cache for resolver lookups.
+
+    Entries are keyed by ``(kind, key)`` where ``kind`` names the lookup
+    (e.g. ``"restaurant"`` for ID -> entity, ``"restaurant_name"`` for
+    name -> ID). Misses are cached too, with a shorter TTL, so repeated
+    lookups of an unknown name do not hammer the backend.
+
+    Attributes:
+        _ttl: TTL in seconds for found entities.
+        _negative_ttl: TTL in seconds for cached misses.
+        _max_entries: Maximum number of entries before LRU eviction.
+    """
+
+    def __init__(self, ttl: float, negative_ttl: float, max_entries: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: TTL in seconds for found entities.
+            negative_ttl: TTL in seconds for cached misses.
+            max_entries: Maximum number of entries before LRU eviction.
+        """
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[Any, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(key: str) -> str:
+        """Normalize a lookup key (whitespace and case insensitive).
+
+        Args:
+            key: Raw name, email or ID.
+
+        Returns:
+            Normalized key.
+        """
+        return " ".join(key.split()).casefold()
+
+    def get(self, kind: str, key: str) -> tuple[bool, Any]:
+        """Look up a cached value.
+
+        Args:
+            kind: Lookup kind (e.g. "restaurant", "user_email").
+            key: Lookup key (normalized internally).
+
+        Returns:
+            Tuple of (hit, value). A hit with value None is a cached miss.
+        """
+        cache_key = (kind, self.normalize(key))
+        cached = self._entries.get(cache_key)
+        if cached is None or cached[1] <= time.monotonic():
+            if cached is not None:
+                del self._entries[cache_key]
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(cache_key)
+        self.hits += 1
+        return True, cached[0]
+
+    def set(self, kind: str, key: str, value: Any) -> None:
+        """Cache a resolved value.
+
+        Args:
+            kind: Lookup kind.
+            key: Lookup key (normalized internally).
+            value: Resolved entity dict or ID.
+        """
+        self._store((kind, self.normalize(key)), value, self._ttl)
+
+    def set_missing(self, kind: str, key: str) -> None:
+        """Cache a failed lookup with the negative TTL.
+
+        Args:
+            kind: Lookup kind.
+            key: Lookup key (normalized internally).
+        """
+        self._store((kind, self.normalize(key)), None, self._negative_ttl)
+
+    def _store(self, cache_key: tuple[str, str], value: Any, ttl: float) -> None:
+        """Store an entry and evict the least recently used ones."""
+        if ttl <= 0:
+            return
+        self._entries[cache_key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, kind: str, key: str) -> None:
+        """Drop a single cached lookup.
+
+        Args:
+            kind: Lookup kind.
+            key: Lookup key (normalized internally).
+        """
+        self._entries.pop((kind, self.normalize(key)), None)
+
+    def invalidate_entity(self, kind: str, entity_id: str) -> None:
+        """Drop an entity and every alias (name, email) resolving to it.
+
+        Args:
+            kind: Entity kind (e.g. "restaurant", "user").
+            entity_id: The entity UUID.
+        """
+        entity_key = self.normalize(entity_id)
+        stale = [
+            cache_key
+            for cache_key, (value, _) in self._entries.items()
+            if cache_key == (kind, entity_key)
+            or (
+                cache_key[0].startswith(f"{kind}_")
+                and isinstance(value, str)
+                and self.normalize(value) == entity_key
+            )
+        ]
+        for cache_key in stale:
+            del self._entries[cache_key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get cache counters.
+
+        Returns:
+            Dict with hits, misses and entries.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+        }
@@ -0,0 +1,25 @@
+"""Local name index module."""
+
+from mesaYA_mcp.shared.application.services.entity_resolver.index.name_match import (
+    NameMatch,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.index.restaurant_name_index import (
+    RestaurantNameIndex,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.index.get_restaurant_name_index import (
+    get_restaurant_name_index,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.index.section_index import (
+    SectionIndex,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.index.get_section_index import (
+    get_section_index,
+)
+
+__all__ = [
+    "NameMatch",
+    "RestaurantNameIndex",
+    "get_restaurant_name_index",
+    "SectionIndex",
+    "get_section_index",
+]
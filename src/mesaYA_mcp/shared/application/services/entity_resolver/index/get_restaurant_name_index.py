@@ -0,0 +1,28 @@
+"""Restaurant name index provider."""
+
+from mesaYA_mcp.shared.core import Container, get_http_client, get_settings
+from mesaYA_mcp.shared.application.services.entity_resolver.index.restaurant_name_index import (
+    RestaurantNameIndex,
+)
+
+
+def get_restaurant_name_index() -> RestaurantNameIndex:
+    """Get the shared restaurant name index.
+
+    Lazily initializes and registers the index on first call. The index
+    starts empty and loads itself in the background on first use.
+
+    Returns:
+        RestaurantNameIndex: The shared restaurant name index.
+    """
+    if not Container.has("restaurant_name_index"):
+        settings = get_settings()
+        index = RestaurantNameIndex(
+            http_client=get_http_client(),
+            refresh_interval=settings.restaurant_index_refresh_interval,
+            min_confidence=settings.restaurant_index_min_confidence,
+            page_size=settings.restaurant_index_page_size,
+        )
+        Container.register("restaurant_name_index", index)
+
+    return Container.resolve("restaurant_name_index")
@@ -0,0 +1,25 @@
+"""Section index provider."""
+
+from mesaYA_mcp.shared.core import Container, get_settings
+from mesaYA_mcp.shared.application.services.entity_resolver.index.section_index import (
+    SectionIndex,
+)
+
+
+def get_section_index() -> SectionIndex:
+    """Get the shared per-restaurant section index.
+
+    Lazily initializes and registers the index on first call.
+
+    Returns:
+        SectionIndex: The shared section index.
+    """
+    if not Container.has("section_index"):
+        settings = get_settings()
+        index = SectionIndex(
+            ttl=settings.section_index_ttl,
+            max_restaurants=settings.section_index_max_restaurants,
+        )
+        Container.register("section_index", index)
+
+    return Container.resolve("section_index")
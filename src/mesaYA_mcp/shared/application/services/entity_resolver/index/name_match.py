@@ -0,0 +1,16 @@
+"""Ranked name index match."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class NameMatch:
+    """A candidate returned by a name index lookup.
+
+    Attributes:
+        entity: The matched entity dict.
+        score: Confidence between 0.0 and 1.0 (1.0 is an exact folded match).
+    """
+
+    entity: dict
+    score: float
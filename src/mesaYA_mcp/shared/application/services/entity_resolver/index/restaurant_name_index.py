@@ -0,0 +1,253 @@
+"""Restaurant name index - Local fuzzy restaurant name resolution.
+
+Keeps every restaurant in memory keyed by its folded name plus a trigram
+posting list, so names with missing accents or small typos ("salon",
+"pizza palce") resolve locally without a backend search.
+"""
+
+import asyncio
+import contextvars
+import time
+from collections import Counter
+from typing import Any, Optional
+
+from mesaYA_mcp.shared.core import get_logger
+from mesaYA_mcp.shared.application.services.entity_resolver.index.name_match import (
+    NameMatch,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.utils import fold_name
+
+# Seconds to wait before retrying a failed refresh
+_RETRY_AFTER_FAILURE = 30.0
+
+# Score given to names that contain the whole query (e.g. "pizza")
+_CONTAINMENT_SCORE = 0.75
+
+
+def _trigrams(folded: str) -> set[str]:
+    """Split a folded name into padded per-word trigrams."""
+    grams: set[str] = set()
+    for word in folded.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class RestaurantNameIndex:
+    """In-memory fuzzy index of restaurant names.
+
+    The index is refreshed from ``/api/v1/restaurants`` in the background
+    (stale-while-revalidate): lookups always answer from the current
+    snapshot and a stale snapshot only schedules a refresh.
+
+    Scores are the Dice coefficient of the name trigrams, with exact folded
+    matches scoring 1.0 and names containing the whole query scoring at
+    least ``_CONTAINMENT_SCORE``.
+
+    Attributes:
+        _http_client: Backend client used to refresh the index.
+        _refresh_interval: Seconds a snapshot stays fresh.
+        _min_confidence: Minimum score for ``best`` to accept a match.
+        _page_size: Restaurants requested per page during a refresh.
+    """
+
+    def __init__(
+        self,
+        http_client: Any,
+        refresh_interval: float,
+        min_confidence: float,
+        page_size: int,
+    ) -> None:
+        """Initialize an empty index.
+
+        Args:
+            http_client: Backend client used to refresh the index.
+            refresh_interval: Seconds a snapshot stays fresh.
+            min_confidence: Minimum score for ``best`` to accept a match.
+            page_size: Restaurants requested per page during a refresh.
+        """
+        self._http_client = http_client
+        self._refresh_interval = refresh_interval
+        self._min_confidence = min_confidence
+        self._page_size = page_size
+
+        self._restaurants: list[dict] = []
+        self._names: list[str] = []
+        self._grams: list[set[str]] = []
+        self._by_name: dict[str, int] = {}
+        self._postings: dict[str, list[int]] = {}
+
+        self._loaded_at: Optional[float] = None
+        self._next_refresh_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        self.lookups = 0
+        self.matches = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    @property
+    def ready(self) -> bool:
+        """Whether a snapshot has been loaded."""
+        return self._loaded_at is not None
+
+    def load(self, restaurants: list[dict]) -> None:
+        """Replace the snapshot with the given restaurants.
+
+        Args:
+            restaurants: Restaurant dicts with at least ``id`` and ``name``.
+        """
+        entries: list[dict] = []
+        names: list[str] = []
+        grams: list[set[str]] = []
+        by_name: dict[str, int] = {}
+        postings: dict[str, list[int]] = {}
+
+        for restaurant in restaurants:
+            folded = fold_name(str(restaurant.get("name") or ""))
+            if not folded or not restaurant.get("id"):
+                continue
+            position = len(entries)
+            entries.append(restaurant)
+            names.append(folded)
+            name_grams = _trigrams(folded)
+            grams.append(name_grams)
+            by_name.setdefault(folded, position)
+            for gram in name_grams:
+                postings.setdefault(gram, []).append(position)
+
+        # Swap all structures at once so readers never see a partial index
+        self._restaurants, self._names, self._grams = entries, names, grams
+        self._by_name, self._postings = by_name, postings
+        self._loaded_at = time.monotonic()
+        self._next_refresh_at = self._loaded_at + self._refresh_interval
+
+    def search(self, name: str, limit: int = 5) -> list[NameMatch]:
+        """Rank restaurants by similarity to a name.
+
+        Args:
+            name: Restaurant name as typed by the user.
+            limit: Maximum number of candidates to return.
+
+        Returns:
+            Candidates ordered by descending score.
+        """
+        folded = fold_name(name)
+        if not folded:
+            return []
+
+        query_grams = _trigrams(folded)
+        overlap: Counter[int] = Counter()
+        for gram in query_grams:
+            for position in self._postings.get(gram, ()):
+                overlap[position] += 1
+
+        exact = self._by_name.get(folded)
+        scored: list[tuple[float, int]] = []
+        for position, shared in overlap.items():
+            if position == exact:
+                score = 1.0
+            else:
+                score = 2 * shared / (len(query_grams) + len(self._grams[position]))
+                if folded in self._names[position]:
+                    score = max(score, _CONTAINMENT_SCORE)
+            scored.append((score, position))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [
+            NameMatch(entity=self._restaurants[position], score=round(score, 3))
+            for score, position in scored[:limit]
+        ]
+
+    def best(self, name: str) -> Optional[NameMatch]:
+        """Get the best candidate if it is confident enough.
+
+        Args:
+            name: Restaurant name as typed by the user.
+
+        Returns:
+            The top candidate, or None if there is none above the
+            confidence threshold.
+        """
+        self.lookups += 1
+        candidates = self.search(name, limit=1)
+        if not candidates or candidates[0].score < self._min_confidence:
+            return None
+        self.matches += 1
+        return candidates[0]
+
+    def ensure_fresh(self) -> None:
+        """Schedule a background refresh if the snapshot is missing or stale.
+
+        Must be called from a running event loop. Never blocks the caller.
+        """
+        if self._refresh_task is not None or time.monotonic() < self._next_refresh_at:
+            return
+        # Run in a fresh context so the refresh is not bound by the deadline
+        # of the tool call that happened to trigger it
+        self._refresh_task = asyncio.create_task(
+            self.refresh(), context=contextvars.Context()
+        )
+        self._refresh_task.add_done_callback(self._on_refresh_done)
+
+    def _on_refresh_done(self, task: asyncio.Task) -> None:
+        """Release the refresh slot once a background refresh finishes."""
+        self._refresh_task = None
+        if not task.cancelled() and task.exception() is not None:
+            self._next_refresh_at = time.monotonic() + _RETRY_AFTER_FAILURE
+
+    async def refresh(self) -> bool:
+        """Reload all restaurants from the backend, page by page.
+
+        The current snapshot is kept if any page fails.
+
+        Returns:
+            True if the snapshot was replaced, False otherwise.
+        """
+        logger = get_logger()
+        restaurants: dict[str, dict] = {}
+
+        async with self._http_client.paginate(
+            "/api/v1/restaurants", page_size=self._page_size
+        ) as pages:
+            async for item in pages:
+                if isinstance(item, dict) and item.get("id"):
+                    restaurants[item["id"]] = item
+
+        if pages.failed:
+            self.refresh_failures += 1
+            self._next_refresh_at = time.monotonic() + _RETRY_AFTER_FAILURE
+            logger.warn(
+                "Restaurant index refresh failed, keeping previous snapshot",
+                context="RestaurantNameIndex.refresh",
+                page=pages.pages + 1,
+            )
+            return False
+
+        self.load(list(restaurants.values()))
+        self.refreshes += 1
+        logger.debug(
+            "Restaurant index refreshed",
+            context="RestaurantNameIndex.refresh",
+            size=len(self._restaurants),
+        )
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """Get index counters.
+
+        Returns:
+            Dict with size, lookup/match counts, refresh counts and the
+            snapshot age in seconds (None if never loaded).
+        """
+        age = None
+        if self._loaded_at is not None:
+            age = round(time.monotonic() - self._loaded_at, 1)
+        return {
+            "size": len(self._restaurants),
+            "lookups": self.lookups,
+            "matches": self.matches,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "age": age,
+        }
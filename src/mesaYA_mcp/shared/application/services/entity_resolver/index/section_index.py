@@ -0,0 +1,99 @@
+"""Section index - Per-restaurant section lookup by name.
+
+Caches each restaurant's sections keyed by folded name, so resolving a
+section name is a dict access instead of a download and linear scan of
+the restaurant's section list.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from mesaYA_mcp.shared.application.services.entity_resolver.utils import fold_name
+
+
+class SectionIndex:
+    """Bounded TTL index of sections per restaurant.
+
+    Attributes:
+        _ttl: Seconds a restaurant's section list stays valid.
+        _max_restaurants: Maximum restaurants kept before LRU eviction.
+    """
+
+    def __init__(self, ttl: float, max_restaurants: int) -> None:
+        """Initialize an empty index.
+
+        Args:
+            ttl: Seconds a restaurant's section list stays valid.
+            max_restaurants: Maximum restaurants kept before LRU eviction.
+        """
+        self._ttl = ttl
+        self._max_restaurants = max_restaurants
+        self._entries: OrderedDict[str, tuple[dict[str, dict], float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, restaurant_id: str) -> Optional[dict[str, dict]]:
+        """Get a restaurant's sections by folded name.
+
+        Args:
+            restaurant_id: Restaurant UUID.
+
+        Returns:
+            Mapping of folded section name to section dict, or None if the
+            restaurant is not indexed or its entry expired.
+        """
+        entry = self._entries.get(restaurant_id)
+        if entry is None or entry[1] <= time.monotonic():
+            self._entries.pop(restaurant_id, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(restaurant_id)
+        self.hits += 1
+        return entry[0]
+
+    def store(self, restaurant_id: str, sections: list[dict]) -> dict[str, dict]:
+        """Index a restaurant's section list.
+
+        Args:
+            restaurant_id: Restaurant UUID.
+            sections: Section dicts as returned by the backend.
+
+        Returns:
+            Mapping of folded section name to section dict.
+        """
+        by_name: dict[str, dict] = {}
+        for section in sections:
+            folded = fold_name(str(section.get("name") or ""))
+            if folded:
+                by_name.setdefault(folded, section)
+
+        self._entries[restaurant_id] = (by_name, time.monotonic() + self._ttl)
+        self._entries.move_to_end(restaurant_id)
+        while len(self._entries) > self._max_restaurants:
+            self._entries.popitem(last=False)
+        return by_name
+
+    def invalidate(self, restaurant_id: Optional[str] = None) -> None:
+        """Drop one restaurant's sections, or all of them.
+
+        Args:
+            restaurant_id: Restaurant UUID, or None to clear the index.
+        """
+        if restaurant_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(restaurant_id, None)
+
+    def stats(self) -> dict[str, Any]:
+        """Get index counters.
+
+        Returns:
+            Dict with hits, misses and indexed restaurant count.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "restaurants": len(self._entries),
+        }
@@ -2,7 +2,13 @@
 
 from typing import Optional
 
-from mesaYA_mcp.shared.core import get_logger, get_http_client
+from mesaYA_mcp.shared.core import get_logger, get_http_client, get_settings
+from mesaYA_mcp.shared.application.services.entity_resolver.cache import (
+    get_resolver_cache,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.index import (
+    get_restaurant_name_index,
+)
 from mesaYA_mcp.shared.application.services.entity_resolver.utils import is_uuid
 
 
@@ -10,7 +16,11 @@ async def resolve_restaurant(identifier: str) -> Optional[dict]:
     """Resolve a restaurant by name or ID.
 
     If the identifier is a UUID, fetches the restaurant by ID.
-    If the identifier is a name, searches for the restaurant by name.
+    If the identifier is a name, matches it against the local restaurant
+    name index and only searches the backend when the index has no
+    confident match.
+    Results are cached in the resolver cache, and so are misses (a 404
+    or an empty search); failed requests are not.
 
     Args:
         identifier: Restaurant name or UUID.
@@ -20,6 +30,7 @@ async def resolve_restaurant(identifier: str) -> Optional[dict]:
     """
     logger = get_logger()
     http_client = get_http_client()
+    cache = get_resolver_cache()
 
     if not identifier or not identifier.strip():
         return None
@@ -28,16 +39,55 @@ async def resolve_restaurant(identifier: str) -> Optional[dict]:
 
     try:
         if is_uuid(identifier):
+            hit, restaurant = cache.get("restaurant", identifier)
+            if hit:
+                return restaurant
+
             # Direct ID lookup
             logger.debug(
                 "Resolving restaurant by ID",
                 context="restaurant_resolver",
                 identifier=identifier,
             )
-            response = await http_client.get(f"/api/v1/restaurants/{identifier}")
-            return response if response else None
+            response = await http_client.get(f"/api/v1/restaurants/{identifier}", not_found={})
+            if response is None:
+                # Request failed: do not cache it as a miss
+                return None
+            if not response:
+                cache.set_missing("restaurant", identifier)
+                return None
+
+            cache.set("restaurant", identifier, response)
+            return response
         else:
-            # Name lookup - first try search which handles encoding properly
+            # Name lookup - try the local fuzzy index first (it also
+            # overrides misses cached before the index was loaded)
+            if get_settings().restaurant_index_enabled:
+                index = get_restaurant_name_index()
+                index.ensure_fresh()
+                match = index.best(identifier)
+                if match is not None:
+                    restaurant = match.entity
+                    logger.debug(
+                        "Resolved restaurant from name index",
+                        context="restaurant_resolver",
+                        name=identifier,
+                        restaurant_id=restaurant["id"],
+                        score=match.score,
+                    )
+                    cache.set("restaurant", restaurant["id"], restaurant)
+                    cache.set("restaurant_name", identifier, restaurant["id"])
+                    return restaurant
+
+            hit, restaurant_id = cache.get("restaurant_name", identifier)
+            if hit and restaurant_id is None:
+                return None
+            if hit:
+                hit, restaurant = cache.get("restaurant", restaurant_id)
+                if hit and restaurant:
+                    return restaurant
+
+            # Index miss - search the backend, which handles encoding properly
             logger.debug(
                 "Resolving restaurant by name using search",
                 context="restaurant_resolver",
@@ -52,21 +102,33 @@ async def resolve_restaurant(identifier: str) -> Optional[dict]:
             logger.debug(
                 "Restaurant search response",
                 context="restaurant_resolver",
-                response_type=type(search_response).__name__,
+                response_type=lambda: type(search_response).__name__,
                 response_is_none=search_response is None,
             )
 
+            if search_response is None:
+                # Search failed: do not cache it as a miss
+                return None
+
+            restaurant = None
             if search_response:
                 if isinstance(search_response, dict):
                     restaurants = search_response.get(
                         "data", search_response.get("results", [])
                     )
                     if restaurants:
-                        return restaurants[0]
+                        restaurant = restaurants[0]
                 elif isinstance(search_response, list) and search_response:
-                    return search_response[0]
+                    restaurant = search_response[0]
+
+            if not restaurant:
+                cache.set_missing("restaurant_name", identifier)
+                return None
 
-            return None
+            if restaurant.get("id"):
+                cache.set("restaurant", restaurant["id"], restaurant)
+                cache.set("restaurant_name", identifier, restaurant["id"])
+            return restaurant
 
     except Exception as e:
         logger.error(
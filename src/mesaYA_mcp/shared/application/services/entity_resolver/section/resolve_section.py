@@ -3,7 +3,17 @@
 from typing import Optional
 
 from mesaYA_mcp.shared.core import get_logger, get_http_client
-from mesaYA_mcp.shared.application.services.entity_resolver.utils import is_uuid
+from mesaYA_mcp.shared.domain import EntityLookupError
+from mesaYA_mcp.shared.application.services.entity_resolver.cache import (
+    get_resolver_cache,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.index import (
+    get_section_index,
+)
+from mesaYA_mcp.shared.application.services.entity_resolver.utils import (
+    fold_name,
+    is_uuid,
+)
 
 
 async def resolve_section(
@@ -12,7 +22,12 @@ async def resolve_section(
     """Resolve a section by name or ID.
 
     If the identifier is a UUID, fetches the section by ID.
-    If the identifier is a name and restaurant is provided, searches within that restaurant.
+    If the identifier is a name and restaurant is provided, looks it up in the
+    restaurant's section index, loading the index from the backend when it
+    is missing or expired.
+    Lookups by ID are cached in the resolver cache, and so are 404
+    misses; failed requests are not cached and raise instead, so callers
+    can tell an unavailable backend from a missing section.
 
     Args:
         identifier: Section name or UUID.
@@ -20,9 +35,13 @@ async def resolve_section(
 
     Returns:
         Section data dict if found, None otherwise.
+
+    Raises:
+        EntityLookupError: If the section or sections request failed.
     """
     logger = get_logger()
     http_client = get_http_client()
+    cache = get_resolver_cache()
 
     if not identifier or not identifier.strip():
         return None
@@ -31,61 +50,82 @@ async def resolve_section(
 
     try:
         if is_uuid(identifier):
+            hit, section = cache.get("section", identifier)
+            if hit:
+                return section
+
             # Direct ID lookup
             logger.debug(
                 "Resolving section by ID",
                 context="section_resolver",
                 identifier=identifier,
             )
-            response = await http_client.get(f"/api/v1/sections/{identifier}")
-            return response if response else None
+            response = await http_client.get(f"/api/v1/sections/{identifier}", not_found={})
+            if response is None:
+                # Request failed: do not cache it as a miss
+                raise EntityLookupError("section", identifier)
+            if not response:
+                cache.set_missing("section", identifier)
+                return None
+
+            cache.set("section", identifier, response)
+            return response
         else:
             # Section name lookup requires restaurant context
             if not restaurant_identifier:
-                logger.warning(
+                logger.warn(
                     "Section name lookup requires restaurant context",
                     context="section_resolver",
                     section_name=identifier,
                 )
                 return None
 
-            # First resolve the restaurant
+            # First resolve the restaurant. A restaurant UUID is not validated
+            # separately: the sections lookup below fails for unknown IDs.
             from mesaYA_mcp.shared.application.services.entity_resolver.restaurant import (
                 resolve_restaurant_id,
             )
 
-            restaurant_id = await resolve_restaurant_id(restaurant_identifier)
+            restaurant_identifier = restaurant_identifier.strip()
+            if is_uuid(restaurant_identifier):
+                restaurant_id = restaurant_identifier
+            else:
+                restaurant_id = await resolve_restaurant_id(restaurant_identifier)
             if not restaurant_id:
-                logger.warning(
+                logger.warn(
                     "Could not resolve restaurant for section lookup",
                     context="section_resolver",
                     restaurant=restaurant_identifier,
                 )
                 return None
 
-            # Get all sections for the restaurant
-            logger.debug(
-                "Resolving section by name within restaurant",
-                context="section_resolver",
-                section_name=identifier,
-                restaurant_id=restaurant_id,
-            )
-            response = await http_client.get(
-                f"/api/v1/restaurants/{restaurant_id}/sections"
-            )
+            section_index = get_section_index()
+            sections = section_index.get(restaurant_id)
+            if sections is None:
+                # Index the restaurant's sections for later lookups
+                logger.debug(
+                    "Loading section index for restaurant",
+                    context="section_resolver",
+                    restaurant_id=restaurant_id,
+                )
+                response = await http_client.get(
+                    f"/api/v1/restaurants/{restaurant_id}/sections", not_found=[]
+                )
+                if response is None:
+                    raise EntityLookupError("section", identifier)
 
-            if response:
-                sections = (
+                section_list = (
                     response if isinstance(response, list) else response.get("data", [])
                 )
-                # Find section by name (case-insensitive)
-                identifier_lower = identifier.lower()
-                for section in sections:
-                    if section.get("name", "").lower() == identifier_lower:
-                        return section
+                sections = section_index.store(restaurant_id, section_list)
+                for section in section_list:
+                    if section.get("id"):
+                        cache.set("section", section["id"], section)
 
-            return None
+            return sections.get(fold_name(identifier))
 
+    except EntityLookupError:
+        raise
     except Exception as e:
         logger.error(
             "Failed to resolve section",
@@ -19,6 +19,9 @@ async def resolve_section_id(
 
     Returns:
         Section UUID if found, None otherwise.
+
+    Raises:
+        EntityLookupError: If the backend lookup failed.
     """
     if not identifier or not identifier.strip():
         return None
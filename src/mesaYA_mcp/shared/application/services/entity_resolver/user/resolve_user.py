@@ -3,6 +3,9 @@
 from typing import Optional
 
 from mesaYA_mcp.shared.core import get_logger, get_http_client
+from mesaYA_mcp.shared.application.services.entity_resolver.cache import (
+    get_resolver_cache,
+)
 from mesaYA_mcp.shared.application.services.entity_resolver.utils import (
     is_uuid,
     is_email,
@@ -15,6 +18,8 @@ async def resolve_user(identifier: str) -> Optional[dict]:
     If the identifier is a UUID, fetches the user by ID.
     If the identifier is an email, searches for the user by email.
     Otherwise, searches by name.
+    Results are cached in the resolver cache, and so are misses (a 404
+    or an empty search); failed requests are not.
 
     Args:
         identifier: User email, name, or UUID.
@@ -24,6 +29,7 @@ async def resolve_user(identifier: str) -> Optional[dict]:
     """
     logger = get_logger()
     http_client = get_http_client()
+    cache = get_resolver_cache()
 
     if not identifier or not identifier.strip():
         return None
@@ -32,34 +38,47 @@ async def resolve_user(identifier: str) -> Optional[dict]:
 
     try:
         if is_uuid(identifier):
+            hit, user = cache.get("user", identifier)
+            if hit:
+                return user
+
             # Direct ID lookup
             logger.debug(
                 "Resolving user by ID",
                 context="user_resolver",
                 identifier=identifier,
             )
-            response = await http_client.get(f"/api/v1/users/{identifier}")
-            return response if response else None
-        elif is_email(identifier):
+            response = await http_client.get(f"/api/v1/users/{identifier}", not_found={})
+            if response is None:
+                # Request failed: do not cache it as a miss
+                return None
+            if not response:
+                cache.set_missing("user", identifier)
+                return None
+
+            cache.set("user", identifier, response)
+            return response
+
+        if is_email(identifier):
+            alias_kind, param = "user_email", "email"
+        else:
+            alias_kind, param = "user_name", "name"
+
+        hit, user_id = cache.get(alias_kind, identifier)
+        if hit and user_id is None:
+            return None
+        if hit:
+            hit, user = cache.get("user", user_id)
+            if hit and user:
+                return user
+
+        if param == "email":
             # Email lookup
             logger.debug(
                 "Resolving user by email",
                 context="user_resolver",
                 email=identifier,
             )
-            response = await http_client.get(
-                "/api/v1/users", params={"email": identifier, "limit": 1}
-            )
-
-            if response:
-                if isinstance(response, dict):
-                    users = response.get("data", response.get("results", []))
-                    if users:
-                        return users[0]
-                elif isinstance(response, list) and response:
-                    return response[0]
-
-            return None
         else:
             # Try name search as fallback
             logger.debug(
@@ -67,20 +86,32 @@ async def resolve_user(identifier: str) -> Optional[dict]:
                 context="user_resolver",
                 name=identifier,
             )
-            response = await http_client.get(
-                "/api/v1/users", params={"name": identifier, "limit": 1}
-            )
+        response = await http_client.get(
+            "/api/v1/users", params={param: identifier, "limit": 1}
+        )
+
+        if response is None:
+            # Search failed: do not cache it as a miss
+            return None
 
-            if response:
-                if isinstance(response, dict):
-                    users = response.get("data", response.get("results", []))
-                    if users:
-                        return users[0]
-                elif isinstance(response, list) and response:
-                    return response[0]
+        user = None
+        if response:
+            if isinstance(response, dict):
+                users = response.get("data", response.get("results", []))
+                if users:
+                    user = users[0]
+            elif isinstance(response, list) and response:
+                user = response[0]
 
+        if not user:
+            cache.set_missing(alias_kind, identifier)
             return None
 
+        if user.get("id"):
+            cache.set("user", user["id"], user)
+            cache.set(alias_kind, identifier, user["id"])
+        return user
+
     except Exception as e:
         logger.error(
             "Failed to resolve user",
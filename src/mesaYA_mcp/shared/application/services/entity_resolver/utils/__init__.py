@@ -4,5 +4,8 @@ from mesaYA_mcp.shared.application.services.entity_resolver.utils.is_uuid import
 from mesaYA_mcp.shared.application.services.entity_resolver.utils.is_email import (
     is_email,
 )
+from mesaYA_mcp.shared.application.services.entity_resolver.utils.fold_name import (
+    fold_name,
+)
 
-__all__ = ["is_uuid", "is_email"]
+__all__ = ["is_uuid", "is_email", "fold_name"]
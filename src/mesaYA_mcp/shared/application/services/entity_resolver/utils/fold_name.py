@@ -0,0 +1,24 @@
+"""Name folding utility."""
+
+import unicodedata
+
+
+def fold_name(value: str) -> str:
+    """Fold a name for accent-, case- and punctuation-insensitive matching.
+
+    Example: ``"  Salón  Principal!"`` -> ``"salon principal"``.
+
+    Args:
+        value: The name to fold.
+
+    Returns:
+        Lowercase ASCII-folded name with punctuation removed and
+        whitespace collapsed.
+    """
+    decomposed = unicodedata.normalize("NFKD", value.casefold())
+    stripped = "".join(
+        char if char.isalnum() else " "
+        for char in decomposed
+        if not unicodedata.combining(char)
+    )
+    return " ".join(stripped.split())
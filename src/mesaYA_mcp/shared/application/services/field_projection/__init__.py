@@ -0,0 +1,15 @@
+"""Field projection service module.
+
+This module exports the projection applied to backend entities before
+they are encoded into tool responses.
+"""
+
+from mesaYA_mcp.shared.application.services.field_projection.project_fields import (
+    ALL_FIELDS,
+    project_fields,
+)
+
+__all__ = [
+    "ALL_FIELDS",
+    "project_fields",
+]
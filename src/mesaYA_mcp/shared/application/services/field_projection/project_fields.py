@@ -0,0 +1,72 @@
+"""Project backend entities down to the fields a tool returns."""
+
+from typing import Any
+
+from mesaYA_mcp.shared.domain import FIELD_PROJECTIONS, NESTED_ENTITIES
+
+ALL_FIELDS = "*"
+
+
+def _project(item: Any, entity_type: str, fields: list[str] | None = None) -> Any:
+    """Project one entity dict, recursing into nested entities.
+
+    Without ``fields``, every field except the entity type's dropped
+    fields is kept; with ``fields``, only those fields are kept.
+    """
+    if not isinstance(item, dict):
+        return item
+
+    dropped = FIELD_PROJECTIONS.get(entity_type, frozenset())
+    nested = NESTED_ENTITIES.get(entity_type, {})
+    names = fields if fields is not None else item.keys()
+
+    projected = {}
+    for field in names:
+        if field not in item or (fields is None and field in dropped):
+            continue
+        value = item[field]
+        nested_type = nested.get(field)
+        if nested_type is not None:
+            if isinstance(value, list):
+                value = [_project(entry, nested_type) for entry in value]
+            else:
+                value = _project(value, nested_type)
+        projected[field] = value
+    return projected
+
+
+def project_fields(
+    data: Any,
+    entity_type: str,
+    fields: list[str] | None = None,
+    keep: tuple[str, ...] = ("id",),
+) -> Any:
+    """Drop fields the agent does not need from one entity or a list of them.
+
+    Without ``fields``, the entity type's noise fields from
+    ``FIELD_PROJECTIONS`` are dropped and everything else is kept.
+    Explicit ``fields`` keep only those fields plus ``keep`` (``id`` by
+    default, so results can be referenced in follow-up calls); nested
+    entities keep their default view. ``["*"]`` or an entity type
+    without a projection returns the data unchanged.
+
+    Args:
+        data: Entity dict or list of entity dicts from the backend.
+        entity_type: Entity type key in ``FIELD_PROJECTIONS``.
+        fields: Optional backend field names requested by the caller.
+        keep: Fields always returned alongside explicit ``fields``.
+
+    Returns:
+        The projected data, in the same shape as the input.
+    """
+    if entity_type not in FIELD_PROJECTIONS or (fields and ALL_FIELDS in fields):
+        return data
+
+    if fields:
+        fields = list(dict.fromkeys([*keep, *fields]))
+    else:
+        fields = None
+
+    if isinstance(data, list):
+        return [_project(item, entity_type, fields) for item in data]
+    return _project(data, entity_type, fields)
@@ -7,6 +7,8 @@ Provides centralized access to all core utilities:
 - configure_dependencies: Application startup configuration
 - get_logger: Logger provider function
 - get_http_client: HTTP client provider function
+- get_payment_client: Payment MS client provider function
+- app_lifespan: Server startup/shutdown of shared clients
 """
 
 from mesaYA_mcp.shared.core.settings import Settings
@@ -15,6 +17,8 @@ from mesaYA_mcp.shared.core.container import Container
 from mesaYA_mcp.shared.core.configure_dependencies import configure_dependencies
 from mesaYA_mcp.shared.core.get_logger import get_logger
 from mesaYA_mcp.shared.core.get_http_client import get_http_client
+from mesaYA_mcp.shared.core.get_payment_client import get_payment_client
+from mesaYA_mcp.shared.core.app_lifespan import app_lifespan
 
 __all__ = [
     "Settings",
@@ -23,4 +27,6 @@ __all__ = [
     "configure_dependencies",
     "get_logger",
     "get_http_client",
+    "get_payment_client",
+    "app_lifespan",
 ]
@@ -0,0 +1,47 @@
+"""App lifespan - Startup and shutdown of shared network resources.
+
+Provides the lifespan context manager passed to the FastMCP server so
+pooled HTTP clients are opened at startup and closed cleanly at shutdown.
+"""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from mesaYA_mcp.shared.core.get_http_client import get_http_client
+from mesaYA_mcp.shared.core.get_logger import get_logger
+from mesaYA_mcp.shared.core.get_payment_client import get_payment_client
+
+# FastMCP enters the lifespan once per session on the SSE transport,
+# so shared clients are only closed when the last session ends.
+_active_sessions = 0
+
+
+@asynccontextmanager
+async def app_lifespan(server: Any) -> AsyncIterator[None]:
+    """Open shared clients on startup and close them on shutdown.
+
+    Args:
+        server: The FastMCP server instance (unused).
+
+    Yields:
+        None while the server (or session) is running.
+    """
+    global _active_sessions
+    logger = get_logger()
+    http_client = get_http_client()
+    payment_client = get_payment_client()
+
+    if _active_sessions == 0:
+        await http_client.open()
+        await payment_client.open()
+        logger.info("HTTP connection pools opened", context="app_lifespan")
+    _active_sessions += 1
+
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0:
+            await http_client.aclose()
+            await payment_client.aclose()
+            logger.info("HTTP connection pools closed", context="app_lifespan")
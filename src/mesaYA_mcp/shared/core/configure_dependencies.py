@@ -3,8 +3,6 @@
 Provides the function to configure all dependencies at application startup.
 """
 
-import logging
-
 from mesaYA_mcp.shared.core.container import Container
 from mesaYA_mcp.shared.core.settings import Settings
 from mesaYA_mcp.shared.core.get_settings import get_settings
@@ -30,12 +28,6 @@ def configure_dependencies(settings: Settings | None = None) -> None:
     Container.register("settings", settings)
 
     # Initialize logger
-    log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
     from mesaYA_mcp.shared.infrastructure.adapters.logger_adapter import LoggerAdapter
 
-    logger = LoggerAdapter(
-        name=settings.app_name,
-        level=log_level,
-        use_json=settings.log_format_json,
-    )
-    Container.register("logger", logger)
+    Container.register("logger", LoggerAdapter.from_settings(settings))
@@ -3,8 +3,6 @@
 Provides a FastAPI-style dependency injection function for getting the logger instance.
 """
 
-import logging
-
 from mesaYA_mcp.shared.core.container import Container
 from mesaYA_mcp.shared.core.get_settings import get_settings
 
@@ -26,13 +24,6 @@ def get_logger():
             LoggerAdapter,
         )
 
-        settings = get_settings()
-        log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
-        logger = LoggerAdapter(
-            name=settings.app_name,
-            level=log_level,
-            use_json=settings.log_format_json,
-        )
-        Container.register("logger", logger)
+        Container.register("logger", LoggerAdapter.from_settings(get_settings()))
 
     return Container.resolve("logger")
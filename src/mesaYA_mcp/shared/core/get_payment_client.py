@@ -0,0 +1,32 @@
+"""Payment Client provider - Dependency injection function for Payment MS client.
+
+Provides a FastAPI-style dependency injection function for getting the payment client instance.
+"""
+
+from functools import lru_cache
+
+from mesaYA_mcp.shared.core.container import Container
+
+
+@lru_cache(maxsize=1)
+def get_payment_client():
+    """Get the HTTP client for Payment MS calls (FastAPI Depends-style).
+
+    Lazily initializes and registers the payment client on first call.
+
+    Returns:
+        PaymentClient: Configured payment client instance.
+
+    Example:
+        >>> client = get_payment_client()
+        >>> response = await client.get(f"/api/v1/payments/{payment_id}")
+    """
+    from mesaYA_mcp.shared.infrastructure.adapters.payment_client import (
+        PaymentClient,
+    )
+
+    if not Container.has("payment_client"):
+        client = PaymentClient()
+        Container.register("payment_client", client)
+
+    return Container.resolve("payment_client")
@@ -6,6 +6,8 @@ Uses pydantic-settings for automatic environment variable loading and validation
 from pydantic import computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from mesaYA_mcp.shared.domain.output_format import OutputFormat
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables.
@@ -32,12 +34,128 @@ class Settings(BaseSettings):
     debug: bool = False
     log_level: str = "INFO"
     log_format_json: bool = True
+    # Bounded queue between loggers and the stderr writer thread (0 writes
+    # synchronously); when full, drop the new record or the oldest queued
+    log_queue_size: int = 10000
+    log_queue_overflow: str = "drop_new"
+    # Debug/info log sampling and rate limiting by context prefix (longest
+    # prefix wins, "" matches every context); warnings and errors are kept
+    log_sample_rates: dict[str, float] = {}
+    log_rate_limits: dict[str, float] = {}
+    log_rate_burst: int = 20
 
     # Backend API configuration
     backend_api_host: str = "localhost"
     backend_api_port: int = 3000
     backend_api_timeout: float = 30.0
     backend_api_key: str = ""
+    backend_api_max_connections: int = 100
+    backend_api_max_keepalive_connections: int = 20
+    backend_api_keepalive_expiry: float = 30.0
+    # HTTP/2 (needs httpx[http2]); http:// URLs use prior knowledge (h2c)
+    backend_api_http2: bool = False
+    backend_coalesce_gets: bool = True
+    # JSON decoder for backend/payment responses: auto, orjson, msgspec, stdlib
+    json_decoder: str = "auto"
+    # Items requested per page when walking paginated list endpoints
+    backend_page_size: int = 50
+    # Concurrent requests per bulk (get-many) tool call
+    backend_bulk_concurrency: int = 8
+    # Path prefix -> connect/read/write/pool timeouts in seconds; longest
+    # prefix wins, unset phases fall back to backend_api_timeout
+    backend_timeout_profiles: dict[str, dict[str, float]] = {
+        "/api/v1/users": {"connect": 2.0, "read": 5.0, "pool": 2.0},
+        "/api/v1/sections": {"connect": 2.0, "read": 5.0, "pool": 2.0},
+        "/api/v1/restaurants": {"connect": 2.0, "read": 10.0, "pool": 2.0},
+        "/api/v1/users/analytics": {"connect": 2.0, "read": 30.0, "pool": 5.0},
+        "/api/v1/menus/analytics": {"connect": 2.0, "read": 30.0, "pool": 5.0},
+        "/api/v1/reservations/analytics": {"connect": 2.0, "read": 30.0, "pool": 5.0},
+    }
+
+    # Backend retries (GET, and PATCH/DELETE marked idempotent)
+    backend_retry_max_attempts: int = 3
+    backend_retry_base_delay: float = 0.2
+    backend_retry_max_delay: float = 2.0
+    backend_retry_deadline: float = 10.0
+    backend_retry_statuses: list[int] = [429, 502, 503, 504]
+
+    # Request hedging for latency-sensitive GET routes (empty list disables)
+    backend_hedge_paths: list[str] = [
+        "/api/v1/restaurants",
+        "/api/v1/menus/restaurant",
+    ]
+    backend_hedge_percentile: float = 95.0
+    backend_hedge_min_delay: float = 0.05
+    backend_hedge_max_ratio: float = 0.1
+    backend_hedge_min_samples: int = 20
+
+    # Circuit breakers (one per upstream: backend API and payment MS)
+    circuit_breaker_failure_rate: float = 0.5
+    circuit_breaker_window_size: int = 20
+    circuit_breaker_minimum_calls: int = 10
+    circuit_breaker_open_duration: float = 30.0
+    circuit_breaker_half_open_max_calls: int = 1
+
+    # Per-tool-call deadline in seconds (0 disables), with per-tool overrides
+    tool_deadline: float = 30.0
+    tool_deadlines: dict[str, float] = {
+        "get_user_analytics": 45.0,
+        "get_menu_analytics": 45.0,
+        "get_reservation_analytics": 45.0,
+        "analyze_menu_image": 60.0,
+    }
+
+    # Backend response cache (read-only GET endpoints)
+    backend_cache_enabled: bool = True
+    backend_cache_max_entries: int = 1000
+    backend_cache_max_bytes: int = 32 * 1024 * 1024
+    # Path prefix -> TTL in seconds; longest prefix wins, 0 disables caching
+    backend_cache_ttls: dict[str, float] = {
+        "/api/v1/restaurants": 300.0,
+        "/api/v1/sections": 60.0,
+        "/api/v1/menus": 120.0,
+        "/api/v1/menus/analytics": 0.0,
+    }
+
+    # Default response format (toon, json or columnar); sessions can pick
+    # another one through set_access_context
+    response_format: OutputFormat = OutputFormat.TOON
+
+    # Encoded output cache (success documents keyed by data digest, one
+    # cache per response format in use)
+    toon_cache_enabled: bool = True
+    toon_cache_max_entries: int = 512
+    toon_cache_max_chars: int = 16 * 1024 * 1024
+
+    # List response budget (0 disables a limit); rows past it are served
+    # through continuation cursors kept for response_cursor_ttl seconds
+    response_max_rows: int = 50
+    response_max_bytes: int = 32 * 1024
+    response_cursor_ttl: float = 600.0
+    response_cursor_max_entries: int = 256
+
+    # Entity resolver cache (name/email -> ID, ID -> entity)
+    resolver_cache_ttl: float = 300.0
+    resolver_cache_negative_ttl: float = 30.0
+    resolver_cache_max_entries: int = 5000
+
+    # Restaurant name index (local fuzzy name resolution)
+    restaurant_index_enabled: bool = True
+    restaurant_index_refresh_interval: float = 300.0
+    restaurant_index_min_confidence: float = 0.6
+    restaurant_index_page_size: int = 100
+
+    # Section index (per-restaurant section name lookup)
+    section_index_ttl: float = 120.0
+    section_index_max_restaurants: int = 500
+
+    # Payment microservice configuration
+    payment_ms_url: str = "http://localhost:8003"
+    payment_ms_timeout: float = 30.0
+    payment_ms_max_connections: int = 50
+    payment_ms_max_keepalive_connections: int = 10
+    payment_ms_keepalive_expiry: float = 30.0
+    payment_ms_http2: bool = False
 
     # MCP Gateway configuration (HTTP/SSE transport)
     mcp_gateway_host: str = "0.0.0.0"
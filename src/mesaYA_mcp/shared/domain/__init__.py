@@ -3,11 +3,21 @@
 from mesaYA_mcp.shared.domain.access_level import AccessLevel
 from mesaYA_mcp.shared.domain.access_level_hierarchy import ACCESS_LEVEL_HIERARCHY
 from mesaYA_mcp.shared.domain.authorization_error import AuthorizationError
+from mesaYA_mcp.shared.domain.deadline_exceeded_error import DeadlineExceededError
+from mesaYA_mcp.shared.domain.deadline_scope import deadline_scope
+from mesaYA_mcp.shared.domain.entity_lookup_error import EntityLookupError
+from mesaYA_mcp.shared.domain.entity_not_found_error import EntityNotFoundError
+from mesaYA_mcp.shared.domain.field_projections_map import (
+    FIELD_PROJECTIONS,
+    NESTED_ENTITIES,
+)
 from mesaYA_mcp.shared.domain.get_current_context import get_current_context
+from mesaYA_mcp.shared.domain.get_remaining_time import get_remaining_time
 from mesaYA_mcp.shared.domain.get_required_access_level import (
     get_required_access_level,
 )
 from mesaYA_mcp.shared.domain.has_access import has_access
+from mesaYA_mcp.shared.domain.output_format import OutputFormat
 from mesaYA_mcp.shared.domain.reset_context import reset_context
 from mesaYA_mcp.shared.domain.set_current_context import set_current_context
 from mesaYA_mcp.shared.domain.tool_context_model import ToolContext
@@ -20,11 +30,23 @@ __all__ = [
     "has_access",
     # Authorization error
     "AuthorizationError",
+    # Entity resolution errors
+    "EntityLookupError",
+    "EntityNotFoundError",
+    # Field projections
+    "FIELD_PROJECTIONS",
+    "NESTED_ENTITIES",
+    # Output format
+    "OutputFormat",
     # Tool context
     "ToolContext",
     "get_current_context",
     "set_current_context",
     "reset_context",
+    # Tool deadline
+    "deadline_scope",
+    "get_remaining_time",
+    "DeadlineExceededError",
     # Tool permissions
     "TOOL_PERMISSIONS",
     "get_required_access_level",
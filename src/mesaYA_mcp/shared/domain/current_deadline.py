@@ -0,0 +1,14 @@
+"""Current deadline variable.
+
+Context variable holding the absolute deadline of the current tool call.
+"""
+
+from contextvars import ContextVar
+from typing import Optional
+
+
+# Absolute time.monotonic() value, or None when the call has no deadline
+_current_deadline: ContextVar[Optional[float]] = ContextVar(
+    "tool_deadline",
+    default=None,
+)
@@ -0,0 +1,17 @@
+"""Deadline exceeded exception.
+
+Raised when there is no latency budget left for an operation.
+"""
+
+
+class DeadlineExceededError(Exception):
+    """Raised when an operation would start after the call deadline."""
+
+    def __init__(self, operation: str) -> None:
+        """Initialize deadline exceeded error.
+
+        Args:
+            operation: Description of the operation that was skipped.
+        """
+        self.operation = operation
+        super().__init__(f"Deadline exceeded before {operation}.")
@@ -0,0 +1,35 @@
+"""Deadline scope context manager.
+
+Runs a block of code under a latency budget.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from mesaYA_mcp.shared.domain.current_deadline import _current_deadline
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[float]:
+    """Set a deadline for the enclosed block and everything it awaits.
+
+    Nested scopes can only shorten the deadline, never extend it. Tasks
+    created inside the block inherit the deadline.
+
+    Args:
+        seconds: Latency budget in seconds from now.
+
+    Yields:
+        The effective absolute deadline (``time.monotonic()`` based).
+    """
+    deadline = time.monotonic() + seconds
+    outer = _current_deadline.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,22 @@
+"""Entity lookup exception.
+
+Raised when an identifier cannot be resolved because the backend lookup
+failed, as opposed to the entity not existing.
+"""
+
+
+class EntityLookupError(Exception):
+    """Raised when the backend could not be asked whether an entity exists."""
+
+    def __init__(self, entity_type: str, identifier: str) -> None:
+        """Initialize entity lookup error.
+
+        Args:
+            entity_type: Type of entity that was looked up (e.g., "section").
+            identifier: Identifier whose lookup failed.
+        """
+        self.entity_type = entity_type
+        self.identifier = identifier
+        super().__init__(
+            f"Unable to look up {entity_type} '{identifier}'. Service unavailable."
+        )
@@ -0,0 +1,19 @@
+"""Entity not found exception.
+
+Raised when a user-friendly identifier cannot be resolved to an entity.
+"""
+
+
+class EntityNotFoundError(Exception):
+    """Raised when an entity identifier does not resolve to an entity."""
+
+    def __init__(self, entity_type: str, identifier: str) -> None:
+        """Initialize entity not found error.
+
+        Args:
+            entity_type: Type of entity that was looked up (e.g., "restaurant").
+            identifier: Identifier that could not be resolved.
+        """
+        self.entity_type = entity_type
+        self.identifier = identifier
+        super().__init__(f"{entity_type.capitalize()} '{identifier}' not found.")
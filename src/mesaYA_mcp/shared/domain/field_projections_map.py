@@ -0,0 +1,48 @@
+"""Field projections constants.
+
+``FIELD_PROJECTIONS`` maps each entity type to the backend fields dropped
+from its default view: timestamps, internal IDs and image metadata the
+agent never uses. Every other field is kept, so fields the backend adds
+later reach the agent without a change here.
+
+``NESTED_ENTITIES`` maps an entity type's fields that hold nested
+entities to their entity type, so they are projected with that type's
+own view.
+"""
+
+_NOISE_FIELDS = frozenset(
+    {
+        "createdAt",
+        "updatedAt",
+        "deletedAt",
+        "createdBy",
+        "updatedBy",
+        "version",
+    }
+)
+
+_IMAGE_METADATA_FIELDS = frozenset(
+    {
+        "imageId",
+        "imageKey",
+        "imageMetadata",
+        "imageWidth",
+        "imageHeight",
+        "imageMimeType",
+    }
+)
+
+
+FIELD_PROJECTIONS: dict[str, frozenset[str]] = {
+    "restaurant": _NOISE_FIELDS
+    | _IMAGE_METADATA_FIELDS
+    | {"ownerId", "subscriptionId", "logoId", "logoMetadata"},
+    "menu": _NOISE_FIELDS | {"restaurantId"},
+    "dish": _NOISE_FIELDS | _IMAGE_METADATA_FIELDS | {"menuId", "restaurantId"},
+    "user": _NOISE_FIELDS
+    | {"passwordHash", "refreshToken", "lastLoginIp", "avatarId", "avatarMetadata"},
+}
+
+NESTED_ENTITIES: dict[str, dict[str, str]] = {
+    "menu": {"dishes": "dish"},
+}
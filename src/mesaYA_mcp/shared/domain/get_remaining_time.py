@@ -0,0 +1,22 @@
+"""Get remaining time function.
+
+Reads the latency budget left in the current tool call.
+"""
+
+import time
+from typing import Optional
+
+from mesaYA_mcp.shared.domain.current_deadline import _current_deadline
+
+
+def get_remaining_time() -> Optional[float]:
+    """Get the seconds left before the current deadline.
+
+    Returns:
+        Remaining seconds (negative once expired), or None if no deadline
+        is set.
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
@@ -0,0 +1,20 @@
+"""OutputFormat enum - Response encoding formats.
+
+Defines the formats tool responses can be encoded in.
+"""
+
+from enum import StrEnum
+
+
+class OutputFormat(StrEnum):
+    """Response encoding formats selectable per session.
+
+    Formats:
+    - TOON: Token-efficient text for LLM agents (default)
+    - JSON: Compact JSON for programmatic consumers
+    - COLUMNAR: Compact JSON with uniform lists as column/row tables
+    """
+
+    TOON = "toon"
+    JSON = "json"
+    COLUMNAR = "columnar"
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from mesaYA_mcp.shared.domain.access_level import AccessLevel
+from mesaYA_mcp.shared.domain.output_format import OutputFormat
 
 
 @dataclass(frozen=True)
@@ -20,9 +21,12 @@ class ToolContext:
         user_id: Optional user ID for user-specific queries.
         user_email: Optional user email for reservation lookups.
         restaurant_id: Optional restaurant ID for owner-specific queries.
+        output_format: Optional response format; the configured default
+            is used if not set.
     """
 
     access_level: AccessLevel = AccessLevel.GUEST
     user_id: Optional[str] = None
     user_email: Optional[str] = None
     restaurant_id: Optional[str] = None
+    output_format: Optional[OutputFormat] = None
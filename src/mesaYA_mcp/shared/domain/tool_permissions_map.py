@@ -29,12 +29,14 @@ TOOL_PERMISSIONS: dict[str, AccessLevel] = {
     "get_menu": AccessLevel.GUEST,
     "list_menus": AccessLevel.GUEST,
     "get_dish": AccessLevel.GUEST,
+    "get_dishes_bulk": AccessLevel.GUEST,
     "search_dishes": AccessLevel.GUEST,
     # ============================================
     # RESERVATION TOOLS - User level and above
     # ============================================
     "create_reservation": AccessLevel.USER,
     "get_reservation": AccessLevel.USER,
+    "get_reservations_bulk": AccessLevel.USER,
     "cancel_reservation": AccessLevel.USER,
     "list_reservations": AccessLevel.USER,
     # ============================================
@@ -53,5 +55,6 @@ TOOL_PERMISSIONS: dict[str, AccessLevel] = {
     "list_users": AccessLevel.ADMIN,
     "get_user_by_email": AccessLevel.ADMIN,
     "get_user": AccessLevel.ADMIN,
+    "get_users_bulk": AccessLevel.ADMIN,
     "get_user_analytics": AccessLevel.ADMIN,
 }
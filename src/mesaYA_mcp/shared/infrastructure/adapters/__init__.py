@@ -2,5 +2,9 @@
 
 from mesaYA_mcp.shared.infrastructure.adapters.logger_adapter import LoggerAdapter
 from mesaYA_mcp.shared.infrastructure.adapters.http_client import HttpClient
+from mesaYA_mcp.shared.infrastructure.adapters.payment_client import PaymentClient
+from mesaYA_mcp.shared.infrastructure.adapters.circuit_open_error import (
+    CircuitOpenError,
+)
 
-__all__ = ["LoggerAdapter", "HttpClient"]
+__all__ = ["LoggerAdapter", "HttpClient", "PaymentClient", "CircuitOpenError"]
@@ -0,0 +1,174 @@
+"""Circuit breaker - Fail fast while an upstream is unhealthy.
+
+Tracks the outcome of recent calls to one upstream. When the failure rate
+over the window crosses the threshold the circuit opens and calls are
+rejected immediately; after a cool-down a limited number of trial calls
+decide whether it closes again.
+"""
+
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from mesaYA_mcp.shared.core import get_logger
+from mesaYA_mcp.shared.infrastructure.adapters.circuit_open_error import (
+    CircuitOpenError,
+)
+
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit breaker for one upstream.
+
+    Transport errors and 5xx responses count as failures; any other
+    response counts as a success, since the upstream answered.
+
+    Attributes:
+        name: Upstream name, used in logs, errors and health output.
+        state: Current state ("closed", "open" or "half_open").
+        rejected: Calls rejected while open or half-open.
+        opened: Number of times the circuit opened.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float,
+        window_size: int,
+        minimum_calls: int,
+        open_duration: float,
+        half_open_max_calls: int,
+    ) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            name: Upstream name.
+            failure_rate: Failure ratio (0-1) over the window that opens
+                the circuit.
+            window_size: Number of most recent calls considered.
+            minimum_calls: Calls needed in the window before the rate is
+                evaluated.
+            open_duration: Seconds to stay open before allowing trials.
+            half_open_max_calls: Concurrent trial calls while half-open.
+        """
+        self.name = name
+        self._failure_rate = failure_rate
+        self._minimum_calls = minimum_calls
+        self._open_duration = open_duration
+        self._half_open_max_calls = half_open_max_calls
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._trials = 0
+        self.state = self.CLOSED
+        self.rejected = 0
+        self.opened = 0
+
+    def _before_call(self) -> None:
+        """Admit a call or reject it with CircuitOpenError."""
+        if self.state == self.OPEN:
+            retry_in = self._opened_at + self._open_duration - time.monotonic()
+            if retry_in > 0:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, retry_in)
+            self.state = self.HALF_OPEN
+            self._trials = 0
+            get_logger().info(
+                "Circuit half-open, allowing trial calls",
+                context="CircuitBreaker",
+                upstream=self.name,
+            )
+
+        if self.state == self.HALF_OPEN:
+            if self._trials >= self._half_open_max_calls:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, 0.0)
+            self._trials += 1
+
+    def _record(self, failed: bool) -> None:
+        """Record a call outcome and update the state."""
+        if self.state == self.HALF_OPEN:
+            self._trials -= 1
+            if failed:
+                self._open()
+            else:
+                self._close()
+            return
+
+        self._outcomes.append(failed)
+        if (
+            self.state == self.CLOSED
+            and len(self._outcomes) >= self._minimum_calls
+            and sum(self._outcomes) / len(self._outcomes) >= self._failure_rate
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        """Trip the circuit."""
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self.opened += 1
+        get_logger().warn(
+            "Circuit opened, failing fast",
+            context="CircuitBreaker",
+            upstream=self.name,
+            open_duration=self._open_duration,
+        )
+
+    def _close(self) -> None:
+        """Close the circuit and start a fresh window."""
+        self.state = self.CLOSED
+        self._outcomes.clear()
+        get_logger().info(
+            "Circuit closed, upstream recovered",
+            context="CircuitBreaker",
+            upstream=self.name,
+        )
+
+    async def call(
+        self, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Send a request through the breaker.
+
+        Args:
+            send: Coroutine function sending the request.
+
+        Returns:
+            The HTTP response.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+            httpx.RequestError: On transport errors.
+        """
+        self._before_call()
+        try:
+            response = await send()
+        except httpx.RequestError:
+            self._record(failed=True)
+            raise
+        except BaseException:
+            # Cancelled or unexpected: release a trial slot without a verdict
+            if self.state == self.HALF_OPEN:
+                self._trials -= 1
+            raise
+        self._record(failed=response.status_code >= 500)
+        return response
+
+    def stats(self) -> dict[str, Any]:
+        """Get breaker state and counters.
+
+        Returns:
+            Dict with state, window failure rate, opened and rejected counts.
+        """
+        rate = sum(self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+        return {
+            "state": self.state,
+            "failure_rate": round(rate, 3),
+            "window_calls": len(self._outcomes),
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,21 @@
+"""Circuit open error exception.
+
+Raised instead of calling an upstream whose circuit breaker is open.
+"""
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected by an open circuit breaker."""
+
+    def __init__(self, upstream: str, retry_in: float) -> None:
+        """Initialize circuit open error.
+
+        Args:
+            upstream: Name of the upstream whose circuit is open.
+            retry_in: Seconds until the breaker lets a trial call through.
+        """
+        self.upstream = upstream
+        self.retry_in = retry_in
+        super().__init__(
+            f"Circuit for '{upstream}' is open; retry in {retry_in:.1f}s."
+        )
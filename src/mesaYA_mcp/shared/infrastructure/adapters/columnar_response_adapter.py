@@ -0,0 +1,50 @@
+"""Columnar Response Adapter - Maps responses to column-oriented JSON.
+
+Like the JSON adapter, but every list of objects that share the same
+fields is written as ``{"columns": [...], "rows": [[...], ...]}``, so
+field names appear once per list instead of once per row. Suits
+consumers that load lists into tables (dashboards, data frames).
+"""
+
+from typing import Any
+
+from mesaYA_mcp.shared.infrastructure.adapters.json_response_adapter import (
+    JsonResponseAdapter,
+)
+
+
+def _to_columns(value: Any) -> Any:
+    """Rewrite uniform lists of objects in a value as column/row tables."""
+    if isinstance(value, list):
+        if value and all(isinstance(item, dict) for item in value):
+            columns = list(value[0])
+            if all(
+                len(item) == len(columns) and all(c in item for c in columns)
+                for item in value[1:]
+            ):
+                return {
+                    "columns": columns,
+                    "rows": [
+                        [_to_columns(item[column]) for column in columns]
+                        for item in value
+                    ],
+                }
+        return [_to_columns(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_columns(item) for key, item in value.items()}
+    return value
+
+
+class ColumnarResponseAdapter(JsonResponseAdapter):
+    """Adapter that maps responses to column-oriented compact JSON.
+
+    Only the ``data`` payload is rewritten; envelope fields are the same
+    as in the JSON format. Lists whose objects have different fields stay
+    lists of objects.
+    """
+
+    def _encode(self, envelope: dict[str, Any]) -> str:
+        """Encode a response envelope as columnar compact JSON."""
+        if "data" in envelope:
+            envelope = {**envelope, "data": _to_columns(envelope["data"])}
+        return super()._encode(envelope)
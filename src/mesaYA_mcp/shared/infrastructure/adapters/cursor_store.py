@@ -0,0 +1,155 @@
+"""Cursor store - Server-side remainder of truncated list responses.
+
+When a list response is cut to fit the response budget, the full list is
+kept here under a random id, and the response carries a continuation
+cursor (``<id>.<offset>``) the agent passes back to the same tool to get
+the next slice without re-querying the backend. A cursor only resolves
+for the identity it was issued to, so a leaked cursor does not expose
+one user's results to another.
+"""
+
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+
+@dataclass
+class CursorEntry:
+    """A list response being served in slices.
+
+    Attributes:
+        rows: Full list of rows, already projected.
+        entity_type: Entity type of the original response.
+        operation: Operation of the original response.
+        count: Total count reported by the original response.
+        owner: Identity the cursor was issued to.
+        expires_at: Monotonic time after which cursors stop working.
+    """
+
+    rows: list[Any]
+    entity_type: str
+    operation: str
+    count: int | None
+    owner: Hashable
+    expires_at: float
+
+
+class CursorStore:
+    """TTL + LRU store of truncated list responses.
+
+    Cursors are immutable (id plus offset), so passing the same cursor
+    twice returns the same slice.
+
+    Attributes:
+        _ttl: Seconds a stored list stays available.
+        _max_entries: Maximum number of stored lists.
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        """Initialize the store.
+
+        Args:
+            ttl: Seconds a stored list stays available.
+            max_entries: Maximum number of stored lists.
+        """
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CursorEntry] = OrderedDict()
+        self.saved = 0
+        self.resumed = 0
+        self.expired = 0
+        self.rejected = 0
+
+    @staticmethod
+    def new_id() -> str:
+        """Generate an unguessable id for a list about to be stored."""
+        return secrets.token_urlsafe(12)
+
+    @staticmethod
+    def cursor(cursor_id: str, offset: int) -> str:
+        """Build the cursor for the slice starting at ``offset``."""
+        return f"{cursor_id}.{offset}"
+
+    def save(
+        self,
+        cursor_id: str,
+        rows: list[Any],
+        entity_type: str,
+        operation: str,
+        count: int | None,
+        owner: Hashable,
+    ) -> None:
+        """Store a list so its cursors can be resumed.
+
+        Args:
+            cursor_id: Id from ``new_id`` used in the issued cursor.
+            rows: Full list of rows.
+            entity_type: Entity type of the response.
+            operation: Operation of the response.
+            count: Total count reported by the response.
+            owner: Identity of the caller the cursor is issued to.
+        """
+        self._entries[cursor_id] = CursorEntry(
+            rows, entity_type, operation, count, owner, time.monotonic() + self._ttl
+        )
+        self._entries.move_to_end(cursor_id)
+        self.saved += 1
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def resolve(
+        self,
+        cursor: str,
+        entity_type: str,
+        operation: str,
+        owner: Hashable,
+    ) -> tuple[str, CursorEntry, int] | None:
+        """Look up the stored list and offset a cursor points to.
+
+        Args:
+            cursor: Cursor issued in a truncated response.
+            entity_type: Entity type the resuming tool returns.
+            operation: Operation the resuming tool performs.
+            owner: Identity of the caller resuming the cursor.
+
+        Returns:
+            Tuple of (cursor id, entry, offset), or None if the cursor is
+            malformed, unknown, expired, issued for another
+            entity/operation or issued to another identity.
+        """
+        cursor_id, _, offset = cursor.strip().rpartition(".")
+        entry = self._entries.get(cursor_id)
+        if entry is None or not offset.isdigit():
+            return None
+        if entry.entity_type != entity_type or entry.operation != operation:
+            return None
+        if entry.owner != owner:
+            self.rejected += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[cursor_id]
+            self.expired += 1
+            return None
+        if int(offset) >= len(entry.rows):
+            return None
+
+        self._entries.move_to_end(cursor_id)
+        self.resumed += 1
+        return cursor_id, entry, int(offset)
+
+    def stats(self) -> dict[str, int]:
+        """Get store counters.
+
+        Returns:
+            Dict with stored lists, saves, resumptions, expirations and
+            cursors rejected for another identity.
+        """
+        return {
+            "entries": len(self._entries),
+            "saved": self.saved,
+            "resumed": self.resumed,
+            "expired": self.expired,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,110 @@
+"""Encoded output cache - Reuse TOON documents for unchanged data.
+
+Keys each encoded success envelope by entity type, operation, count and
+a digest of the data's JSON serialization, so repeated reads of the same
+unchanged entity (e.g. a popular restaurant's menu) skip the TOON encode.
+Serializing with a fast JSON encoder and hashing costs a fraction of
+encoding, and the digest changes whenever the data does.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from mesaYA_mcp.shared.infrastructure.adapters.json_encoder import dumps_bytes
+
+
+class EncodedOutputCache:
+    """LRU cache of encoded response documents keyed by content digest.
+
+    Key order is part of the serialization, so two payloads share a digest
+    only if they encode to the same document.
+
+    Attributes:
+        _max_entries: Maximum number of cached documents.
+        _max_chars: Maximum total length of cached documents.
+    """
+
+    def __init__(self, max_entries: int, max_chars: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached documents.
+            max_chars: Maximum total length of cached documents.
+        """
+        self._max_entries = max_entries
+        self._max_chars = max_chars
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._chars = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key_for(self, data: Any, *scope: Hashable) -> Hashable | None:
+        """Build the cache key for a payload.
+
+        Args:
+            data: Payload about to be encoded.
+            *scope: Other envelope values the document depends on
+                (entity type, operation, count).
+
+        Returns:
+            Hashable key, or None if the payload cannot be serialized.
+        """
+        try:
+            serialized = dumps_bytes(data)
+        except (TypeError, ValueError):
+            return None
+        return (*scope, hashlib.blake2b(serialized, digest_size=16).digest())
+
+    def get(self, key: Hashable) -> str | None:
+        """Get a cached document and mark it as recently used.
+
+        Args:
+            key: Key from ``key_for``.
+
+        Returns:
+            The encoded document, or None on a miss.
+        """
+        document = self._entries.get(key)
+        if document is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return document
+
+    def set(self, key: Hashable, document: str) -> None:
+        """Store an encoded document if it fits the budget.
+
+        Args:
+            key: Key from ``key_for``.
+            document: Encoded document.
+        """
+        if len(document) > self._max_chars:
+            return
+        if key in self._entries:
+            self._chars -= len(self._entries.pop(key))
+        self._entries[key] = document
+        self._chars += len(document)
+
+        while len(self._entries) > self._max_entries or self._chars > self._max_chars:
+            _, oldest = self._entries.popitem(last=False)
+            self._chars -= len(oldest)
+            self.evictions += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Dict with entries, size, hits, misses, hit rate and evictions.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "chars": self._chars,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,323 @@
+"""Envelope Response Adapter - Format-independent response mapping.
+
+Builds the response envelopes shared by every output format (status,
+entity, operation, count, data) and applies the encoded output cache and
+the list page budget. Subclasses only choose how an envelope is encoded.
+"""
+
+from abc import abstractmethod
+from typing import Any, AsyncIterable, AsyncIterator
+
+from mesaYA_mcp.shared.application.ports.response_port import ResponsePort
+from mesaYA_mcp.shared.domain.get_current_context import get_current_context
+from mesaYA_mcp.shared.infrastructure.adapters.cursor_store import CursorStore
+from mesaYA_mcp.shared.infrastructure.adapters.encoded_output_cache import (
+    EncodedOutputCache,
+)
+
+
+class EnvelopeResponseAdapter(ResponsePort):
+    """Base adapter mapping responses to envelopes in some text format.
+
+    Success documents are cached by a digest of their data, so repeated
+    reads of unchanged data skip the encode step.
+
+    List pages (``map_page``) are held to a row and byte budget: rows past
+    the budget are kept in the cursor store and the response carries a
+    ``next_cursor`` that ``map_continuation`` resolves to the next slice.
+    The stored rows are not encoded, so adapters for different formats can
+    share one cursor store. Cursors are bound to the caller's identity
+    (access level, user, email and restaurant of the tool context), not to
+    its output format.
+
+    Attributes:
+        _cache: Encoded output cache, or None if disabled.
+        _cursors: Store of truncated lists, or None if pages are unbounded.
+        _max_rows: Maximum rows per page (0 for no row limit).
+        _max_bytes: Maximum UTF-8 size of a page (0 for no size limit).
+    """
+
+    def __init__(
+        self,
+        cache: EncodedOutputCache | None = None,
+        cursors: CursorStore | None = None,
+        max_rows: int = 0,
+        max_bytes: int = 0,
+    ) -> None:
+        """Initialize the adapter.
+
+        Args:
+            cache: Optional cache for encoded success documents.
+            cursors: Optional cursor store; enables the page budget.
+            max_rows: Maximum rows per page (0 for no row limit).
+            max_bytes: Maximum UTF-8 size of a page (0 for no size limit).
+        """
+        self._cache = cache
+        self._cursors = cursors
+        self._max_rows = max_rows
+        self._max_bytes = max_bytes
+
+    @abstractmethod
+    def _encode(self, envelope: dict[str, Any]) -> str:
+        """Encode a response envelope in the adapter's format."""
+        pass
+
+    @staticmethod
+    def _head(
+        entity_type: str,
+        operation: str,
+        count: int | None = None,
+    ) -> dict[str, Any]:
+        """Build the envelope fields that precede a success payload."""
+        head: dict[str, Any] = {
+            "status": "success",
+            "entity": entity_type,
+            "operation": operation,
+        }
+        if count is not None:
+            head["count"] = count
+        return head
+
+    def map_success(
+        self,
+        data: Any,
+        entity_type: str,
+        operation: str,
+        count: int | None = None,
+    ) -> str:
+        """Map successful response to the adapter's format.
+
+        Creates a consistent envelope structure:
+        - status: success
+        - entity: entity type
+        - operation: operation performed
+        - count: number of items (for lists)
+        - data: the actual data
+        """
+        key = None
+        if self._cache is not None:
+            key = self._cache.key_for(data, entity_type, operation, count)
+            if key is not None:
+                document = self._cache.get(key)
+                if document is not None:
+                    return document
+
+        envelope = self._head(entity_type, operation, count)
+        envelope["data"] = data
+
+        document = self._encode(envelope)
+        if key is not None:
+            self._cache.set(key, document)
+        return document
+
+    def map_page(
+        self,
+        data: list[Any],
+        entity_type: str,
+        operation: str,
+        count: int | None = None,
+    ) -> str:
+        """Map a list response within the page budget.
+
+        A list that fits is mapped exactly like ``map_success``. Otherwise
+        the leading rows that fit are returned with ``returned`` and
+        ``next_cursor`` fields, and the full list is kept for
+        ``map_continuation``.
+        """
+        if self._cursors is None:
+            return self.map_success(data, entity_type, operation, count)
+
+        if not self._max_rows or len(data) <= self._max_rows:
+            document = self.map_success(data, entity_type, operation, count)
+            if self._fits(document):
+                return document
+
+        cursor_id = self._cursors.new_id()
+        document, end = self._encode_slice(
+            data, 0, entity_type, operation, count, cursor_id
+        )
+        if end < len(data):
+            self._cursors.save(
+                cursor_id, data, entity_type, operation, count, self._cursor_owner()
+            )
+        return document
+
+    def map_continuation(
+        self,
+        cursor: str,
+        entity_type: str,
+        operation: str,
+    ) -> str:
+        """Map the next slice of a truncated list."""
+        resolved = None
+        if self._cursors is not None:
+            resolved = self._cursors.resolve(
+                cursor, entity_type, operation, self._cursor_owner()
+            )
+        if resolved is None:
+            return self.map_error(
+                message="Cursor is invalid or expired; repeat the original query",
+                entity_type=entity_type,
+                operation=operation,
+                error_code="INVALID_CURSOR",
+            )
+
+        cursor_id, entry, offset = resolved
+        document, _ = self._encode_slice(
+            entry.rows, offset, entity_type, operation, entry.count, cursor_id
+        )
+        return document
+
+    @staticmethod
+    def _cursor_owner() -> tuple[Any, ...]:
+        """Get the identity of the current caller that cursors are bound to."""
+        context = get_current_context()
+        return (
+            context.access_level,
+            context.user_id,
+            context.user_email,
+            context.restaurant_id,
+        )
+
+    def _fits(self, document: str) -> bool:
+        """Whether a document is within the byte budget."""
+        return not self._max_bytes or len(document.encode()) <= self._max_bytes
+
+    def _encode_slice(
+        self,
+        rows: list[Any],
+        offset: int,
+        entity_type: str,
+        operation: str,
+        count: int | None,
+        cursor_id: str,
+    ) -> tuple[str, int]:
+        """Encode the longest slice from ``offset`` that fits the budget.
+
+        The slice starts at the row budget and shrinks in proportion to the
+        overshoot until the document fits, always keeping at least one row,
+        so the same rows and budget always produce the same slices.
+
+        Returns:
+            Tuple of (document, index after the last row returned).
+        """
+        end = len(rows)
+        if self._max_rows:
+            end = min(end, offset + self._max_rows)
+
+        while True:
+            envelope = self._head(
+                entity_type, operation, count if count is not None else len(rows)
+            )
+            envelope["returned"] = end - offset
+            if end < len(rows):
+                envelope["next_cursor"] = CursorStore.cursor(cursor_id, end)
+            envelope["data"] = rows[offset:end]
+
+            document = self._encode(envelope)
+            size = len(document.encode())
+            if end - offset <= 1 or not self._max_bytes or size <= self._max_bytes:
+                return document, end
+
+            shrunk = int((end - offset) * self._max_bytes / size * 0.9)
+            end = offset + max(1, min(end - offset - 1, shrunk))
+
+    async def map_stream(
+        self,
+        rows: AsyncIterable[Any],
+        entity_type: str,
+        operation: str,
+        length: int,
+        count: int | None = None,
+        columns: list[str] | None = None,
+    ) -> AsyncIterator[str]:
+        """Map a list read from an async iterator.
+
+        Collects the rows and yields the ``map_success`` document as a
+        single chunk; formats that can be written incrementally override
+        this.
+
+        Raises:
+            ValueError: If ``rows`` ends before ``length`` rows.
+        """
+        collected: list[Any] = []
+        if length > 0:
+            async for row in rows:
+                if columns is not None:
+                    row = {
+                        column: row.get(column) if isinstance(row, dict) else None
+                        for column in columns
+                    }
+                collected.append(row)
+                if len(collected) >= length:
+                    break
+        if len(collected) < length:
+            raise ValueError(
+                f"Stream declared {length} rows but ended after {len(collected)}"
+            )
+        yield self.map_success(collected, entity_type, operation, count)
+
+    def map_error(
+        self,
+        message: str,
+        entity_type: str,
+        operation: str,
+        error_code: str | None = None,
+    ) -> str:
+        """Map error response to the adapter's format."""
+        envelope = {
+            "status": "error",
+            "entity": entity_type,
+            "operation": operation,
+            "message": message,
+        }
+
+        if error_code:
+            envelope["code"] = error_code
+
+        return self._encode(envelope)
+
+    def map_not_found(
+        self,
+        entity_type: str,
+        identifier: str,
+    ) -> str:
+        """Map not found response to the adapter's format."""
+        return self._encode(
+            {
+                "status": "not_found",
+                "entity": entity_type,
+                "identifier": identifier,
+                "message": f"{entity_type} with ID '{identifier}' not found",
+            }
+        )
+
+    def map_empty(
+        self,
+        entity_type: str,
+        operation: str,
+    ) -> str:
+        """Map empty result to the adapter's format."""
+        return self._encode(
+            {
+                "status": "empty",
+                "entity": entity_type,
+                "operation": operation,
+                "count": 0,
+                "data": [],
+                "message": f"No {entity_type}s found",
+            }
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Get encoded output cache and cursor store counters.
+
+        Returns:
+            Dict with cache and cursor counters for the enabled features.
+        """
+        stats: dict[str, Any] = {}
+        if self._cache is not None:
+            stats["cache"] = self._cache.stats()
+        if self._cursors is not None:
+            stats["cursors"] = self._cursors.stats()
+        return stats
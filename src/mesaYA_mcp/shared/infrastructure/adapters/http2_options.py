@@ -0,0 +1,23 @@
+"""HTTP/2 options - Protocol settings for the opt-in HTTP/2 mode."""
+
+
+def http2_options(base_url: str, enabled: bool) -> dict[str, bool]:
+    """Get ``httpx.AsyncClient`` protocol options for an upstream.
+
+    HTTPS upstreams negotiate HTTP/2 through ALPN and fall back to
+    HTTP/1.1. Cleartext (``http://``) upstreams have no negotiation, so
+    HTTP/2 is spoken with prior knowledge (h2c) and the upstream must
+    support it. Requires the ``h2`` package (``httpx[http2]``).
+
+    Args:
+        base_url: Base URL of the upstream.
+        enabled: Whether HTTP/2 is enabled for the upstream.
+
+    Returns:
+        Keyword arguments for ``httpx.AsyncClient``.
+    """
+    if not enabled:
+        return {}
+    if base_url.startswith("http://"):
+        return {"http1": False, "http2": True}
+    return {"http2": True}
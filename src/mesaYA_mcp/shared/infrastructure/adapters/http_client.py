@@ -4,12 +4,31 @@ This adapter provides HTTP communication with the NestJS REST API backend,
 handling all network operations for the MCP tools.
 """
 
+import asyncio
 import json
-from typing import Any
+from typing import Any, Sequence
 
 import httpx
 
 from mesaYA_mcp.shared.core import get_logger, get_settings
+from mesaYA_mcp.shared.domain import DeadlineExceededError
+from mesaYA_mcp.shared.infrastructure.adapters.circuit_breaker import CircuitBreaker
+from mesaYA_mcp.shared.infrastructure.adapters.circuit_open_error import (
+    CircuitOpenError,
+)
+from mesaYA_mcp.shared.infrastructure.adapters.http2_options import http2_options
+from mesaYA_mcp.shared.infrastructure.adapters.json_decoder import JsonDecoder
+from mesaYA_mcp.shared.infrastructure.adapters.page_iterator import PageIterator
+from mesaYA_mcp.shared.infrastructure.adapters.request_hedger import RequestHedger
+from mesaYA_mcp.shared.infrastructure.adapters.response_cache import ResponseCache
+from mesaYA_mcp.shared.infrastructure.adapters.retry_policy import RetryPolicy
+from mesaYA_mcp.shared.infrastructure.adapters.single_flight import SingleFlight
+from mesaYA_mcp.shared.infrastructure.adapters.timeout_profiles import (
+    TimeoutProfiles,
+)
+
+# Marks a 404 from ``_fetch`` so ``get`` can tell it apart from a failure
+_NOT_FOUND = object()
 
 
 class HttpClient:
@@ -18,10 +37,25 @@ class HttpClient:
     Provides async HTTP methods with built-in error handling,
     logging, and configuration from settings.
 
+    A single ``httpx.AsyncClient`` is kept open for the lifetime of the
+    server so connections are pooled and kept alive between tool calls.
+
     Attributes:
         _base_url: Base URL of the REST API.
-        _timeout: Request timeout in seconds.
+        _timeout: Default request timeout in seconds.
+        _timeouts: Per-route timeout profiles, capped by the call deadline.
         _headers: Default headers for all requests.
+        _limits: Connection pool limits for the shared client.
+        _http2: Whether to talk HTTP/2 to the backend.
+        _decoder: JSON decoder for response bodies.
+        _page_size: Items requested per page by ``paginate``.
+        _bulk_concurrency: Concurrent requests per ``get_many`` call.
+        _client: Shared AsyncClient, created lazily and reused.
+        _single_flight: Coalesces identical concurrent GET requests.
+        _cache: TTL + LRU cache for read-only GET responses, or None.
+        _retry: Retry policy for idempotent requests.
+        _breaker: Circuit breaker for the backend, checked on every attempt.
+        _hedger: Hedges slow GETs on latency-sensitive routes.
     """
 
     def __init__(
@@ -40,38 +74,149 @@ class HttpClient:
         settings = get_settings()
         self._base_url = (base_url or settings.backend_api_url).rstrip("/")
         self._timeout = timeout or settings.backend_api_timeout
+        self._timeouts = TimeoutProfiles(
+            self._timeout, settings.backend_timeout_profiles
+        )
         self._headers: dict[str, str] = {
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
         if api_key or settings.backend_api_key:
             self._headers["X-API-Key"] = api_key or settings.backend_api_key
+        self._limits = httpx.Limits(
+            max_connections=settings.backend_api_max_connections,
+            max_keepalive_connections=settings.backend_api_max_keepalive_connections,
+            keepalive_expiry=settings.backend_api_keepalive_expiry,
+        )
+        self._http2 = settings.backend_api_http2
+        self._decoder = JsonDecoder(settings.json_decoder)
+        self._page_size = settings.backend_page_size
+        self._bulk_concurrency = settings.backend_bulk_concurrency
+        self._client: httpx.AsyncClient | None = None
+        self._coalesce_gets = settings.backend_coalesce_gets
+        self._single_flight = SingleFlight()
+        self._cache = (
+            ResponseCache(
+                ttls=settings.backend_cache_ttls,
+                max_entries=settings.backend_cache_max_entries,
+                max_bytes=settings.backend_cache_max_bytes,
+            )
+            if settings.backend_cache_enabled
+            else None
+        )
+        self._retry = RetryPolicy(
+            max_attempts=settings.backend_retry_max_attempts,
+            base_delay=settings.backend_retry_base_delay,
+            max_delay=settings.backend_retry_max_delay,
+            deadline=settings.backend_retry_deadline,
+            retry_statuses=set(settings.backend_retry_statuses),
+        )
+        self._breaker = CircuitBreaker(
+            name="backend",
+            failure_rate=settings.circuit_breaker_failure_rate,
+            window_size=settings.circuit_breaker_window_size,
+            minimum_calls=settings.circuit_breaker_minimum_calls,
+            open_duration=settings.circuit_breaker_open_duration,
+            half_open_max_calls=settings.circuit_breaker_half_open_max_calls,
+        )
+        self._hedger = RequestHedger(
+            prefixes=settings.backend_hedge_paths,
+            percentile=settings.backend_hedge_percentile,
+            min_delay=settings.backend_hedge_min_delay,
+            max_ratio=settings.backend_hedge_max_ratio,
+            min_samples=settings.backend_hedge_min_samples,
+        )
 
     def _get_client(self) -> httpx.AsyncClient:
-        """Create a new async HTTP client instance.
+        """Get the shared async HTTP client, creating it if needed.
 
         Returns:
-            Configured AsyncClient instance.
+            Pooled AsyncClient instance.
         """
-        return httpx.AsyncClient(
-            base_url=self._base_url,
-            timeout=self._timeout,
-            headers=self._headers,
-        )
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self._base_url,
+                timeout=self._timeout,
+                headers=self._headers,
+                limits=self._limits,
+                **http2_options(self._base_url, self._http2),
+            )
+        return self._client
+
+    async def open(self) -> None:
+        """Open the shared client ahead of the first request.
+
+        Raises:
+            ImportError: If HTTP/2 is enabled but ``h2`` is not installed.
+        """
+        self._get_client()
+
+    async def aclose(self) -> None:
+        """Close the shared client and release pooled connections."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        idempotent: bool,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request on the shared client.
+
+        Every attempt goes through the circuit breaker and uses the route's
+        timeout profile, capped by the time left in the current tool call.
+        Idempotent requests are retried on transient failures according to
+        the retry policy; others are sent exactly once. GETs on hedged
+        routes are hedged within each attempt.
+
+        Args:
+            method: HTTP method.
+            path: API endpoint path.
+            idempotent: Whether the request is safe to repeat.
+            **kwargs: Extra arguments for ``httpx.AsyncClient.request``.
+
+        Returns:
+            The (last) HTTP response.
+
+        Raises:
+            CircuitOpenError: If the backend circuit is open.
+            DeadlineExceededError: If the tool call has no time left.
+            httpx.RequestError: On transport errors after any retries.
+        """
+        client = self._get_client()
+
+        def attempt():
+            timeout = self._timeouts.for_path(path)
+            return self._breaker.call(
+                lambda: client.request(method, path, timeout=timeout, **kwargs)
+            )
+
+        if not idempotent:
+            return await attempt()
+        if method == "GET":
+            return await self._retry.run(lambda: self._hedger.run(path, attempt))
+        return await self._retry.run(attempt)
 
     async def get(
         self,
         path: str,
         params: dict[str, Any] | None = None,
-    ) -> dict[str, Any] | list[Any] | None:
+        not_found: Any = None,
+    ) -> Any:
         """Perform GET request.
 
         Args:
             path: API endpoint path.
             params: Optional query parameters.
+            not_found: Value returned when the backend answers 404, so
+                callers can tell a missing entity from a failed request.
 
         Returns:
-            JSON response data or None on error.
+            JSON response data, ``not_found`` on a 404, or None on any
+            other error.
         """
         logger = get_logger()
         logger.debug(
@@ -81,36 +226,228 @@ class HttpClient:
             params=params,
         )
 
-        async with self._get_client() as client:
-            try:
-                response = await client.get(path, params=params)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    "HTTP status error",
-                    error=str(e),
-                    context="HttpClient.get",
-                    path=path,
-                    status_code=e.response.status_code,
-                )
-                return None
-            except httpx.RequestError as e:
-                logger.error(
-                    "HTTP request failed",
-                    error=str(e),
-                    context="HttpClient.get",
-                    path=path,
-                )
-                return None
-            except json.JSONDecodeError as e:
-                logger.error(
-                    "JSON decode error",
-                    error=str(e),
-                    context="HttpClient.get",
-                    path=path,
+        key = self._request_key(path, params)
+        cache_key = None
+        if self._cache is not None and self._cache.ttl_for(path) > 0:
+            entry = self._cache.get(key)
+            if entry is not None:
+                return entry.value
+            cache_key = key
+
+        if not self._coalesce_gets:
+            data = await self._fetch(path, params, cache_key)
+        else:
+            data = await self._single_flight.do(
+                key, lambda: self._fetch(path, params, cache_key)
+            )
+        return not_found if data is _NOT_FOUND else data
+
+    def paginate(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        max_items: int | None = None,
+        page_size: int | None = None,
+    ) -> PageIterator:
+        """Walk a paginated list endpoint lazily, item by item.
+
+        Each page is a regular ``get`` (cached, coalesced, retried), and
+        the next page is prefetched while the current one is consumed.
+
+        Args:
+            path: API endpoint path.
+            params: Query parameters sent with every page (any ``limit``
+                is replaced by the page size).
+            max_items: Stop after this many items (None walks every page).
+            page_size: Items per page. Defaults to settings.
+
+        Returns:
+            Async iterator over the items; check ``failed`` afterwards.
+        """
+        return PageIterator(
+            self.get,
+            path,
+            params,
+            page_size=page_size or self._page_size,
+            max_items=max_items,
+        )
+
+    async def get_many(
+        self,
+        paths: Sequence[str],
+        max_concurrency: int | None = None,
+        not_found: Any = None,
+    ) -> dict[str, Any]:
+        """Perform GET requests for several paths concurrently.
+
+        Duplicate paths are fetched once, and at most ``max_concurrency``
+        requests are in flight so a large batch does not take over the
+        connection pool. Each request is a regular ``get`` (cached,
+        coalesced, retried).
+
+        Args:
+            paths: API endpoint paths.
+            max_concurrency: Requests in flight at once. Defaults to settings.
+            not_found: Value for paths the backend answers with 404, so
+                callers can tell a missing entity from a failed request.
+
+        Returns:
+            Each distinct path, in first-seen order, mapped to its JSON
+            response data, ``not_found`` on a 404, or None on any other
+            error.
+        """
+        unique = list(dict.fromkeys(paths))
+        semaphore = asyncio.Semaphore(max_concurrency or self._bulk_concurrency)
+
+        async def fetch(path: str) -> Any:
+            async with semaphore:
+                return await self.get(path, not_found=not_found)
+
+        results = await asyncio.gather(*(fetch(path) for path in unique))
+        return dict(zip(unique, results))
+
+    def _request_key(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+    ) -> tuple:
+        """Build the identity of a GET request for coalescing.
+
+        Args:
+            path: API endpoint path.
+            params: Optional query parameters.
+
+        Returns:
+            Hashable key of path, normalized params and auth headers.
+        """
+        normalized = tuple(
+            sorted(
+                (str(name), _normalize_param(value))
+                for name, value in (params or {}).items()
+                if value is not None
+            )
+        )
+        auth = (
+            self._headers.get("X-API-Key"),
+            self._headers.get("Authorization"),
+        )
+        return (path, normalized, auth)
+
+    async def _fetch(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        cache_key: tuple | None = None,
+    ) -> Any:
+        """Send a GET request to the backend.
+
+        Args:
+            path: API endpoint path.
+            params: Optional query parameters.
+            cache_key: Key to store the response under, if cacheable.
+                A stale cached entry with validators under this key is
+                revalidated with If-None-Match / If-Modified-Since.
+
+        Returns:
+            JSON response data, ``_NOT_FOUND`` on a 404, or None on any
+            other error.
+        """
+        logger = get_logger()
+
+        stale = self._cache.get_stale(cache_key) if cache_key is not None else None
+        headers: dict[str, str] = {}
+        if stale is not None:
+            if stale.etag:
+                headers["If-None-Match"] = stale.etag
+            if stale.last_modified:
+                headers["If-Modified-Since"] = stale.last_modified
+
+        try:
+            response = await self._send(
+                "GET", path, idempotent=True, params=params, headers=headers
+            )
+            if stale is not None and response.status_code == 304:
+                # Not modified: keep the already-decoded body
+                self._cache.refresh(cache_key, path)
+                return stale.value
+            response.raise_for_status()
+            data = self._decoder.decode(response.content)
+            if cache_key is not None:
+                self._cache.set(
+                    cache_key,
+                    path,
+                    data,
+                    len(response.content),
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
                 )
-                return None
+            return data
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.debug("HTTP not found", context="HttpClient.get", path=path)
+                return _NOT_FOUND
+            logger.error(
+                "HTTP status error",
+                error=str(e),
+                context="HttpClient.get",
+                path=path,
+                status_code=e.response.status_code,
+            )
+            return None
+        except httpx.RequestError as e:
+            logger.error(
+                "HTTP request failed",
+                error=str(e),
+                context="HttpClient.get",
+                path=path,
+            )
+            return None
+        except (CircuitOpenError, DeadlineExceededError) as e:
+            logger.warn(
+                "Backend request skipped",
+                reason=str(e),
+                context="HttpClient.get",
+                path=path,
+            )
+            return None
+        except json.JSONDecodeError as e:
+            logger.error(
+                "JSON decode error",
+                error=str(e),
+                context="HttpClient.get",
+                path=path,
+            )
+            return None
+
+    def stats(self) -> dict[str, Any]:
+        """Get request counters for monitoring.
+
+        Returns:
+            Dict with circuit breaker state and GET coalescing, retry,
+            hedging and response cache counters.
+        """
+        stats: dict[str, Any] = {
+            "circuit": self._breaker.stats(),
+            "coalescing": self._single_flight.stats(),
+            "retry": self._retry.stats(),
+            "hedging": self._hedger.stats(),
+        }
+        if self._cache is not None:
+            stats["cache"] = self._cache.stats()
+        return stats
+
+    def invalidate_cache(self, path_prefix: str) -> int:
+        """Drop cached GET responses under a path prefix.
+
+        Args:
+            path_prefix: API path prefix to invalidate.
+
+        Returns:
+            Number of cached responses removed.
+        """
+        if self._cache is None:
+            return 0
+        return self._cache.invalidate(path_prefix)
 
     async def post(
         self,
@@ -135,39 +472,51 @@ class HttpClient:
             path=path,
         )
 
-        async with self._get_client() as client:
-            try:
-                response = await client.post(path, json=data, params=params)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    "HTTP status error",
-                    error=str(e),
-                    context="HttpClient.post",
-                    path=path,
-                    status_code=e.response.status_code,
-                )
-                return None
-            except httpx.RequestError as e:
-                logger.error(
-                    "HTTP request failed",
-                    error=str(e),
-                    context="HttpClient.post",
-                    path=path,
-                )
-                return None
+        try:
+            response = await self._send(
+                "POST", path, idempotent=False, json=data, params=params
+            )
+            response.raise_for_status()
+            return self._decoder.decode(response.content)
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "HTTP status error",
+                error=str(e),
+                context="HttpClient.post",
+                path=path,
+                status_code=e.response.status_code,
+            )
+            return None
+        except httpx.RequestError as e:
+            logger.error(
+                "HTTP request failed",
+                error=str(e),
+                context="HttpClient.post",
+                path=path,
+            )
+            return None
+        except (CircuitOpenError, DeadlineExceededError) as e:
+            logger.warn(
+                "Backend request skipped",
+                reason=str(e),
+                context="HttpClient.post",
+                path=path,
+            )
+            return None
 
     async def patch(
         self,
         path: str,
         data: dict[str, Any] | None = None,
+        idempotent: bool = False,
     ) -> dict[str, Any] | None:
         """Perform PATCH request.
 
         Args:
             path: API endpoint path.
             data: Request body data.
+            idempotent: Whether repeating the request is safe, enabling
+                retries on transient failures.
 
         Returns:
             JSON response data or None on error.
@@ -179,34 +528,45 @@ class HttpClient:
             path=path,
         )
 
-        async with self._get_client() as client:
-            try:
-                response = await client.patch(path, json=data)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    "HTTP status error",
-                    error=str(e),
-                    context="HttpClient.patch",
-                    path=path,
-                    status_code=e.response.status_code,
-                )
-                return None
-            except httpx.RequestError as e:
-                logger.error(
-                    "HTTP request failed",
-                    error=str(e),
-                    context="HttpClient.patch",
-                    path=path,
-                )
-                return None
+        try:
+            response = await self._send(
+                "PATCH", path, idempotent=idempotent, json=data
+            )
+            response.raise_for_status()
+            return self._decoder.decode(response.content)
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "HTTP status error",
+                error=str(e),
+                context="HttpClient.patch",
+                path=path,
+                status_code=e.response.status_code,
+            )
+            return None
+        except httpx.RequestError as e:
+            logger.error(
+                "HTTP request failed",
+                error=str(e),
+                context="HttpClient.patch",
+                path=path,
+            )
+            return None
+        except (CircuitOpenError, DeadlineExceededError) as e:
+            logger.warn(
+                "Backend request skipped",
+                reason=str(e),
+                context="HttpClient.patch",
+                path=path,
+            )
+            return None
 
-    async def delete(self, path: str) -> bool:
+    async def delete(self, path: str, idempotent: bool = False) -> bool:
         """Perform DELETE request.
 
         Args:
             path: API endpoint path.
+            idempotent: Whether repeating the request is safe, enabling
+                retries on transient failures.
 
         Returns:
             True if successful, False otherwise.
@@ -218,25 +578,41 @@ class HttpClient:
             path=path,
         )
 
-        async with self._get_client() as client:
-            try:
-                response = await client.delete(path)
-                response.raise_for_status()
-                return True
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    "HTTP status error",
-                    error=str(e),
-                    context="HttpClient.delete",
-                    path=path,
-                    status_code=e.response.status_code,
-                )
-                return False
-            except httpx.RequestError as e:
-                logger.error(
-                    "HTTP request failed",
-                    error=str(e),
-                    context="HttpClient.delete",
-                    path=path,
-                )
-                return False
+        try:
+            response = await self._send("DELETE", path, idempotent=idempotent)
+            response.raise_for_status()
+            return True
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "HTTP status error",
+                error=str(e),
+                context="HttpClient.delete",
+                path=path,
+                status_code=e.response.status_code,
+            )
+            return False
+        except httpx.RequestError as e:
+            logger.error(
+                "HTTP request failed",
+                error=str(e),
+                context="HttpClient.delete",
+                path=path,
+            )
+            return False
+        except (CircuitOpenError, DeadlineExceededError) as e:
+            logger.warn(
+                "Backend request skipped",
+                reason=str(e),
+                context="HttpClient.delete",
+                path=path,
+            )
+            return False
+
+
+def _normalize_param(value: Any) -> str | tuple[str, ...]:
+    """Normalize a query parameter value the way httpx encodes it."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize_param(item) for item in value)
+    return str(value)
@@ -0,0 +1,92 @@
+"""JSON decoder - Pluggable fast JSON decoding for upstream responses.
+
+Decodes response bodies with orjson or msgspec when installed and falls
+back to the standard library, so large restaurant lists and menus decode
+faster and with fewer intermediate allocations.
+"""
+
+import json
+from typing import Any, Callable
+
+_BACKENDS = ("orjson", "msgspec", "stdlib")
+
+
+def _load(backend: str) -> Callable[[bytes], Any]:
+    """Import a decoding backend.
+
+    Raises:
+        ImportError: If the backend's package is not installed.
+    """
+    if backend == "orjson":
+        import orjson
+
+        # orjson.JSONDecodeError already subclasses json.JSONDecodeError
+        return orjson.loads
+
+    if backend == "msgspec":
+        import msgspec
+
+        decoder = msgspec.json.Decoder()
+
+        def decode(content: bytes) -> Any:
+            try:
+                return decoder.decode(content)
+            except msgspec.DecodeError as e:
+                raise json.JSONDecodeError(str(e), "", 0) from e
+
+        return decode
+
+    return json.loads
+
+
+class JsonDecoder:
+    """Decodes JSON bytes with the configured backend.
+
+    Every backend raises ``json.JSONDecodeError`` on invalid input, so
+    callers handle decode failures the same way regardless of backend.
+
+    Attributes:
+        name: Name of the backend in use ("orjson", "msgspec" or "stdlib").
+    """
+
+    def __init__(self, backend: str = "auto") -> None:
+        """Initialize the decoder.
+
+        Args:
+            backend: "orjson", "msgspec", "stdlib", or "auto" to use the
+                first installed of orjson, msgspec and stdlib.
+
+        Raises:
+            ValueError: If the backend name is unknown.
+            ImportError: If an explicitly requested backend is not installed.
+        """
+        if backend == "auto":
+            for candidate in _BACKENDS:
+                try:
+                    self._decode = _load(candidate)
+                except ImportError:
+                    continue
+                self.name = candidate
+                break
+        elif backend in _BACKENDS:
+            self._decode = _load(backend)
+            self.name = backend
+        else:
+            raise ValueError(
+                f"Unknown JSON decoder '{backend}', expected one of "
+                f"{', '.join(('auto',) + _BACKENDS)}"
+            )
+
+    def decode(self, content: bytes) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            content: Raw JSON bytes (e.g. ``response.content``).
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            json.JSONDecodeError: If the content is not valid JSON.
+        """
+        return self._decode(content)
@@ -0,0 +1,50 @@
+"""JSON encoder - Shared fast JSON serialization.
+
+Serializes with orjson when installed and falls back to the standard
+library, with the same output rules either way: compact separators,
+non-ASCII text kept as is, values JSON cannot represent (datetimes,
+UUIDs, decimals, exceptions) written as strings, and non-string dict
+keys converted to strings. Used for JSON responses, log lines and the
+encoded output cache's content digests.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    _OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps_bytes(data: Any) -> bytes:
+        """Serialize a value to compact UTF-8 JSON bytes.
+
+        Raises:
+            TypeError: If the value cannot be serialized.
+        """
+        return orjson.dumps(data, default=str, option=_OPTIONS)
+
+except ImportError:
+
+    def dumps_bytes(data: Any) -> bytes:
+        """Serialize a value to compact UTF-8 JSON bytes.
+
+        Raises:
+            TypeError: If the value cannot be serialized.
+            ValueError: If the value contains a circular reference.
+        """
+        return json.dumps(
+            data, default=str, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+
+
+def dumps(data: Any) -> str:
+    """Serialize a value to a compact JSON string.
+
+    Args:
+        data: Value to serialize.
+
+    Returns:
+        The JSON document.
+    """
+    return dumps_bytes(data).decode()
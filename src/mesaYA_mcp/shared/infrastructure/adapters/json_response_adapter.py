@@ -0,0 +1,25 @@
+"""JSON Response Adapter - Maps responses to compact JSON.
+
+Implements the ResponsePort interface with compact JSON (no whitespace)
+for programmatic consumers such as dashboards and other services, which
+parse the output instead of reading it and gain nothing from TOON.
+"""
+
+from typing import Any
+
+from mesaYA_mcp.shared.infrastructure.adapters.envelope_response_adapter import (
+    EnvelopeResponseAdapter,
+)
+from mesaYA_mcp.shared.infrastructure.adapters.json_encoder import dumps
+
+
+class JsonResponseAdapter(EnvelopeResponseAdapter):
+    """Adapter that maps responses to compact JSON.
+
+    Uses orjson when installed. Values JSON cannot represent (datetimes,
+    UUIDs, decimals) are written as strings.
+    """
+
+    def _encode(self, envelope: dict[str, Any]) -> str:
+        """Encode a response envelope as compact JSON."""
+        return dumps(envelope)
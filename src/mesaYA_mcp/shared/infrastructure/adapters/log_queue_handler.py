@@ -0,0 +1,115 @@
+"""Log queue handler - Non-blocking hand-off of log records.
+
+Puts log records on a bounded in-memory queue instead of writing them,
+and drains the queue into the real handler (stderr) on a background
+thread. Logging from the event loop costs a queue insert, so a slow or
+blocked stderr never stalls tool handling. When the queue is full,
+records are dropped according to the overflow policy and counted.
+"""
+
+import copy
+import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+_OVERFLOW_POLICIES = ("drop_new", "drop_old")
+
+
+class LogQueueHandler(QueueHandler):
+    """Queue handler with a bounded queue, overflow policy and counters.
+
+    Records are formatted by the target handler on the listener thread.
+    Only the message is resolved when the record is queued; ``meta`` and
+    exception info are passed by reference.
+
+    Attributes:
+        listener: Listener draining the queue, or None when stopped.
+        enqueued: Records queued so far.
+        dropped: Records dropped because the queue was full.
+    """
+
+    def __init__(self, maxsize: int, overflow: str = "drop_new") -> None:
+        """Initialize the handler.
+
+        Args:
+            maxsize: Maximum queued records.
+            overflow: What to do when the queue is full: "drop_new"
+                discards the incoming record, "drop_old" discards the
+                oldest queued record to make room.
+
+        Raises:
+            ValueError: If the overflow policy is unknown.
+        """
+        if overflow not in _OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown log queue overflow policy '{overflow}'. "
+                f"Valid: {', '.join(_OVERFLOW_POLICIES)}"
+            )
+        super().__init__(queue.Queue(maxsize))
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self.listener: QueueListener | None = None
+        self.enqueued = 0
+        self.dropped = 0
+
+    def start(self, handler: logging.Handler) -> None:
+        """Start draining the queue into a handler on a background thread.
+
+        Args:
+            handler: Handler that formats and writes the records.
+        """
+        self.listener = QueueListener(self.queue, handler, respect_handler_level=True)
+        self.listener.start()
+
+    def stop(self) -> None:
+        """Write the queued records and stop the background thread."""
+        listener, self.listener = self.listener, None
+        if listener is None:
+            return
+        while True:
+            try:
+                listener.stop()
+                return
+            except queue.Full:
+                # The stop sentinel needs a free slot; the listener is
+                # still draining, so one opens up shortly.
+                time.sleep(0.01)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve the message so later changes to its args do not leak in."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record without blocking, applying the overflow policy."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            if self._overflow == "drop_new":
+                return
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                return
+        self.enqueued += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Get queue counters.
+
+        Returns:
+            Dict with queued records, capacity, overflow policy, and
+            records queued and dropped so far.
+        """
+        return {
+            "queued": self.queue.qsize(),
+            "capacity": self._maxsize,
+            "overflow": self._overflow,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,121 @@
+"""Log sampler - Sampling and rate limiting of hot-path log lines.
+
+Decides per log context whether a record is written: a sampling rate
+keeps a fraction of records, and a token bucket caps the records per
+second with a burst allowance. Both are configured by context prefix
+(e.g. ``HttpClient`` covers ``HttpClient.get`` and ``HttpClient.post``),
+so the noisiest lines can be thinned while info logging stays on.
+Records that are dropped are counted per context.
+"""
+
+import random
+import time
+from typing import Any
+
+
+class LogSampler:
+    """Per-context log sampling and token-bucket rate limiting.
+
+    Sampling is applied first, so a rate limit caps the records that
+    survive sampling. Contexts without a matching prefix are kept.
+
+    Attributes:
+        _sample_rates: Context prefix to fraction of records kept (0-1).
+            Longest prefix wins; an empty prefix matches every context.
+        _rate_limits: Context prefix to records per second. Longest prefix
+            wins; 0 disables the limit for that prefix.
+        _burst: Records a context can log at once before the rate limit
+            applies.
+    """
+
+    def __init__(
+        self,
+        sample_rates: dict[str, float],
+        rate_limits: dict[str, float],
+        burst: int = 20,
+    ) -> None:
+        """Initialize the sampler.
+
+        Args:
+            sample_rates: Context prefix to fraction of records kept.
+            rate_limits: Context prefix to records per second.
+            burst: Bucket size of each rate-limited context.
+        """
+        self._sample_rates = sorted(
+            sample_rates.items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self._rate_limits = sorted(
+            rate_limits.items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self._burst = max(1, burst)
+        # context -> [sample rate, refill rate, tokens, last refill]
+        self._contexts: dict[str, list[float]] = {}
+        self._suppressed: dict[str, dict[str, int]] = {}
+
+    @staticmethod
+    def _match(rules: list[tuple[str, float]], context: str, default: float) -> float:
+        """Get the value of the longest prefix matching a context."""
+        for prefix, value in rules:
+            if context.startswith(prefix):
+                return value
+        return default
+
+    def _state(self, context: str) -> list[float]:
+        """Get (and on first use resolve) the sampling state of a context."""
+        state = self._contexts.get(context)
+        if state is None:
+            state = [
+                self._match(self._sample_rates, context, 1.0),
+                self._match(self._rate_limits, context, 0.0),
+                float(self._burst),
+                time.monotonic(),
+            ]
+            self._contexts[context] = state
+        return state
+
+    def allow(self, context: str | None) -> bool:
+        """Decide whether a record of a context is written.
+
+        Args:
+            context: Context of the record (None matches only the empty
+                prefix).
+
+        Returns:
+            True to write the record, False if it is sampled out or over
+            the context's rate limit.
+        """
+        context = context or ""
+        state = self._state(context)
+        sample_rate, refill_rate = state[0], state[1]
+
+        if sample_rate < 1.0 and random.random() >= sample_rate:
+            self._count(context, "sampled_out")
+            return False
+
+        if refill_rate > 0:
+            now = time.monotonic()
+            state[2] = min(self._burst, state[2] + (now - state[3]) * refill_rate)
+            state[3] = now
+            if state[2] < 1.0:
+                self._count(context, "rate_limited")
+                return False
+            state[2] -= 1.0
+
+        return True
+
+    def _count(self, context: str, reason: str) -> None:
+        """Count a suppressed record."""
+        counters = self._suppressed.setdefault(
+            context, {"sampled_out": 0, "rate_limited": 0}
+        )
+        counters[reason] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Get suppressed record counters.
+
+        Returns:
+            Dict of context to records sampled out and rate limited.
+        """
+        return {
+            context: dict(counters) for context, counters in self._suppressed.items()
+        }
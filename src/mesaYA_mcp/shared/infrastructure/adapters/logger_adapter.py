@@ -2,21 +2,48 @@
 
 This adapter implements the LoggerPort interface using Python's built-in
 logging module, providing structured logging with context and metadata.
+Records are handed to a background thread through a bounded queue, so
+writing to stderr never blocks the event loop. Disabled levels return
+before any record or metadata is built, and hot-path contexts can be
+sampled and rate limited.
 """
 
-import json
+import atexit
 import logging
 import sys
-from typing import Any
+from typing import Any, Callable
 
 from mesaYA_mcp.shared.application.ports.logger_port import LoggerPort
+from mesaYA_mcp.shared.core.settings import Settings
+from mesaYA_mcp.shared.infrastructure.adapters.json_encoder import dumps
+from mesaYA_mcp.shared.infrastructure.adapters.log_queue_handler import (
+    LogQueueHandler,
+)
+from mesaYA_mcp.shared.infrastructure.adapters.log_sampler import LogSampler
+
+_LEVELS = {
+    "verbose": logging.DEBUG,
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+
+def _evaluate(value: Callable[[], Any]) -> Any:
+    """Call a lazy metadata value, never letting it break the log call."""
+    try:
+        return value()
+    except Exception as e:
+        return f"<error: {e!r}>"
 
 
 class LoggerAdapter(LoggerPort):
     """Logging adapter using Python's logging module.
 
     Provides structured JSON logging suitable for production environments
-    and MCP server output via stderr.
+    and MCP server output via stderr. JSON lines are serialized with
+    orjson when installed.
     """
 
     def __init__(
@@ -24,6 +51,9 @@ class LoggerAdapter(LoggerPort):
         name: str = "mesaYA_mcp",
         level: int = logging.INFO,
         use_json: bool = True,
+        queue_size: int = 10000,
+        overflow: str = "drop_new",
+        sampler: LogSampler | None = None,
     ) -> None:
         """Initialize the logger adapter.
 
@@ -31,8 +61,16 @@ class LoggerAdapter(LoggerPort):
             name: Logger name for identification.
             level: Logging level (default: INFO).
             use_json: Whether to use JSON format for logs (default: True).
+            queue_size: Maximum records waiting to be written (0 writes
+                synchronously from the caller).
+            overflow: Policy when the queue is full ("drop_new" or
+                "drop_old").
+            sampler: Optional per-context sampling and rate limiting of
+                debug and info records; warnings and errors are always
+                written.
         """
         self._logger = logging.getLogger(name)
+        self._sampler = sampler
         self._logger.setLevel(level)
         self._use_json = use_json
 
@@ -50,7 +88,45 @@ class LoggerAdapter(LoggerPort):
                     )
                 )
 
-            self._logger.addHandler(handler)
+            if queue_size > 0:
+                queue_handler = LogQueueHandler(queue_size, overflow)
+                queue_handler.setLevel(level)
+                queue_handler.start(handler)
+                # Write what is still queued when the process exits
+                atexit.register(queue_handler.stop)
+                self._logger.addHandler(queue_handler)
+            else:
+                self._logger.addHandler(handler)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "LoggerAdapter":
+        """Create the application logger from settings.
+
+        Args:
+            settings: Application settings (level, format, queue and
+                sampling options).
+
+        Returns:
+            The configured logger adapter, with a sampler if any sample
+            rate or rate limit is set.
+        """
+        sampler = (
+            LogSampler(
+                sample_rates=settings.log_sample_rates,
+                rate_limits=settings.log_rate_limits,
+                burst=settings.log_rate_burst,
+            )
+            if settings.log_sample_rates or settings.log_rate_limits
+            else None
+        )
+        return cls(
+            name=settings.app_name,
+            level=getattr(logging, settings.log_level.upper(), logging.INFO),
+            use_json=settings.log_format_json,
+            queue_size=settings.log_queue_size,
+            overflow=settings.log_queue_overflow,
+            sampler=sampler,
+        )
 
     class _JsonFormatter(logging.Formatter):
         """JSON formatter for structured logging."""
@@ -81,7 +157,18 @@ class LoggerAdapter(LoggerPort):
             if record.exc_info:
                 log_data["traceback"] = self.formatException(record.exc_info)
 
-            return json.dumps(log_data, default=str)
+            return dumps(log_data)
+
+    def is_enabled(self, level: str) -> bool:
+        """Check whether messages of a level would be logged.
+
+        Args:
+            level: Level name (verbose, debug, info, warn, error).
+
+        Returns:
+            True if a message at this level would be written.
+        """
+        return self._logger.isEnabledFor(_LEVELS.get(level.lower(), logging.INFO))
 
     def _log(
         self,
@@ -93,13 +180,35 @@ class LoggerAdapter(LoggerPort):
     ) -> None:
         """Internal logging method with context and metadata.
 
+        Public methods check the level before calling it, so disabled
+        levels skip the call and the metadata repacking.
+
         Args:
             level: Logging level.
             message: Log message.
             context: Optional context identifier.
             error: Optional exception.
-            **meta: Additional metadata.
+            **meta: Additional metadata; callable values (functions,
+                lambdas, bound methods, ``functools.partial``; not classes)
+                are called to get the value, only if the message is
+                logged. A call that raises is logged as an
+                ``<error: ...>`` placeholder.
         """
+        if (
+            self._sampler is not None
+            and level < logging.WARNING
+            and not self._sampler.allow(context)
+        ):
+            return
+        if meta:
+            meta = {
+                key: (
+                    _evaluate(value)
+                    if callable(value) and not isinstance(value, type)
+                    else value
+                )
+                for key, value in meta.items()
+            }
         extra = {
             "context": context,
             "meta": meta if meta else None,
@@ -115,7 +224,8 @@ class LoggerAdapter(LoggerPort):
             context: Optional context identifier.
             **meta: Additional metadata.
         """
-        self._log(logging.INFO, message, context, **meta)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, message, context, **meta)
 
     def warn(self, message: str, context: str | None = None, **meta: Any) -> None:
         """Log a warning message.
@@ -125,7 +235,8 @@ class LoggerAdapter(LoggerPort):
             context: Optional context identifier.
             **meta: Additional metadata.
         """
-        self._log(logging.WARNING, message, context, **meta)
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, message, context, **meta)
 
     def error(
         self,
@@ -142,7 +253,8 @@ class LoggerAdapter(LoggerPort):
             context: Optional context identifier.
             **meta: Additional metadata.
         """
-        self._log(logging.ERROR, message, context, error, **meta)
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, message, context, error, **meta)
 
     def debug(self, message: str, context: str | None = None, **meta: Any) -> None:
         """Log a debug message.
@@ -152,7 +264,8 @@ class LoggerAdapter(LoggerPort):
             context: Optional context identifier.
             **meta: Additional metadata.
         """
-        self._log(logging.DEBUG, message, context, **meta)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, message, context, **meta)
 
     def verbose(self, message: str, context: str | None = None, **meta: Any) -> None:
         """Log a verbose message (maps to DEBUG level).
@@ -162,4 +275,21 @@ class LoggerAdapter(LoggerPort):
             context: Optional context identifier.
             **meta: Additional metadata.
         """
-        self._log(logging.DEBUG, message, context, **meta)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, message, context, **meta)
+
+    def stats(self) -> dict[str, Any]:
+        """Get log queue and sampling counters.
+
+        Returns:
+            Dict with the queue counters (if records are queued) and, if
+            sampling is configured, suppressed records per context.
+        """
+        stats: dict[str, Any] = {}
+        for handler in self._logger.handlers:
+            if isinstance(handler, LogQueueHandler):
+                stats.update(handler.stats())
+                break
+        if self._sampler is not None:
+            stats["suppressed"] = self._sampler.stats()
+        return stats
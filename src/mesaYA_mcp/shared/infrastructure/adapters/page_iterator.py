@@ -0,0 +1,180 @@
+"""Page iterator - Lazy walk over paginated backend list endpoints.
+
+Yields the items of a list endpoint one page at a time, fetching the
+next page in the background while the current one is consumed, so large
+result sets are processed incrementally with at most two pages held in
+memory.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+# Upper bound on pages walked, in case the backend ignores paging
+_MAX_PAGES = 1000
+
+
+def _parse_page(response: Any) -> tuple[list[Any], int | None]:
+    """Split a list response into its items and the reported total.
+
+    Accepts ``{data, pagination: {totalItems}}``, ``{results, total}``
+    and bare lists. A single entity, bare or as ``data``, is returned as a
+    one-item page; anything else is an empty page.
+    """
+    if isinstance(response, list):
+        return response, None
+    if not isinstance(response, dict):
+        return [], None
+
+    if "data" in response or "results" in response:
+        items = response.get("data", response.get("results"))
+    else:
+        items = response if response.get("id") else None
+    if isinstance(items, dict):
+        items = [items]
+    elif not isinstance(items, list):
+        items = []
+
+    pagination = response.get("pagination") or {}
+    total = (
+        pagination.get("totalItems", response.get("total"))
+        if isinstance(pagination, dict)
+        else response.get("total")
+    )
+    return items, total if isinstance(total, int) else None
+
+
+class PageIterator:
+    """Async iterator over the items of a paginated list endpoint.
+
+    Pages are requested with ``page``/``limit`` query parameters. The walk
+    stops on a short or empty page, once the reported total or
+    ``max_items`` is reached, or when a page fails. Like ``HttpClient``,
+    failures are not raised: iteration ends and ``failed`` is set, so
+    callers can tell a complete result from a truncated one.
+
+    Use as an async context manager so an unfinished prefetch is
+    cancelled when the caller stops early::
+
+        async with http_client.paginate("/api/v1/users", max_items=200) as users:
+            async for user in users:
+                ...
+
+    Attributes:
+        total: Total item count reported by the backend, if any.
+        pages: Pages fetched so far.
+        failed: Whether the walk stopped because a page failed.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, dict[str, Any]], Awaitable[Any]],
+        path: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = 50,
+        max_items: int | None = None,
+    ) -> None:
+        """Initialize the iterator.
+
+        Args:
+            fetch: GET function returning decoded JSON or None on error.
+            path: API endpoint path.
+            params: Query parameters sent with every page.
+            page_size: Items requested per page.
+            max_items: Stop after this many items (None walks every page).
+        """
+        self._fetch = fetch
+        self._path = path
+        self._params = {
+            name: value for name, value in (params or {}).items() if name != "limit"
+        }
+        self._page_size = (
+            min(page_size, max_items) if max_items is not None else page_size
+        )
+        self._max_items = max_items
+        self._buffer: list[Any] = []
+        self._position = 0
+        self._yielded = 0
+        self._next_page = 1
+        self._prefetch: asyncio.Task | None = None
+        self._done = False
+        self.total: int | None = None
+        self.pages = 0
+        self.failed = False
+
+    def __aiter__(self) -> "PageIterator":
+        return self
+
+    async def __aenter__(self) -> "PageIterator":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def __anext__(self) -> Any:
+        if self._max_items is not None and self._yielded >= self._max_items:
+            await self.aclose()
+            raise StopAsyncIteration
+
+        while self._position >= len(self._buffer):
+            if self._done:
+                raise StopAsyncIteration
+            await self._load_next()
+
+        item = self._buffer[self._position]
+        self._position += 1
+        self._yielded += 1
+        return item
+
+    def _request_page(self) -> asyncio.Task:
+        """Start fetching the next page."""
+        params = {**self._params, "page": self._next_page, "limit": self._page_size}
+        self._next_page += 1
+        return asyncio.create_task(self._fetch(self._path, params))
+
+    async def _load_next(self) -> None:
+        """Swap in the next page and start prefetching the one after it."""
+        task = self._prefetch or self._request_page()
+        self._prefetch = None
+        response = await task
+
+        if response is None:
+            self.failed = True
+            self._done = True
+            return
+
+        items, total = _parse_page(response)
+        self.pages += 1
+        if total is not None:
+            self.total = total
+        self._buffer, self._position = items, 0
+
+        seen = (self.pages - 1) * self._page_size + len(items)
+        if (
+            len(items) < self._page_size
+            or (self.total is not None and seen >= self.total)
+            or (self._max_items is not None and seen >= self._max_items)
+            or self.pages >= _MAX_PAGES
+        ):
+            self._done = True
+        else:
+            self._prefetch = self._request_page()
+
+    async def collect(self) -> list[Any]:
+        """Consume the remaining items into a list.
+
+        Returns:
+            Remaining items, up to ``max_items``.
+        """
+        return [item async for item in self]
+
+    async def aclose(self) -> None:
+        """Stop the walk and cancel any pending prefetch."""
+        self._done = True
+        self._buffer, self._position = [], 0
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+            try:
+                await self._prefetch
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._prefetch = None
@@ -0,0 +1,179 @@
+"""Payment Client Adapter - REST client for the Payment microservice.
+
+This adapter keeps a dedicated connection pool for the Payment MS so
+payment tools reuse connections instead of opening one per call.
+"""
+
+from typing import Any
+
+import httpx
+
+from mesaYA_mcp.shared.core import get_logger, get_settings
+from mesaYA_mcp.shared.infrastructure.adapters.circuit_breaker import CircuitBreaker
+from mesaYA_mcp.shared.infrastructure.adapters.http2_options import http2_options
+from mesaYA_mcp.shared.infrastructure.adapters.json_decoder import JsonDecoder
+from mesaYA_mcp.shared.infrastructure.adapters.timeout_profiles import (
+    TimeoutProfiles,
+)
+
+
+class PaymentClient:
+    """HTTP client for Payment microservice communication.
+
+    Unlike ``HttpClient``, responses are returned as-is and transport
+    errors are raised, because payment tools map specific status codes
+    (201, 400, 404) and timeouts to their own messages. Calls go through
+    a circuit breaker, so an unhealthy Payment MS fails fast with
+    ``CircuitOpenError`` instead of waiting for the timeout.
+
+    Attributes:
+        _base_url: Base URL of the Payment MS.
+        _timeout: Request timeout in seconds.
+        _timeouts: Timeout capped by the current tool call deadline.
+        _limits: Connection pool limits for the shared client.
+        _http2: Whether to talk HTTP/2 to the Payment MS.
+        _decoder: JSON decoder for response bodies.
+        _client: Shared AsyncClient, created lazily and reused.
+        _breaker: Circuit breaker for the Payment MS.
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """Initialize the payment client.
+
+        Args:
+            base_url: Base URL of the Payment MS. Defaults to settings.
+            timeout: Request timeout in seconds. Defaults to settings.
+        """
+        settings = get_settings()
+        self._base_url = (base_url or settings.payment_ms_url).rstrip("/")
+        self._timeout = timeout or settings.payment_ms_timeout
+        self._timeouts = TimeoutProfiles(self._timeout)
+        self._headers: dict[str, str] = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        self._limits = httpx.Limits(
+            max_connections=settings.payment_ms_max_connections,
+            max_keepalive_connections=settings.payment_ms_max_keepalive_connections,
+            keepalive_expiry=settings.payment_ms_keepalive_expiry,
+        )
+        self._http2 = settings.payment_ms_http2
+        self._decoder = JsonDecoder(settings.json_decoder)
+        self._client: httpx.AsyncClient | None = None
+        self._breaker = CircuitBreaker(
+            name="payment",
+            failure_rate=settings.circuit_breaker_failure_rate,
+            window_size=settings.circuit_breaker_window_size,
+            minimum_calls=settings.circuit_breaker_minimum_calls,
+            open_duration=settings.circuit_breaker_open_duration,
+            half_open_max_calls=settings.circuit_breaker_half_open_max_calls,
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared async HTTP client, creating it if needed.
+
+        Returns:
+            Pooled AsyncClient instance.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self._base_url,
+                timeout=self._timeout,
+                headers=self._headers,
+                limits=self._limits,
+                **http2_options(self._base_url, self._http2),
+            )
+        return self._client
+
+    async def open(self) -> None:
+        """Open the shared client ahead of the first request.
+
+        Raises:
+            ImportError: If HTTP/2 is enabled but ``h2`` is not installed.
+        """
+        self._get_client()
+
+    async def aclose(self) -> None:
+        """Close the shared client and release pooled connections."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    async def get(self, path: str) -> httpx.Response:
+        """Perform GET request.
+
+        Args:
+            path: API endpoint path.
+
+        Returns:
+            The raw HTTP response.
+
+        Raises:
+            CircuitOpenError: If the Payment MS circuit is open.
+            DeadlineExceededError: If the tool call has no time left.
+            httpx.RequestError: On transport errors (timeouts, connection).
+        """
+        get_logger().debug(
+            "Payment GET request",
+            context="PaymentClient.get",
+            path=path,
+        )
+        timeout = self._timeouts.for_path(path)
+        return await self._breaker.call(
+            lambda: self._get_client().get(path, timeout=timeout)
+        )
+
+    async def post(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """Perform POST request.
+
+        Args:
+            path: API endpoint path.
+            json: Request body data.
+
+        Returns:
+            The raw HTTP response.
+
+        Raises:
+            CircuitOpenError: If the Payment MS circuit is open.
+            DeadlineExceededError: If the tool call has no time left.
+            httpx.RequestError: On transport errors (timeouts, connection).
+        """
+        get_logger().debug(
+            "Payment POST request",
+            context="PaymentClient.post",
+            path=path,
+        )
+        timeout = self._timeouts.for_path(path)
+        return await self._breaker.call(
+            lambda: self._get_client().post(path, json=json, timeout=timeout)
+        )
+
+    def decode(self, response: httpx.Response) -> Any:
+        """Decode a Payment MS response body.
+
+        Args:
+            response: Response returned by ``get`` or ``post``.
+
+        Returns:
+            The decoded JSON body.
+
+        Raises:
+            json.JSONDecodeError: If the body is not valid JSON.
+        """
+        return self._decoder.decode(response.content)
+
+    def stats(self) -> dict[str, Any]:
+        """Get client state for monitoring.
+
+        Returns:
+            Dict with circuit breaker state and counters.
+        """
+        return {"circuit": self._breaker.stats()}
@@ -0,0 +1,187 @@
+"""Request hedger - Duplicate slow reads to cut tail latency.
+
+If a GET on a hedged route has not answered within the route's recent
+latency percentile, a second identical request is sent and whichever
+answers first wins; the other is cancelled.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+
+class RequestHedger:
+    """Hedges idempotent requests on selected path prefixes.
+
+    The hedge delay for a prefix is the configured percentile of its
+    recent successful latencies (never below ``min_delay``). Hedging only
+    starts once a prefix has ``min_samples`` latencies, and hedges are
+    capped at ``max_ratio`` of the eligible requests.
+
+    Attributes:
+        eligible: Requests on hedged routes.
+        hedged: Requests for which a hedge was sent.
+        hedge_wins: Hedged requests answered first by the hedge.
+        primary_wins: Hedged requests answered first by the original.
+    """
+
+    def __init__(
+        self,
+        prefixes: list[str],
+        percentile: float,
+        min_delay: float,
+        max_ratio: float,
+        min_samples: int,
+        window: int = 200,
+    ) -> None:
+        """Initialize the hedger.
+
+        Args:
+            prefixes: API path prefixes whose GETs may be hedged.
+            percentile: Latency percentile (0-100) used as hedge delay.
+            min_delay: Lower bound on the hedge delay in seconds.
+            max_ratio: Maximum hedges per eligible request (extra load cap).
+            min_samples: Latencies needed before a prefix is hedged.
+            window: Recent latencies kept per prefix.
+        """
+        self._prefixes = sorted(prefixes, key=len, reverse=True)
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._max_ratio = max_ratio
+        self._min_samples = min_samples
+        self._latencies: dict[str, deque[float]] = {
+            prefix: deque(maxlen=window) for prefix in self._prefixes
+        }
+        self.eligible = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.primary_wins = 0
+
+    def prefix_for(self, path: str) -> str | None:
+        """Get the hedged prefix matching a path.
+
+        Args:
+            path: API endpoint path.
+
+        Returns:
+            Longest matching prefix, or None if the path is not hedged.
+        """
+        for prefix in self._prefixes:
+            if path.startswith(prefix):
+                return prefix
+        return None
+
+    def delay_for(self, prefix: str) -> float | None:
+        """Get the hedge delay for a prefix.
+
+        Args:
+            prefix: Hedged path prefix.
+
+        Returns:
+            Delay in seconds, or None while there are too few samples.
+        """
+        samples = self._latencies[prefix]
+        if len(samples) < self._min_samples:
+            return None
+        ordered = sorted(samples)
+        rank = math.ceil(self._percentile / 100 * len(ordered)) - 1
+        return max(self._min_delay, ordered[max(0, rank)])
+
+    async def run(
+        self,
+        path: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Send a request, hedging it if it is slow.
+
+        Args:
+            path: API endpoint path (selects the prefix).
+            send: Coroutine function sending one copy of the request.
+
+        Returns:
+            The first successful response.
+
+        Raises:
+            Exception: The original request's error if every copy failed.
+        """
+        prefix = self.prefix_for(path)
+        if prefix is None:
+            return await send()
+
+        self.eligible += 1
+        delay = self.delay_for(prefix)
+        started = time.monotonic()
+        primary = asyncio.ensure_future(send())
+        try:
+            if delay is None or self.hedged >= self._max_ratio * self.eligible:
+                response = await primary
+                self._record(prefix, started)
+                return response
+
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                response = primary.result()
+                self._record(prefix, started)
+                return response
+
+            self.hedged += 1
+            hedge = asyncio.ensure_future(send())
+            return await self._race(prefix, started, primary, hedge)
+        finally:
+            if not primary.done():
+                primary.cancel()
+
+    async def _race(
+        self,
+        prefix: str,
+        started: float,
+        primary: asyncio.Future,
+        hedge: asyncio.Future,
+    ) -> httpx.Response:
+        """Return the first copy that succeeds, cancelling the other."""
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        else:
+                            self.primary_wins += 1
+                        self._record(prefix, started)
+                        return task.result()
+            # Both copies failed: surface the original request's error
+            raise primary.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _record(self, prefix: str, started: float) -> None:
+        """Record the latency of a successful request."""
+        self._latencies[prefix].append(time.monotonic() - started)
+
+    def stats(self) -> dict[str, Any]:
+        """Get hedging counters.
+
+        Returns:
+            Dict with eligible, hedged, hedge_wins and primary_wins counts,
+            plus the current hedge delay per prefix (None while warming up).
+        """
+        delays: dict[str, float | None] = {}
+        for prefix in self._prefixes:
+            delay = self.delay_for(prefix)
+            delays[prefix] = round(delay, 4) if delay is not None else None
+        return {
+            "eligible": self.eligible,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "primary_wins": self.primary_wins,
+            "delays": delays,
+        }
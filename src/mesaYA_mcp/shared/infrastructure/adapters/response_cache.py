@@ -0,0 +1,212 @@
+"""Response Cache - Bounded in-process cache for backend GET responses.
+
+Entries expire after a TTL chosen by the longest matching path prefix and
+are evicted least-recently-used when the entry count or byte budget is full.
+Expired entries carrying ETag/Last-Modified validators are kept so they can
+be revalidated with a conditional GET instead of being re-downloaded.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+
+@dataclass
+class CacheEntry:
+    """A cached, decoded backend response.
+
+    Attributes:
+        value: Decoded JSON data, shared between callers (read-only).
+        size: Size of the raw response body in bytes.
+        expires_at: Monotonic time after which the entry is stale.
+        etag: ETag validator from the backend response, if any.
+        last_modified: Last-Modified validator from the backend response, if any.
+    """
+
+    value: Any
+    size: int
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def has_validators(self) -> bool:
+        """Whether the entry can be revalidated with a conditional GET."""
+        return bool(self.etag or self.last_modified)
+
+
+class ResponseCache:
+    """TTL + LRU cache keyed by request identity.
+
+    Keys are tuples whose first item is the request path, so entries can
+    be invalidated by path prefix.
+
+    Attributes:
+        _ttls: Path prefix to TTL in seconds. Longest prefix wins;
+            a TTL of 0 disables caching for that prefix.
+        _max_entries: Maximum number of cached responses.
+        _max_bytes: Maximum total size of cached response bodies.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float],
+        max_entries: int,
+        max_bytes: int,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttls: Path prefix to TTL in seconds.
+            max_entries: Maximum number of cached responses.
+            max_bytes: Maximum total size of cached response bodies.
+        """
+        self._ttls = sorted(ttls.items(), key=lambda item: len(item[0]), reverse=True)
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+
+    def ttl_for(self, path: str) -> float:
+        """Get the TTL configured for a path.
+
+        Args:
+            path: API endpoint path.
+
+        Returns:
+            TTL in seconds, 0 if the path is not cacheable.
+        """
+        for prefix, ttl in self._ttls:
+            if path.startswith(prefix):
+                return ttl
+        return 0.0
+
+    def get(self, key: Hashable) -> CacheEntry | None:
+        """Get a fresh entry and mark it as recently used.
+
+        Args:
+            key: Request identity.
+
+        Expired entries without validators are dropped; expired entries
+        with validators are kept for ``get_stale``.
+
+        Returns:
+            The cached entry, or None on a miss or expired entry.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None and not entry.has_validators:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def get_stale(self, key: Hashable) -> CacheEntry | None:
+        """Get an expired entry that can be revalidated.
+
+        Args:
+            key: Request identity.
+
+        Returns:
+            The entry if it is present and has validators, None otherwise.
+        """
+        entry = self._entries.get(key)
+        if entry is None or not entry.has_validators:
+            return None
+        return entry
+
+    def set(
+        self,
+        key: Hashable,
+        path: str,
+        value: Any,
+        size: int,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a response if its path is cacheable and it fits the budget.
+
+        Args:
+            key: Request identity.
+            path: API endpoint path (selects the TTL).
+            value: Decoded JSON data.
+            size: Size of the raw response body in bytes.
+            etag: ETag response header, if any.
+            last_modified: Last-Modified response header, if any.
+        """
+        ttl = self.ttl_for(path)
+        if ttl <= 0 or size > self._max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = CacheEntry(
+            value, size, time.monotonic() + ttl, etag, last_modified
+        )
+        self._bytes += size
+
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def refresh(self, key: Hashable, path: str) -> None:
+        """Mark a revalidated entry as fresh for another TTL.
+
+        Args:
+            key: Request identity.
+            path: API endpoint path (selects the TTL).
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry.expires_at = time.monotonic() + self.ttl_for(path)
+        self._entries.move_to_end(key)
+        self.revalidations += 1
+
+    def invalidate(self, path_prefix: str) -> int:
+        """Drop every entry whose path starts with a prefix.
+
+        Args:
+            path_prefix: API path prefix to invalidate.
+
+        Returns:
+            Number of entries removed.
+        """
+        keys = [key for key in self._entries if key[0].startswith(path_prefix)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry and release its bytes."""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def stats(self) -> dict[str, int]:
+        """Get cache counters.
+
+        Returns:
+            Dict with hits, misses, revalidations, evictions, entries and bytes.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
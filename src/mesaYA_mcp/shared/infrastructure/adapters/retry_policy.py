@@ -0,0 +1,155 @@
+"""Retry policy - Exponential backoff with jitter for idempotent requests.
+
+Transient failures (transport errors and retryable status codes) are
+retried with full-jitter exponential backoff, honouring ``Retry-After``
+and bounded by a total deadline across all attempts and by the current
+tool call deadline.
+"""
+
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable
+
+import httpx
+
+from mesaYA_mcp.shared.domain import get_remaining_time
+
+
+class RetryPolicy:
+    """Retries idempotent HTTP requests on transient failures.
+
+    Attributes:
+        max_attempts: Maximum attempts per request, including the first.
+        base_delay: Backoff base in seconds (doubled per retry).
+        max_delay: Upper bound on a single backoff in seconds.
+        deadline: Total time budget in seconds for all attempts.
+        retry_statuses: HTTP status codes considered transient.
+        retries: Number of retries performed.
+        recovered: Requests that succeeded after at least one retry.
+        exhausted: Requests that failed after using up their retries.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        deadline: float,
+        retry_statuses: set[int] | frozenset[int],
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            max_attempts: Maximum attempts per request, including the first.
+            base_delay: Backoff base in seconds (doubled per retry).
+            max_delay: Upper bound on a single backoff in seconds.
+            deadline: Total time budget in seconds for all attempts.
+            retry_statuses: HTTP status codes considered transient.
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retries = 0
+        self.recovered = 0
+        self.exhausted = 0
+
+    def backoff(self, attempt: int) -> float:
+        """Get a full-jitter backoff delay.
+
+        Args:
+            attempt: Zero-based index of the failed attempt.
+
+        Returns:
+            Delay in seconds, uniformly drawn from
+            ``[0, min(max_delay, base_delay * 2**attempt)]``.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    @staticmethod
+    def retry_after(response: httpx.Response) -> float | None:
+        """Parse a ``Retry-After`` header (seconds or HTTP date).
+
+        Args:
+            response: Response that may carry the header.
+
+        Returns:
+            Delay in seconds, or None if absent or unparseable.
+        """
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    async def run(
+        self, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures.
+
+        Args:
+            send: Coroutine function sending one attempt of the request.
+
+        Returns:
+            The first non-transient response, or the last response once
+            retries or the deadline are exhausted.
+
+        Raises:
+            httpx.RequestError: If the last attempt failed in transport.
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            error: httpx.RequestError | None = None
+            response: httpx.Response | None = None
+            try:
+                response = await send()
+            except httpx.RequestError as e:
+                error = e
+
+            if error is None and response.status_code not in self.retry_statuses:
+                if attempt:
+                    self.recovered += 1
+                return response
+
+            delay = self.backoff(attempt)
+            if response is not None:
+                delay = self.retry_after(response) or delay
+
+            attempt += 1
+            elapsed = time.monotonic() - started
+            remaining = get_remaining_time()
+            if (
+                attempt >= self.max_attempts
+                or elapsed + delay > self.deadline
+                or (remaining is not None and delay >= remaining)
+            ):
+                self.exhausted += 1
+                if error is not None:
+                    raise error
+                return response
+
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict[str, int]:
+        """Get retry counters.
+
+        Returns:
+            Dict with retries, recovered and exhausted counts.
+        """
+        return {
+            "retries": self.retries,
+            "recovered": self.recovered,
+            "exhausted": self.exhausted,
+        }
@@ -0,0 +1,66 @@
+"""Single-flight - Coalesce identical concurrent calls into one.
+
+While a call for a given key is in flight, later callers with the same key
+await the same result instead of issuing their own call.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """Deduplicates concurrent async calls sharing the same key.
+
+    The first caller for a key starts the call; callers arriving before it
+    completes await the same task. Results are shared between all awaiters,
+    so callers must treat them as read-only.
+
+    Attributes:
+        issued: Number of calls actually started.
+        coalesced: Number of calls that joined an in-flight call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self.issued = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fn`` once per key among concurrent callers.
+
+        Cancelling one awaiter does not cancel the shared call.
+
+        Args:
+            key: Identity of the call.
+            fn: Coroutine function performing the call.
+
+        Returns:
+            The result of the (possibly shared) call.
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            self.issued += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """Drop a finished task so the next caller starts a fresh call."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    def stats(self) -> dict[str, int]:
+        """Get coalescing counters.
+
+        Returns:
+            Dict with issued, coalesced and currently in-flight counts.
+        """
+        return {
+            "issued": self.issued,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
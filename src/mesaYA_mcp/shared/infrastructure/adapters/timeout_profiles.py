@@ -0,0 +1,74 @@
+"""Timeout profiles - Per-route timeouts capped by the call deadline.
+
+Maps API path prefixes to connect/read/write/pool timeouts so cheap
+lookups fail fast while heavy analytics queries get more time, and caps
+every timeout by the time left in the current tool call.
+"""
+
+from typing import Any
+
+import httpx
+
+from mesaYA_mcp.shared.domain import DeadlineExceededError, get_remaining_time
+
+
+class TimeoutProfiles:
+    """Resolves the timeout for a request path.
+
+    Attributes:
+        _default: Timeout in seconds for phases no profile overrides.
+        _profiles: Path prefix -> phase timeouts, longest prefix first.
+    """
+
+    def __init__(
+        self,
+        default: float,
+        profiles: dict[str, dict[str, float]] | None = None,
+    ) -> None:
+        """Initialize the profiles.
+
+        Args:
+            default: Timeout in seconds for phases no profile overrides.
+            profiles: Path prefix -> ``{"connect", "read", "write", "pool"}``
+                timeouts in seconds. Longest matching prefix wins.
+        """
+        self._default = default
+        self._profiles = sorted(
+            (profiles or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+
+    def for_path(self, path: str) -> httpx.Timeout:
+        """Get the timeout for a request, capped by the current deadline.
+
+        Args:
+            path: API endpoint path.
+
+        Returns:
+            Timeout to pass to the request.
+
+        Raises:
+            DeadlineExceededError: If the current tool call has no time left.
+        """
+        phases: dict[str, Any] = {}
+        for prefix, profile in self._profiles:
+            if path.startswith(prefix):
+                phases = profile
+                break
+        timeout = httpx.Timeout(self._default, **phases)
+
+        remaining = get_remaining_time()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise DeadlineExceededError(f"request to {path}")
+        return httpx.Timeout(
+            connect=_cap(timeout.connect, remaining),
+            read=_cap(timeout.read, remaining),
+            write=_cap(timeout.write, remaining),
+            pool=_cap(timeout.pool, remaining),
+        )
+
+
+def _cap(value: float | None, remaining: float) -> float:
+    """Cap a phase timeout (None meaning unbounded) by the remaining time."""
+    return remaining if value is None else min(value, remaining)
@@ -0,0 +1,119 @@
+"""TOON stream encoder - Incremental encoding of large list responses.
+
+Encodes an envelope whose list field is fed from an async iterator
+(e.g. a ``PageIterator``), emitting the header and then the rows chunk by
+chunk. Each chunk is encoded and released as soon as it is read, so the
+decoded entities are never all in memory and the first chunk is ready
+before the last page is fetched.
+
+TOON declares an array's length (and, for tables, its columns) in the
+header line, so both must be known before the first row: the length comes
+from the backend's reported total and the columns from a field projection.
+Rows are rendered with ``toon_format.encode`` itself, so joining the
+chunks gives the same document as encoding the whole envelope at once
+whenever ``encode`` would pick the same layout.
+"""
+
+from typing import Any, AsyncIterable, AsyncIterator
+
+from toon_format import encode
+
+
+class ToonStreamEncoder:
+    """Chunked encoder for an envelope with one streamed list field.
+
+    Two layouts are supported:
+
+    - Table (``columns`` given): ``data[N]{a,b}:`` followed by one
+      delimited line per row. Rows are reduced to the columns, with
+      missing values as null, and every value must be a primitive.
+    - List (``columns`` omitted): ``data[N]:`` followed by ``- `` items,
+      which accepts rows of any shape.
+
+    Attributes:
+        _chunk_size: Rows encoded per emitted chunk.
+    """
+
+    def __init__(self, chunk_size: int = 100) -> None:
+        """Initialize the encoder.
+
+        Args:
+            chunk_size: Rows encoded per emitted chunk.
+        """
+        self._chunk_size = max(1, chunk_size)
+
+    async def encode(
+        self,
+        head: dict[str, Any],
+        key: str,
+        rows: AsyncIterable[Any],
+        length: int,
+        columns: list[str] | None = None,
+    ) -> AsyncIterator[str]:
+        """Encode an envelope chunk by chunk.
+
+        Args:
+            head: Envelope fields emitted before the list (status, entity...).
+            key: Name of the list field, emitted last.
+            rows: Rows of the list.
+            length: Number of rows declared in the header. Only this many
+                rows are read from ``rows``.
+            columns: Table columns, or None for the list layout.
+
+        Yields:
+            Document chunks; concatenated they form the full document.
+
+        Raises:
+            ValueError: If ``rows`` ends before ``length`` rows, or a table
+                row has a non-primitive value. The chunks already yielded
+                are then not a valid document.
+        """
+        prefix = f"{encode(head)}\n" if head else ""
+        if length <= 0:
+            yield prefix + encode({key: []})
+            return
+
+        yield prefix + self._header(key, length, columns)
+
+        chunk: list[Any] = []
+        read = 0
+        async for row in rows:
+            chunk.append(row)
+            read += 1
+            if len(chunk) >= self._chunk_size or read >= length:
+                yield self._encode_rows(key, chunk, columns)
+                chunk = []
+            if read >= length:
+                break
+
+        if read < length:
+            raise ValueError(f"Stream declared {length} rows but ended after {read}")
+
+    @staticmethod
+    def _header(key: str, length: int, columns: list[str] | None) -> str:
+        """Build the array header line for ``length`` rows."""
+        sample = [None, {}] if columns is None else [dict.fromkeys(columns)]
+        line = encode({key: sample}).split("\n", 1)[0]
+        name, _, rest = line.partition(f"[{len(sample)}]")
+        return f"{name}[{length}]{rest}"
+
+    @staticmethod
+    def _encode_rows(key: str, chunk: list[Any], columns: list[str] | None) -> str:
+        """Encode a chunk of rows as they appear under the array header."""
+        if columns is None:
+            # A trailing empty object forces the ``- `` list layout for any
+            # chunk; its lone ``-`` line is dropped.
+            lines = encode({key: [*chunk, {}]}).split("\n")[1:-1]
+        else:
+            table = [
+                {
+                    column: row.get(column) if isinstance(row, dict) else None
+                    for column in columns
+                }
+                for row in chunk
+            ]
+            header, _, body = encode({key: table}).partition("\n")
+            if header != ToonStreamEncoder._header(key, len(chunk), columns):
+                raise ValueError(f"Rows of '{key}' have non-primitive column values")
+            lines = [body]
+        return "\n" + "\n".join(lines)
@@ -13,14 +13,14 @@ Structure:
     ├── set_access_context.py # Context setter (call first!)
     ├── get_allowed_tools.py  # Authorization info tool
     ├── restaurants/          # Restaurant-related tools (8)
-    ├── reservations/         # Reservation management tools (10)
-    ├── menus/                # Menu and dish tools (5)
-    ├── users/                # User management tools (3)
+    ├── reservations/         # Reservation management tools (11)
+    ├── menus/                # Menu and dish tools (6)
+    ├── users/                # User management tools (4)
     ├── reviews/              # Review analysis tools (1)
     ├── ai/                   # AI/Vision analysis tools (1)
     └── payment/              # Payment tools (3)
 
-Total: 33 MCP tools (1 file = 1 tool)
+Total: 36 MCP tools (1 file = 1 tool)
 """
 
 # Import authorization tools first
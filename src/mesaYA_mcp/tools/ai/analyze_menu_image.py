@@ -125,7 +125,7 @@ async def analyze_menu_image(dto: ImageAnalysisInput) -> str:
     logger.info(
         "Analyzing image",
         context="analyze_menu_image",
-        url=dto.image_url[:50] + "...",
+        url=lambda: dto.image_url[:50] + "...",
         analysis_type=dto.analysis_type,
     )
 
@@ -4,6 +4,7 @@ from mesaYA_mcp.tools.dtos.menus.menu_id_dto import MenuIdDto
 from mesaYA_mcp.tools.dtos.menus.list_menus_dto import ListMenusDto
 from mesaYA_mcp.tools.dtos.menus.search_dishes_dto import SearchDishesDto
 from mesaYA_mcp.tools.dtos.menus.dish_id_dto import DishIdDto
+from mesaYA_mcp.tools.dtos.menus.dish_ids_dto import DishIdsDto
 from mesaYA_mcp.tools.dtos.menus.menu_analytics_dto import MenuAnalyticsDto
 
 __all__ = [
@@ -11,5 +12,6 @@ __all__ = [
     "ListMenusDto",
     "SearchDishesDto",
     "DishIdDto",
+    "DishIdsDto",
     "MenuAnalyticsDto",
 ]
@@ -0,0 +1,14 @@
+"""Dish IDs DTO."""
+
+from pydantic import BaseModel, Field
+
+
+class DishIdsDto(BaseModel):
+    """Input for fetching several dishes in one call."""
+
+    dish_ids: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="UUIDs of the dishes (max 50, duplicates ignored)",
+    )
@@ -15,3 +15,7 @@ class ListMenusDto(BaseModel):
     )
     active_only: bool = Field(default=True, description="Only show active menus")
     limit: int = Field(default=20, ge=1, le=100, description="Maximum results")
+    cursor: str = Field(
+        default="",
+        description="Continuation cursor (next_cursor) from a previous truncated response; other filters are ignored",
+    )
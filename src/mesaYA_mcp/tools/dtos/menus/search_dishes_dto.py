@@ -22,3 +22,7 @@ class SearchDishesDto(BaseModel):
     max_price: float = Field(default=0, ge=0, description="Maximum price filter")
     vegetarian: bool = Field(default=False, description="Only show vegetarian dishes")
     limit: int = Field(default=20, ge=1, le=100, description="Maximum results")
+    cursor: str = Field(
+        default="",
+        description="Continuation cursor (next_cursor) from a previous truncated response; other filters are ignored",
+    )
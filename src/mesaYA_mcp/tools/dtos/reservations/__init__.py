@@ -4,6 +4,7 @@ from mesaYA_mcp.tools.dtos.reservations.create_reservation_dto import (
     CreateReservationDto,
 )
 from mesaYA_mcp.tools.dtos.reservations.reservation_id_dto import ReservationIdDto
+from mesaYA_mcp.tools.dtos.reservations.reservation_ids_dto import ReservationIdsDto
 from mesaYA_mcp.tools.dtos.reservations.list_reservations_dto import ListReservationsDto
 from mesaYA_mcp.tools.dtos.reservations.restaurant_reservations_dto import (
     RestaurantReservationsDto,
@@ -21,6 +22,7 @@ from mesaYA_mcp.tools.dtos.reservations.reservation_analytics_dto import (
 __all__ = [
     "CreateReservationDto",
     "ReservationIdDto",
+    "ReservationIdsDto",
     "ListReservationsDto",
     "RestaurantReservationsDto",
     "UpdateReservationStatusDto",
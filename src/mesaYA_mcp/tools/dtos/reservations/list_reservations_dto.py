@@ -13,3 +13,7 @@ class ListReservationsDto(BaseModel):
     date_from: str = Field(default="", description="Start date (YYYY-MM-DD)")
     date_to: str = Field(default="", description="End date (YYYY-MM-DD)")
     limit: int = Field(default=20, ge=1, le=100, description="Maximum results")
+    cursor: str = Field(
+        default="",
+        description="Continuation cursor (next_cursor) from a previous truncated response; other filters are ignored",
+    )
@@ -0,0 +1,14 @@
+"""Reservation IDs DTO."""
+
+from pydantic import BaseModel, Field
+
+
+class ReservationIdsDto(BaseModel):
+    """Input for fetching several reservations in one call."""
+
+    reservation_ids: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="UUIDs of the reservations (max 50, duplicates ignored)",
+    )
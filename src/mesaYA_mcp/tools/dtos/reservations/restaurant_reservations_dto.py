@@ -17,3 +17,7 @@ class RestaurantReservationsDto(BaseModel):
     date: str = Field(default="", description="Optional date filter (YYYY-MM-DD)")
     status: str = Field(default="", description="Optional status filter")
     limit: int = Field(default=50, ge=1, le=100, description="Maximum results")
+    cursor: str = Field(
+        default="",
+        description="Continuation cursor (next_cursor) from a previous truncated response; other filters are ignored",
+    )
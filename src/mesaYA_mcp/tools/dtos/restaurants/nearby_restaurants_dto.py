@@ -14,3 +14,11 @@ class NearbyRestaurantsDto(BaseModel):
         default=5.0, ge=0.1, le=50, description="Search radius in km (max 50)"
     )
     limit: int = Field(default=10, ge=1, le=50, description="Maximum results")
+    fields: list[str] | None = Field(
+        default=None,
+        description="Fields to return per restaurant (e.g. ['name', 'address']; distance and location are always kept). Omit for all fields except timestamps and internal metadata, ['*'] for all fields",
+    )
+    cursor: str = Field(
+        default="",
+        description="Continuation cursor (next_cursor) from a previous truncated response; other filters are ignored",
+    )
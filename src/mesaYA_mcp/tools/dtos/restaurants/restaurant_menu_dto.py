@@ -17,3 +17,11 @@ class RestaurantMenuDto(BaseModel):
         description="Restaurant name or UUID. Use the restaurant name for easier lookup (e.g., 'Pizza Palace').",
     )
     active_only: bool = Field(default=True, description="Only return active menu items")
+    fields: list[str] | None = Field(
+        default=None,
+        description="Fields to return per menu (e.g. ['name', 'dishes']). Omit for all fields except timestamps and internal metadata, ['*'] for all fields",
+    )
+    cursor: str = Field(
+        default="",
+        description="Continuation cursor (next_cursor) from a previous truncated response; other filters are ignored",
+    )
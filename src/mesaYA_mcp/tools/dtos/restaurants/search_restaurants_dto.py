@@ -23,3 +23,11 @@ class SearchRestaurantsDto(BaseModel):
     )
     is_active: bool = Field(default=True, description="Only show active restaurants")
     limit: int = Field(default=10, ge=1, le=50, description="Maximum results (max 50)")
+    fields: list[str] | None = Field(
+        default=None,
+        description="Fields to return per restaurant (e.g. ['name', 'address']). Omit for all fields except timestamps and internal metadata, ['*'] for all fields",
+    )
+    cursor: str = Field(
+        default="",
+        description="Continuation cursor (next_cursor) from a previous truncated response; other filters are ignored",
+    )
@@ -1,12 +1,14 @@
 """User DTOs."""
 
 from mesaYA_mcp.tools.dtos.users.user_id_dto import UserIdDto
+from mesaYA_mcp.tools.dtos.users.user_ids_dto import UserIdsDto
 from mesaYA_mcp.tools.dtos.users.user_email_dto import UserEmailDto
 from mesaYA_mcp.tools.dtos.users.list_users_dto import ListUsersDto
 from mesaYA_mcp.tools.dtos.users.user_analytics_dto import UserAnalyticsDto
 
 __all__ = [
     "UserIdDto",
+    "UserIdsDto",
     "UserEmailDto",
     "ListUsersDto",
     "UserAnalyticsDto",
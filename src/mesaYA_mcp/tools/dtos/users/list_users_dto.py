@@ -18,3 +18,11 @@ class ListUsersDto(BaseModel):
     active_only: bool = Field(default=True, description="Only show active users")
     search: str = Field(default="", description="General search term for name or email")
     limit: int = Field(default=20, ge=1, le=100, description="Maximum results")
+    fields: list[str] | None = Field(
+        default=None,
+        description="Fields to return per user (e.g. ['email', 'role']). Omit for all fields except timestamps and internal metadata, ['*'] for all fields",
+    )
+    cursor: str = Field(
+        default="",
+        description="Continuation cursor (next_cursor) from a previous truncated response; other filters are ignored",
+    )
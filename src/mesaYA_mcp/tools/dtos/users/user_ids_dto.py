@@ -0,0 +1,14 @@
+"""User IDs DTO."""
+
+from pydantic import BaseModel, Field
+
+
+class UserIdsDto(BaseModel):
+    """Input for fetching several users in one call."""
+
+    user_ids: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="UUIDs of the users (max 50, duplicates ignored)",
+    )
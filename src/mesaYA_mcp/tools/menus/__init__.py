@@ -4,6 +4,7 @@ from mesaYA_mcp.tools.menus.get_menu import get_menu
 from mesaYA_mcp.tools.menus.list_menus import list_menus
 from mesaYA_mcp.tools.menus.search_dishes import search_dishes
 from mesaYA_mcp.tools.menus.get_dish import get_dish
+from mesaYA_mcp.tools.menus.get_dishes_bulk import get_dishes_bulk
 from mesaYA_mcp.tools.menus.get_menu_analytics import get_menu_analytics
 
 __all__ = [
@@ -11,5 +12,6 @@ __all__ = [
     "list_menus",
     "search_dishes",
     "get_dish",
+    "get_dishes_bulk",
     "get_menu_analytics",
 ]
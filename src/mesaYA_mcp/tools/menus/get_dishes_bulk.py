@@ -0,0 +1,71 @@
+"""Get dishes in bulk tool."""
+
+from mesaYA_mcp.server import mcp
+from mesaYA_mcp.shared.core import get_logger
+from mesaYA_mcp.shared.application.services.bulk_fetch import fetch_by_ids
+from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
+    get_response_adapter,
+)
+from mesaYA_mcp.tools.dtos.menus import DishIdsDto
+
+
+@mcp.tool()
+async def get_dishes_bulk(dto: DishIdsDto) -> str:
+    """Get several dishes in one call (prefer over repeated get_dish). Args: dish_ids (max 50). Returns: dishes found, IDs not found and IDs that failed."""
+    logger = get_logger()
+    adapter = get_response_adapter()
+
+    logger.info(
+        "Getting dishes in bulk",
+        context="get_dishes_bulk",
+        count=len(dto.dish_ids),
+    )
+
+    try:
+        result = await fetch_by_ids(dto.dish_ids, "/api/v1/dishes/{}")
+
+        if not result.requested:
+            return adapter.map_error(
+                message="At least one non-blank dish ID is required.",
+                entity_type="dish",
+                operation="bulk_get",
+            )
+
+        if result.failed:
+            logger.warn(
+                "Some dishes could not be retrieved",
+                context="get_dishes_bulk",
+                failed=len(result.failed),
+            )
+
+        if not result.items:
+            if result.failed:
+                return adapter.map_error(
+                    message="Unable to retrieve dishes. Service unavailable.",
+                    entity_type="dish",
+                    operation="bulk_get",
+                )
+            return adapter.map_not_found("dish", ", ".join(result.not_found))
+
+        return adapter.map_success(
+            data={
+                "items": result.items,
+                "not_found": result.not_found,
+                "failed": result.failed,
+            },
+            entity_type="dish",
+            operation="bulk_get",
+            count=len(result.items),
+        )
+
+    except Exception as e:
+        logger.error(
+            "Failed to get dishes in bulk",
+            error=str(e),
+            context="get_dishes_bulk",
+        )
+        return adapter.map_error(
+            message=str(e),
+            entity_type="dish",
+            operation="bulk_get",
+        )
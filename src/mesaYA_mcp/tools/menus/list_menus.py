@@ -11,7 +11,7 @@ from mesaYA_mcp.tools.dtos.menus import ListMenusDto
 
 @mcp.tool()
 async def list_menus(dto: ListMenusDto) -> str:
-    """List menus. Args: restaurant, active_only, limit. Returns: menus list."""
+    """List menus. Args: restaurant, active_only, limit, cursor. Returns: menus list."""
     logger = get_logger()
     http_client = get_http_client()
     adapter = get_response_adapter()
@@ -24,7 +24,10 @@ async def list_menus(dto: ListMenusDto) -> str:
     )
 
     try:
-        params: dict = {"limit": dto.limit}
+        if dto.cursor:
+            return adapter.map_continuation(dto.cursor, "menu", "list")
+
+        params: dict = {}
 
         # Resolve restaurant if provided
         if dto.restaurant:
@@ -36,24 +39,29 @@ async def list_menus(dto: ListMenusDto) -> str:
         if dto.active_only:
             params["isActive"] = True
 
-        response = await http_client.get("/api/v1/menus", params=params)
+        async with http_client.paginate(
+            "/api/v1/menus", params=params, max_items=dto.limit
+        ) as pages:
+            menus = await pages.collect()
 
-        if response is None:
+        if pages.failed and not menus:
             return adapter.map_error(
                 message="Unable to retrieve menus",
                 entity_type="menu",
                 operation="list",
             )
 
-        if isinstance(response, dict):
-            menus = response.get("data", [])
-        else:
-            menus = response
-
         if not menus:
             return adapter.map_empty("menu", "list")
 
-        return adapter.map_success(
+        if pages.failed:
+            logger.warn(
+                "List truncated by a failed page",
+                context="list_menus",
+                items=len(menus),
+            )
+
+        return adapter.map_page(
             data=menus,
             entity_type="menu",
             operation="list",
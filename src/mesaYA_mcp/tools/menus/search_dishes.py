@@ -14,7 +14,8 @@ async def search_dishes(dto: SearchDishesDto) -> str:
     """Search dishes by query, restaurant, category, or price. Returns matches in TOON format.
 
     Args:
-        dto: Search filters (query, restaurant, category, max_price, vegetarian, limit).
+        dto: Search filters (query, restaurant, category, max_price, vegetarian, limit),
+            or a cursor to continue a truncated result.
 
     Returns:
         Matching dishes list.
@@ -31,6 +32,9 @@ async def search_dishes(dto: SearchDishesDto) -> str:
     )
 
     try:
+        if dto.cursor:
+            return adapter.map_continuation(dto.cursor, "dish", "search")
+
         params: dict = {"q": dto.query, "limit": dto.limit}
 
         # Resolve restaurant if provided
@@ -60,7 +64,7 @@ async def search_dishes(dto: SearchDishesDto) -> str:
         if not dishes:
             return adapter.map_empty("dish", "search")
 
-        return adapter.map_success(
+        return adapter.map_page(
             data=dishes,
             entity_type="dish",
             operation="search",
@@ -1,10 +1,12 @@
 """Cancel payment tool."""
 
-import os
 from mesaYA_mcp.server import mcp
-from mesaYA_mcp.shared.core import get_logger
+from mesaYA_mcp.shared.core import get_logger, get_payment_client
 from mesaYA_mcp.shared.domain.access_level import AccessLevel
 from mesaYA_mcp.shared.application.require_access_decorator import require_access
+from mesaYA_mcp.shared.infrastructure.adapters.circuit_open_error import (
+    CircuitOpenError,
+)
 from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
     get_response_adapter,
 )
@@ -19,10 +21,6 @@ class CancelPaymentDto(BaseModel):
     reason: str | None = Field(default=None, description="Reason for cancellation")
 
 
-# Payment microservice URL from environment
-PAYMENT_MS_URL = os.getenv("PAYMENT_MS_URL", "http://localhost:8003")
-
-
 @mcp.tool()
 @require_access(AccessLevel.OWNER)
 async def cancel_payment(dto: CancelPaymentDto) -> str:
@@ -38,6 +36,7 @@ async def cancel_payment(dto: CancelPaymentDto) -> str:
         Cancellation result in TOON format.
     """
     logger = get_logger()
+    payment_client = get_payment_client()
     adapter = get_response_adapter()
 
     logger.info(
@@ -49,61 +48,60 @@ async def cancel_payment(dto: CancelPaymentDto) -> str:
 
     try:
         # Call Payment Microservice
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{PAYMENT_MS_URL}/api/v1/payments/{dto.payment_id}/cancel",
-                json={"reason": dto.reason} if dto.reason else {},
-            )
+        response = await payment_client.post(
+            f"/api/v1/payments/{dto.payment_id}/cancel",
+            json={"reason": dto.reason} if dto.reason else {},
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                logger.info(
-                    "Payment cancelled successfully",
-                    context="cancel_payment",
-                    payment_id=dto.payment_id,
-                )
-                return adapter.map_to_toon(
-                    data={
-                        "payment_id": dto.payment_id,
-                        "status": "cancelled",
-                        "message": "Payment has been cancelled successfully.",
-                    },
-                    entity_type="payment",
-                    operation="cancel",
-                )
-            elif response.status_code == 404:
-                logger.warning(
-                    "Payment not found",
-                    context="cancel_payment",
-                    payment_id=dto.payment_id,
-                )
-                return adapter.map_not_found("payment", dto.payment_id)
-            elif response.status_code == 400:
-                error_detail = response.json().get("detail", "Cannot cancel this payment")
-                logger.warning(
-                    "Cannot cancel payment",
-                    context="cancel_payment",
-                    payment_id=dto.payment_id,
-                    error=error_detail,
-                )
-                return adapter.map_error(
-                    message=f"Cannot cancel payment: {error_detail}",
-                    entity_type="payment",
-                    operation="cancel",
-                )
-            else:
-                error_detail = response.json().get("detail", "Unknown error")
-                logger.error(
-                    "Failed to cancel payment",
-                    context="cancel_payment",
-                    status_code=response.status_code,
-                    error=error_detail,
-                )
-                return adapter.map_error(
-                    message=f"Failed to cancel payment: {error_detail}",
-                    entity_type="payment",
-                    operation="cancel",
-                )
+        if response.status_code == 200:
+            data = payment_client.decode(response)
+            logger.info(
+                "Payment cancelled successfully",
+                context="cancel_payment",
+                payment_id=dto.payment_id,
+            )
+            return adapter.map_to_toon(
+                data={
+                    "payment_id": dto.payment_id,
+                    "status": "cancelled",
+                    "message": "Payment has been cancelled successfully.",
+                },
+                entity_type="payment",
+                operation="cancel",
+            )
+        elif response.status_code == 404:
+            logger.warning(
+                "Payment not found",
+                context="cancel_payment",
+                payment_id=dto.payment_id,
+            )
+            return adapter.map_not_found("payment", dto.payment_id)
+        elif response.status_code == 400:
+            error_detail = payment_client.decode(response).get("detail", "Cannot cancel this payment")
+            logger.warning(
+                "Cannot cancel payment",
+                context="cancel_payment",
+                payment_id=dto.payment_id,
+                error=error_detail,
+            )
+            return adapter.map_error(
+                message=f"Cannot cancel payment: {error_detail}",
+                entity_type="payment",
+                operation="cancel",
+            )
+        else:
+            error_detail = payment_client.decode(response).get("detail", "Unknown error")
+            logger.error(
+                "Failed to cancel payment",
+                context="cancel_payment",
+                status_code=response.status_code,
+                error=error_detail,
+            )
+            return adapter.map_error(
+                message=f"Failed to cancel payment: {error_detail}",
+                entity_type="payment",
+                operation="cancel",
+            )
 
     except httpx.TimeoutException:
         logger.error("Payment service timeout", context="cancel_payment")
@@ -119,6 +117,17 @@ async def cancel_payment(dto: CancelPaymentDto) -> str:
             entity_type="payment",
             operation="cancel",
         )
+    except CircuitOpenError as e:
+        logger.warn(
+            "Payment service circuit open",
+            context="cancel_payment",
+            retry_in=round(e.retry_in, 1),
+        )
+        return adapter.map_error(
+            message="Payment service is temporarily unavailable. Please try again later.",
+            entity_type="payment",
+            operation="cancel",
+        )
     except Exception as e:
         logger.error(
             "Unexpected error cancelling payment",
@@ -4,11 +4,13 @@ Note: MCP tools can call the Payment MS directly since they run on the server si
 The frontend uses the API Gateway (mesa-ya-res) for all payment operations.
 """
 
-import os
 from mesaYA_mcp.server import mcp
-from mesaYA_mcp.shared.core import get_logger
+from mesaYA_mcp.shared.core import get_logger, get_payment_client
 from mesaYA_mcp.shared.domain.access_level import AccessLevel
 from mesaYA_mcp.shared.application.require_access_decorator import require_access
+from mesaYA_mcp.shared.infrastructure.adapters.circuit_open_error import (
+    CircuitOpenError,
+)
 from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
     get_response_adapter,
 )
@@ -25,10 +27,6 @@ class CreatePaymentDto(BaseModel):
     description: str | None = Field(default=None, description="Payment description")
 
 
-# Payment microservice URL - MCP calls directly (server-to-server)
-PAYMENT_MS_URL = os.getenv("PAYMENT_MS_URL", "http://localhost:8003")
-
-
 @mcp.tool()
 @require_access(AccessLevel.USER)
 async def create_payment_for_reservation(dto: CreatePaymentDto) -> str:
@@ -44,6 +42,7 @@ async def create_payment_for_reservation(dto: CreatePaymentDto) -> str:
         Payment details in TOON format including checkout URL.
     """
     logger = get_logger()
+    payment_client = get_payment_client()
     adapter = get_response_adapter()
 
     logger.info(
@@ -56,52 +55,51 @@ async def create_payment_for_reservation(dto: CreatePaymentDto) -> str:
 
     try:
         # Call Payment Microservice
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{PAYMENT_MS_URL}/api/v1/payments",
-                json={
-                    "amount": dto.amount,
-                    "currency": dto.currency,
-                    "description": dto.description or f"Payment for reservation {dto.reservation_id}",
-                    "metadata": {
-                        "reservation_id": dto.reservation_id,
-                        "type": "reservation",
-                    },
+        response = await payment_client.post(
+            "/api/v1/payments",
+            json={
+                "amount": dto.amount,
+                "currency": dto.currency,
+                "description": dto.description or f"Payment for reservation {dto.reservation_id}",
+                "metadata": {
+                    "reservation_id": dto.reservation_id,
+                    "type": "reservation",
                 },
-            )
+            },
+        )
 
-            if response.status_code == 201:
-                data = response.json()
-                logger.info(
-                    "Payment created successfully",
-                    context="create_payment",
-                    payment_id=data.get("payment_id"),
-                )
-                return adapter.map_to_toon(
-                    data={
-                        "payment_id": data.get("payment_id"),
-                        "status": data.get("status"),
-                        "amount": data.get("amount"),
-                        "currency": data.get("currency"),
-                        "checkout_url": data.get("checkout_url"),
-                        "message": "Payment created. Use the checkout_url to complete payment.",
-                    },
-                    entity_type="payment",
-                    operation="create",
-                )
-            else:
-                error_detail = response.json().get("detail", "Unknown error")
-                logger.error(
-                    "Failed to create payment",
-                    context="create_payment",
-                    status_code=response.status_code,
-                    error=error_detail,
-                )
-                return adapter.map_error(
-                    message=f"Payment creation failed: {error_detail}",
-                    entity_type="payment",
-                    operation="create",
-                )
+        if response.status_code == 201:
+            data = payment_client.decode(response)
+            logger.info(
+                "Payment created successfully",
+                context="create_payment",
+                payment_id=data.get("payment_id"),
+            )
+            return adapter.map_to_toon(
+                data={
+                    "payment_id": data.get("payment_id"),
+                    "status": data.get("status"),
+                    "amount": data.get("amount"),
+                    "currency": data.get("currency"),
+                    "checkout_url": data.get("checkout_url"),
+                    "message": "Payment created. Use the checkout_url to complete payment.",
+                },
+                entity_type="payment",
+                operation="create",
+            )
+        else:
+            error_detail = payment_client.decode(response).get("detail", "Unknown error")
+            logger.error(
+                "Failed to create payment",
+                context="create_payment",
+                status_code=response.status_code,
+                error=error_detail,
+            )
+            return adapter.map_error(
+                message=f"Payment creation failed: {error_detail}",
+                entity_type="payment",
+                operation="create",
+            )
 
     except httpx.TimeoutException:
         logger.error("Payment service timeout", context="create_payment")
@@ -117,6 +115,17 @@ async def create_payment_for_reservation(dto: CreatePaymentDto) -> str:
             entity_type="payment",
             operation="create",
         )
+    except CircuitOpenError as e:
+        logger.warn(
+            "Payment service circuit open",
+            context="create_payment",
+            retry_in=round(e.retry_in, 1),
+        )
+        return adapter.map_error(
+            message="Payment service is temporarily unavailable. Please try again later.",
+            entity_type="payment",
+            operation="create",
+        )
     except Exception as e:
         logger.error(
             "Unexpected error creating payment",
@@ -1,10 +1,12 @@
 """Get payment status tool."""
 
-import os
 from mesaYA_mcp.server import mcp
-from mesaYA_mcp.shared.core import get_logger
+from mesaYA_mcp.shared.core import get_logger, get_payment_client
 from mesaYA_mcp.shared.domain.access_level import AccessLevel
 from mesaYA_mcp.shared.application.require_access_decorator import require_access
+from mesaYA_mcp.shared.infrastructure.adapters.circuit_open_error import (
+    CircuitOpenError,
+)
 from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
     get_response_adapter,
 )
@@ -18,10 +20,6 @@ class GetPaymentDto(BaseModel):
     payment_id: str = Field(..., description="The payment ID to look up")
 
 
-# Payment microservice URL from environment
-PAYMENT_MS_URL = os.getenv("PAYMENT_MS_URL", "http://localhost:8003")
-
-
 @mcp.tool()
 @require_access(AccessLevel.USER)
 async def get_payment_status(dto: GetPaymentDto) -> str:
@@ -36,6 +34,7 @@ async def get_payment_status(dto: GetPaymentDto) -> str:
         Payment status and details in TOON format.
     """
     logger = get_logger()
+    payment_client = get_payment_client()
     adapter = get_response_adapter()
 
     logger.info(
@@ -46,52 +45,49 @@ async def get_payment_status(dto: GetPaymentDto) -> str:
 
     try:
         # Call Payment Microservice
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{PAYMENT_MS_URL}/api/v1/payments/{dto.payment_id}"
+        response = await payment_client.get(f"/api/v1/payments/{dto.payment_id}")
+
+        if response.status_code == 200:
+            data = payment_client.decode(response)
+            logger.info(
+                "Payment retrieved successfully",
+                context="get_payment",
+                payment_id=dto.payment_id,
+                status=data.get("status"),
+            )
+            return adapter.map_to_toon(
+                data={
+                    "payment_id": data.get("id"),
+                    "status": data.get("status"),
+                    "amount": data.get("amount"),
+                    "currency": data.get("currency"),
+                    "description": data.get("description"),
+                    "created_at": data.get("created_at"),
+                    "metadata": data.get("metadata"),
+                },
+                entity_type="payment",
+                operation="retrieve",
+            )
+        elif response.status_code == 404:
+            logger.warning(
+                "Payment not found",
+                context="get_payment",
+                payment_id=dto.payment_id,
+            )
+            return adapter.map_not_found("payment", dto.payment_id)
+        else:
+            error_detail = payment_client.decode(response).get("detail", "Unknown error")
+            logger.error(
+                "Failed to get payment",
+                context="get_payment",
+                status_code=response.status_code,
+                error=error_detail,
+            )
+            return adapter.map_error(
+                message=f"Failed to retrieve payment: {error_detail}",
+                entity_type="payment",
+                operation="retrieve",
             )
-
-            if response.status_code == 200:
-                data = response.json()
-                logger.info(
-                    "Payment retrieved successfully",
-                    context="get_payment",
-                    payment_id=dto.payment_id,
-                    status=data.get("status"),
-                )
-                return adapter.map_to_toon(
-                    data={
-                        "payment_id": data.get("id"),
-                        "status": data.get("status"),
-                        "amount": data.get("amount"),
-                        "currency": data.get("currency"),
-                        "description": data.get("description"),
-                        "created_at": data.get("created_at"),
-                        "metadata": data.get("metadata"),
-                    },
-                    entity_type="payment",
-                    operation="retrieve",
-                )
-            elif response.status_code == 404:
-                logger.warning(
-                    "Payment not found",
-                    context="get_payment",
-                    payment_id=dto.payment_id,
-                )
-                return adapter.map_not_found("payment", dto.payment_id)
-            else:
-                error_detail = response.json().get("detail", "Unknown error")
-                logger.error(
-                    "Failed to get payment",
-                    context="get_payment",
-                    status_code=response.status_code,
-                    error=error_detail,
-                )
-                return adapter.map_error(
-                    message=f"Failed to retrieve payment: {error_detail}",
-                    entity_type="payment",
-                    operation="retrieve",
-                )
 
     except httpx.TimeoutException:
         logger.error("Payment service timeout", context="get_payment")
@@ -107,6 +103,17 @@ async def get_payment_status(dto: GetPaymentDto) -> str:
             entity_type="payment",
             operation="retrieve",
         )
+    except CircuitOpenError as e:
+        logger.warn(
+            "Payment service circuit open",
+            context="get_payment",
+            retry_in=round(e.retry_in, 1),
+        )
+        return adapter.map_error(
+            message="Payment service is temporarily unavailable. Please try again later.",
+            entity_type="payment",
+            operation="retrieve",
+        )
     except Exception as e:
         logger.error(
             "Unexpected error getting payment",
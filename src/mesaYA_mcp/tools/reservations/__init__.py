@@ -2,6 +2,7 @@
 
 from mesaYA_mcp.tools.reservations.create_reservation import create_reservation
 from mesaYA_mcp.tools.reservations.get_reservation import get_reservation
+from mesaYA_mcp.tools.reservations.get_reservations_bulk import get_reservations_bulk
 from mesaYA_mcp.tools.reservations.list_reservations import list_reservations
 from mesaYA_mcp.tools.reservations.get_restaurant_reservations import (
     get_restaurant_reservations,
@@ -20,6 +21,7 @@ from mesaYA_mcp.tools.reservations.get_reservation_analytics import (
 __all__ = [
     "create_reservation",
     "get_reservation",
+    "get_reservations_bulk",
     "list_reservations",
     "get_restaurant_reservations",
     "update_reservation_status",
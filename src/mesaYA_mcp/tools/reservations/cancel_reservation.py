@@ -32,7 +32,7 @@ async def cancel_reservation(dto: CancelReservationDto) -> str:
 
         response = await http_client.patch(
             f"/api/v1/reservations/{dto.reservation_id}/cancel",
-            json=payload,
+            data=payload,
         )
 
         if response is None:
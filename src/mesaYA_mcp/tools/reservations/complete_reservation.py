@@ -24,7 +24,7 @@ async def complete_reservation(dto: ReservationIdDto) -> str:
     try:
         response = await http_client.patch(
             f"/api/v1/reservations/{dto.reservation_id}/complete",
-            json={},
+            data={},
         )
 
         if response is None:
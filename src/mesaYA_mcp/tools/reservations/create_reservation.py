@@ -8,9 +8,10 @@ from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
     get_response_adapter,
 )
 from mesaYA_mcp.shared.application.services.entity_resolver import (
-    resolve_restaurant_id,
-    resolve_user_id,
+    EntityRef,
+    resolve_ids,
 )
+from mesaYA_mcp.shared.domain import EntityLookupError, EntityNotFoundError
 from mesaYA_mcp.shared.domain.get_current_context import get_current_context
 from mesaYA_mcp.tools.dtos.reservations import CreateReservationDto
 
@@ -61,27 +62,39 @@ async def create_reservation(dto: CreateReservationDto) -> str:
     )
 
     try:
-        # Resolve restaurant by name or ID
-        restaurant_id = await resolve_restaurant_id(dto.restaurant)
-        if restaurant_id is None:
-            return adapter.map_not_found("restaurant", dto.restaurant)
+        # Resolve restaurant (name or ID), customer (email) and optional
+        # section (name within the restaurant) concurrently
+        refs = {
+            "restaurant": EntityRef("restaurant", dto.restaurant),
+            "customer": EntityRef("user", customer_email),
+        }
+        if dto.section_name:
+            refs["section"] = EntityRef(
+                "section", dto.section_name, restaurant=dto.restaurant
+            )
 
-        # Resolve customer by email
-        customer_id = await resolve_user_id(customer_email)
-        if customer_id is None:
-            return adapter.map_not_found("customer", customer_email)
+        try:
+            ids = await resolve_ids(refs)
+        except EntityNotFoundError as e:
+            entity_type = "customer" if e.entity_type == "user" else e.entity_type
+            return adapter.map_not_found(entity_type, e.identifier)
+        except EntityLookupError as e:
+            return adapter.map_error(
+                message=str(e),
+                entity_type="reservation",
+                operation="create",
+            )
 
         payload = {
-            "restaurantId": restaurant_id,
-            "customerId": customer_id,
+            "restaurantId": ids["restaurant"],
+            "customerId": ids["customer"],
             "reservationDate": dto.date,
             "reservationTime": dto.time,
             "partySize": dto.party_size,
         }
 
-        if dto.section_name:
-            # TODO: Resolve section by name within restaurant
-            payload["sectionName"] = dto.section_name
+        if "section" in ids:
+            payload["sectionId"] = ids["section"]
         if dto.table_name:
             payload["tableName"] = dto.table_name
         if dto.notes:
@@ -0,0 +1,74 @@
+"""Get reservations in bulk tool."""
+
+from mesaYA_mcp.server import mcp
+from mesaYA_mcp.shared.core import get_logger
+from mesaYA_mcp.shared.domain.access_level import AccessLevel
+from mesaYA_mcp.shared.application.require_access_decorator import require_access
+from mesaYA_mcp.shared.application.services.bulk_fetch import fetch_by_ids
+from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
+    get_response_adapter,
+)
+from mesaYA_mcp.tools.dtos.reservations import ReservationIdsDto
+
+
+@mcp.tool()
+@require_access(AccessLevel.USER)
+async def get_reservations_bulk(dto: ReservationIdsDto) -> str:
+    """Get several reservations in one call (prefer over repeated get_reservation). Requires USER+. Args: reservation_ids (max 50). Returns: reservations found, IDs not found and IDs that failed."""
+    logger = get_logger()
+    adapter = get_response_adapter()
+
+    logger.info(
+        "Getting reservations in bulk",
+        context="get_reservations_bulk",
+        count=len(dto.reservation_ids),
+    )
+
+    try:
+        result = await fetch_by_ids(dto.reservation_ids, "/api/v1/reservations/{}")
+
+        if not result.requested:
+            return adapter.map_error(
+                message="At least one non-blank reservation ID is required.",
+                entity_type="reservation",
+                operation="bulk_get",
+            )
+
+        if result.failed:
+            logger.warn(
+                "Some reservations could not be retrieved",
+                context="get_reservations_bulk",
+                failed=len(result.failed),
+            )
+
+        if not result.items:
+            if result.failed:
+                return adapter.map_error(
+                    message="Unable to retrieve reservations. Service unavailable.",
+                    entity_type="reservation",
+                    operation="bulk_get",
+                )
+            return adapter.map_not_found("reservation", ", ".join(result.not_found))
+
+        return adapter.map_success(
+            data={
+                "items": result.items,
+                "not_found": result.not_found,
+                "failed": result.failed,
+            },
+            entity_type="reservation",
+            operation="bulk_get",
+            count=len(result.items),
+        )
+
+    except Exception as e:
+        logger.error(
+            "Failed to get reservations in bulk",
+            error=str(e),
+            context="get_reservations_bulk",
+        )
+        return adapter.map_error(
+            message=str(e),
+            entity_type="reservation",
+            operation="bulk_get",
+        )
@@ -14,7 +14,7 @@ from mesaYA_mcp.tools.dtos.reservations import RestaurantReservationsDto
 @mcp.tool()
 @require_access(AccessLevel.OWNER)
 async def get_restaurant_reservations(dto: RestaurantReservationsDto) -> str:
-    """Get restaurant reservations. Requires OWNER+. Args: restaurant, date, status, limit. Returns: reservations list."""
+    """Get restaurant reservations. Requires OWNER+. Args: restaurant, date, status, limit, cursor. Returns: reservations list."""
     logger = get_logger()
     http_client = get_http_client()
     adapter = get_response_adapter()
@@ -27,34 +27,41 @@ async def get_restaurant_reservations(dto: RestaurantReservationsDto) -> str:
     )
 
     try:
+        if dto.cursor:
+            return adapter.map_continuation(dto.cursor, "reservation", "list")
+
         # Resolve restaurant by name or ID
         restaurant_id = await resolve_restaurant_id(dto.restaurant)
         if restaurant_id is None:
             return adapter.map_not_found("restaurant", dto.restaurant)
 
-        params: dict = {"limit": dto.limit}
+        params: dict = {}
         if dto.date:
             params["date"] = dto.date
         if dto.status:
             params["status"] = dto.status
 
-        response = await http_client.get(
+        async with http_client.paginate(
             f"/api/v1/reservations/restaurant/{restaurant_id}",
             params=params,
-        )
+            max_items=dto.limit,
+        ) as pages:
+            reservations = await pages.collect()
 
-        if response is None:
+        if pages.failed and not reservations:
             return adapter.map_not_found("reservation", dto.restaurant)
 
-        if isinstance(response, dict):
-            reservations = response.get("data", [])
-        else:
-            reservations = response
-
         if not reservations:
             return adapter.map_empty("reservation", "list")
 
-        return adapter.map_success(
+        if pages.failed:
+            logger.warn(
+                "List truncated by a failed page",
+                context="get_restaurant_reservations",
+                items=len(reservations),
+            )
+
+        return adapter.map_page(
             data=reservations,
             entity_type="reservation",
             operation="list",
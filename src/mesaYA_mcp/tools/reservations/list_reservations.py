@@ -13,7 +13,7 @@ from mesaYA_mcp.tools.dtos.reservations import ListReservationsDto
 @mcp.tool()
 @require_access(AccessLevel.USER)
 async def list_reservations(dto: ListReservationsDto) -> str:
-    """List reservations. Requires USER+. Args: status, date_from, date_to, limit. Returns: reservations list."""
+    """List reservations. Requires USER+. Args: status, date_from, date_to, limit, cursor. Returns: reservations list."""
     logger = get_logger()
     http_client = get_http_client()
     adapter = get_response_adapter()
@@ -27,7 +27,10 @@ async def list_reservations(dto: ListReservationsDto) -> str:
     )
 
     try:
-        params: dict = {"limit": dto.limit}
+        if dto.cursor:
+            return adapter.map_continuation(dto.cursor, "reservation", "list")
+
+        params: dict = {}
 
         if dto.status:
             params["status"] = dto.status
@@ -36,24 +39,29 @@ async def list_reservations(dto: ListReservationsDto) -> str:
         if dto.date_to:
             params["dateTo"] = dto.date_to
 
-        response = await http_client.get("/api/v1/reservations", params=params)
+        async with http_client.paginate(
+            "/api/v1/reservations", params=params, max_items=dto.limit
+        ) as pages:
+            reservations = await pages.collect()
 
-        if response is None:
+        if pages.failed and not reservations:
             return adapter.map_error(
                 message="Unable to retrieve reservations",
                 entity_type="reservation",
                 operation="list",
             )
 
-        if isinstance(response, dict):
-            reservations = response.get("data", [])
-        else:
-            reservations = response
-
         if not reservations:
             return adapter.map_empty("reservation", "list")
 
-        return adapter.map_success(
+        if pages.failed:
+            logger.warn(
+                "List truncated by a failed page",
+                context="list_reservations",
+                items=len(reservations),
+            )
+
+        return adapter.map_page(
             data=reservations,
             entity_type="reservation",
             operation="list",
@@ -29,7 +29,7 @@ async def update_reservation_status(dto: UpdateReservationStatusDto) -> str:
 
         response = await http_client.patch(
             f"/api/v1/reservations/{dto.reservation_id}/status",
-            json=payload,
+            data=payload,
         )
 
         if response is None:
@@ -2,6 +2,7 @@
 
 from mesaYA_mcp.server import mcp
 from mesaYA_mcp.shared.core import get_logger, get_http_client
+from mesaYA_mcp.shared.application.services.field_projection import project_fields
 from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
     get_response_adapter,
 )
@@ -10,7 +11,7 @@ from mesaYA_mcp.tools.dtos.restaurants import NearbyRestaurantsDto
 
 @mcp.tool()
 async def get_nearby_restaurants(dto: NearbyRestaurantsDto) -> str:
-    """Find restaurants near coordinates. Args: lat, lng, radius_km, limit. Returns: nearby restaurants list."""
+    """Find restaurants near coordinates. Args: lat, lng, radius_km, limit, fields, cursor. Returns: nearby restaurants list."""
     logger = get_logger()
     http_client = get_http_client()
     adapter = get_response_adapter()
@@ -24,6 +25,9 @@ async def get_nearby_restaurants(dto: NearbyRestaurantsDto) -> str:
     )
 
     try:
+        if dto.cursor:
+            return adapter.map_continuation(dto.cursor, "restaurant", "nearby")
+
         params = {
             "lat": dto.latitude,
             "lng": dto.longitude,
@@ -44,8 +48,13 @@ async def get_nearby_restaurants(dto: NearbyRestaurantsDto) -> str:
         if not restaurants:
             return adapter.map_empty("restaurant", "nearby")
 
-        return adapter.map_success(
-            data=restaurants,
+        return adapter.map_page(
+            data=project_fields(
+                restaurants,
+                "restaurant",
+                dto.fields,
+                keep=("id", "distance", "location"),
+            ),
             entity_type="restaurant",
             operation="nearby",
             count=len(restaurants),
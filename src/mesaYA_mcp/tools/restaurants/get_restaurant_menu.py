@@ -2,6 +2,7 @@
 
 from mesaYA_mcp.server import mcp
 from mesaYA_mcp.shared.core import get_logger, get_http_client
+from mesaYA_mcp.shared.application.services.field_projection import project_fields
 from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
     get_response_adapter,
 )
@@ -11,7 +12,7 @@ from mesaYA_mcp.tools.dtos.restaurants import RestaurantMenuDto
 
 @mcp.tool()
 async def get_restaurant_menu(dto: RestaurantMenuDto) -> str:
-    """Get restaurant menu. Args: restaurant (name/UUID), active_only. Returns: menu with dishes."""
+    """Get restaurant menu. Args: restaurant (name/UUID), active_only, fields, cursor. Returns: menu with dishes."""
     logger = get_logger()
     http_client = get_http_client()
     adapter = get_response_adapter()
@@ -23,6 +24,9 @@ async def get_restaurant_menu(dto: RestaurantMenuDto) -> str:
     )
 
     try:
+        if dto.cursor:
+            return adapter.map_continuation(dto.cursor, "menu", "get")
+
         # Resolve restaurant by name or ID
         restaurant_id = await resolve_restaurant_id(dto.restaurant)
 
@@ -50,8 +54,8 @@ async def get_restaurant_menu(dto: RestaurantMenuDto) -> str:
         if not menus:
             return adapter.map_empty("menu", "get")
 
-        return adapter.map_success(
-            data=menus,
+        return adapter.map_page(
+            data=project_fields(menus, "menu", dto.fields),
             entity_type="menu",
             operation="get",
             count=len(menus),
@@ -1,11 +1,15 @@
 """Get section tables tool."""
 
+import asyncio
+
 from mesaYA_mcp.server import mcp
 from mesaYA_mcp.shared.core import get_logger, get_http_client
 from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
     get_response_adapter,
 )
 from mesaYA_mcp.shared.application.services.entity_resolver import resolve_section_id
+from mesaYA_mcp.shared.application.services.entity_resolver.utils import is_uuid
+from mesaYA_mcp.shared.domain import EntityLookupError
 from mesaYA_mcp.tools.dtos.restaurants import SectionIdDto
 
 
@@ -24,8 +28,27 @@ async def get_section_tables(dto: SectionIdDto) -> str:
     )
 
     try:
-        # Resolve section by name or ID
-        section_id = await resolve_section_id(dto.section, dto.restaurant)
+        if is_uuid(dto.section.strip()):
+            # Validate the section while its tables are already being fetched
+            section_id = dto.section.strip()
+            try:
+                async with asyncio.TaskGroup() as group:
+                    exists = group.create_task(resolve_section_id(section_id))
+                    tables_request = group.create_task(
+                        http_client.get(f"/api/v1/sections/{section_id}/tables")
+                    )
+            except* EntityLookupError as errors:
+                raise errors.exceptions[0] from None
+            if exists.result() is None:
+                section_id = None
+            response = tables_request.result()
+        else:
+            # Resolve section by name within restaurant, then fetch its tables
+            section_id = await resolve_section_id(dto.section, dto.restaurant)
+            if section_id is not None:
+                response = await http_client.get(
+                    f"/api/v1/sections/{section_id}/tables"
+                )
 
         if section_id is None:
             if dto.restaurant:
@@ -35,8 +58,6 @@ async def get_section_tables(dto: SectionIdDto) -> str:
                 )
             return adapter.map_not_found("section", dto.section)
 
-        response = await http_client.get(f"/api/v1/sections/{section_id}/tables")
-
         if response is None:
             return adapter.map_not_found("table", dto.section)
 
@@ -52,6 +73,12 @@ async def get_section_tables(dto: SectionIdDto) -> str:
             count=len(tables),
         )
 
+    except EntityLookupError as e:
+        return adapter.map_error(
+            message=str(e),
+            entity_type="table",
+            operation="list",
+        )
     except Exception as e:
         logger.error(
             "Failed to get section tables",
@@ -2,6 +2,7 @@
 
 from mesaYA_mcp.server import mcp
 from mesaYA_mcp.shared.core import get_logger, get_http_client
+from mesaYA_mcp.shared.application.services.field_projection import project_fields
 from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
     get_response_adapter,
 )
@@ -13,7 +14,9 @@ async def search_restaurants(dto: SearchRestaurantsDto) -> str:
     """Search restaurants by name, cuisine, or city. Returns matching restaurants in TOON format.
 
     Args:
-        dto: Search filters (name, city, cuisine_type, query, limit).
+        dto: Search filters (name, city, cuisine_type, query, limit) and
+            optional fields to return per restaurant, or a cursor to continue
+            a truncated result.
 
     Returns:
         Matching restaurants list.
@@ -33,7 +36,10 @@ async def search_restaurants(dto: SearchRestaurantsDto) -> str:
     )
 
     try:
-        params: dict = {"limit": dto.limit}
+        if dto.cursor:
+            return adapter.map_continuation(dto.cursor, "restaurant", "search")
+
+        params: dict = {}
         if dto.name:
             params["name"] = dto.name
         if dto.city:
@@ -52,25 +58,25 @@ async def search_restaurants(dto: SearchRestaurantsDto) -> str:
             params=params,
         )
 
-        response = await http_client.get("/api/v1/restaurants", params=params)
+        async with http_client.paginate(
+            "/api/v1/restaurants", params=params, max_items=dto.limit
+        ) as pages:
+            restaurants = await pages.collect()
 
-        if response is None:
+        if not restaurants:
             return adapter.map_empty("restaurant", "search")
 
-        if isinstance(response, dict):
-            restaurants = response.get("data", response.get("results", []))
-            total = response.get("pagination", {}).get("totalItems", len(restaurants))
-            if not restaurants and "results" not in response and "data" not in response:
-                restaurants = [response] if response.get("id") else []
-        else:
-            restaurants = response
-            total = len(restaurants)
+        if pages.failed:
+            logger.warn(
+                "List truncated by a failed page",
+                context="search_restaurants",
+                items=len(restaurants),
+            )
 
-        if not restaurants:
-            return adapter.map_empty("restaurant", "search")
+        total = pages.total if pages.total is not None else len(restaurants)
 
-        return adapter.map_success(
-            data=restaurants,
+        return adapter.map_page(
+            data=project_fields(restaurants, "restaurant", dto.fields),
             entity_type="restaurant",
             operation="search",
             count=total,
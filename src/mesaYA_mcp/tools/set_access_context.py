@@ -6,6 +6,7 @@ Must be called before any access-restricted tools.
 
 from mesaYA_mcp.server import mcp
 from mesaYA_mcp.shared.domain.access_level import AccessLevel
+from mesaYA_mcp.shared.domain.output_format import OutputFormat
 from mesaYA_mcp.shared.domain.tool_context_model import ToolContext
 from mesaYA_mcp.shared.domain.set_current_context import set_current_context
 
@@ -16,18 +17,27 @@ async def set_access_context(
     user_id: str | None = None,
     user_email: str | None = None,
     restaurant_id: str | None = None,
+    output_format: str | None = None,
 ) -> str:
-    """Set access context. CALL FIRST. Args: access_level (guest/user/owner/admin), user_id, user_email, restaurant_id."""
+    """Set access context. CALL FIRST. Args: access_level (guest/user/owner/admin), user_id, user_email, restaurant_id, output_format (toon/json/columnar, default toon)."""
     try:
         level = AccessLevel(access_level.lower())
     except ValueError:
         return f"Error: Invalid access level '{access_level}'. Valid: guest, user, owner, admin"
 
+    response_format = None
+    try:
+        if output_format:
+            response_format = OutputFormat(output_format.lower())
+    except ValueError:
+        return f"Error: Invalid output format '{output_format}'. Valid: toon, json, columnar"
+
     context = ToolContext(
         access_level=level,
         user_id=user_id,
         user_email=user_email,
         restaurant_id=restaurant_id,
+        output_format=response_format,
     )
     set_current_context(context)
 
@@ -35,5 +45,6 @@ async def set_access_context(
         f"Access context set: level={level.value}, "
         f"user_id={user_id or 'none'}, "
         f"user_email={user_email or 'none'}, "
-        f"restaurant_id={restaurant_id or 'none'}"
+        f"restaurant_id={restaurant_id or 'none'}, "
+        f"output_format={response_format or 'default'}"
     )
@@ -1,6 +1,7 @@
 """User tools - one tool per file."""
 
 from mesaYA_mcp.tools.users.get_user import get_user
+from mesaYA_mcp.tools.users.get_users_bulk import get_users_bulk
 from mesaYA_mcp.tools.users.get_user_by_email import get_user_by_email
 from mesaYA_mcp.tools.users.list_users import list_users
 from mesaYA_mcp.tools.users.get_user_analytics import get_user_analytics
@@ -8,6 +9,7 @@ from mesaYA_mcp.tools.users.get_my_profile import get_my_profile
 
 __all__ = [
     "get_user",
+    "get_users_bulk",
     "get_user_by_email",
     "list_users",
     "get_user_analytics",
@@ -0,0 +1,74 @@
+"""Get users in bulk tool."""
+
+from mesaYA_mcp.server import mcp
+from mesaYA_mcp.shared.core import get_logger
+from mesaYA_mcp.shared.domain.access_level import AccessLevel
+from mesaYA_mcp.shared.application.require_access_decorator import require_access
+from mesaYA_mcp.shared.application.services.bulk_fetch import fetch_by_ids
+from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
+    get_response_adapter,
+)
+from mesaYA_mcp.tools.dtos.users import UserIdsDto
+
+
+@mcp.tool()
+@require_access(AccessLevel.ADMIN)
+async def get_users_bulk(dto: UserIdsDto) -> str:
+    """Get several users in one call (prefer over repeated get_user). Requires ADMIN. Args: user_ids (max 50). Returns: user profiles found, IDs not found and IDs that failed."""
+    logger = get_logger()
+    adapter = get_response_adapter()
+
+    logger.info(
+        "Getting users in bulk",
+        context="get_users_bulk",
+        count=len(dto.user_ids),
+    )
+
+    try:
+        result = await fetch_by_ids(dto.user_ids, "/api/v1/users/{}")
+
+        if not result.requested:
+            return adapter.map_error(
+                message="At least one non-blank user ID is required.",
+                entity_type="user",
+                operation="bulk_get",
+            )
+
+        if result.failed:
+            logger.warn(
+                "Some users could not be retrieved",
+                context="get_users_bulk",
+                failed=len(result.failed),
+            )
+
+        if not result.items:
+            if result.failed:
+                return adapter.map_error(
+                    message="Unable to retrieve users. Service unavailable.",
+                    entity_type="user",
+                    operation="bulk_get",
+                )
+            return adapter.map_not_found("user", ", ".join(result.not_found))
+
+        return adapter.map_success(
+            data={
+                "items": result.items,
+                "not_found": result.not_found,
+                "failed": result.failed,
+            },
+            entity_type="user",
+            operation="bulk_get",
+            count=len(result.items),
+        )
+
+    except Exception as e:
+        logger.error(
+            "Failed to get users in bulk",
+            error=str(e),
+            context="get_users_bulk",
+        )
+        return adapter.map_error(
+            message=str(e),
+            entity_type="user",
+            operation="bulk_get",
+        )
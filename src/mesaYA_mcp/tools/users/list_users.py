@@ -4,6 +4,7 @@ from mesaYA_mcp.server import mcp
 from mesaYA_mcp.shared.core import get_logger, get_http_client
 from mesaYA_mcp.shared.domain.access_level import AccessLevel
 from mesaYA_mcp.shared.application.require_access_decorator import require_access
+from mesaYA_mcp.shared.application.services.field_projection import project_fields
 from mesaYA_mcp.shared.infrastructure.adapters.toon_response_adapter import (
     get_response_adapter,
 )
@@ -13,7 +14,7 @@ from mesaYA_mcp.tools.dtos.users import ListUsersDto
 @mcp.tool()
 @require_access(AccessLevel.ADMIN)
 async def list_users(dto: ListUsersDto) -> str:
-    """List users. Requires ADMIN. Args: email, name, role, active_only, search, limit. Returns: users list."""
+    """List users. Requires ADMIN. Args: email, name, role, active_only, search, limit, fields, cursor. Returns: users list."""
     logger = get_logger()
     http_client = get_http_client()
     adapter = get_response_adapter()
@@ -28,7 +29,10 @@ async def list_users(dto: ListUsersDto) -> str:
     )
 
     try:
-        params: dict = {"limit": dto.limit}
+        if dto.cursor:
+            return adapter.map_continuation(dto.cursor, "user", "list")
+
+        params: dict = {}
         if dto.email:
             params["email"] = dto.email
         if dto.name:
@@ -40,25 +44,30 @@ async def list_users(dto: ListUsersDto) -> str:
         if dto.search:
             params["q"] = dto.search
 
-        response = await http_client.get("/api/v1/users", params=params)
+        async with http_client.paginate(
+            "/api/v1/users", params=params, max_items=dto.limit
+        ) as pages:
+            users = await pages.collect()
 
-        if response is None:
+        if pages.failed and not users:
             return adapter.map_error(
                 message="Unable to retrieve users",
                 entity_type="user",
                 operation="list",
             )
 
-        if isinstance(response, dict):
-            users = response.get("data", response.get("results", []))
-        else:
-            users = response
-
         if not users:
             return adapter.map_empty("user", "list")
 
-        return adapter.map_success(
-            data=users,
+        if pages.failed:
+            logger.warn(
+                "List truncated by a failed page",
+                context="list_users",
+                items=len(users),
+            )
+
+        return adapter.map_page(
+            data=project_fields(users, "user", dto.fields),
             entity_type="user",
             operation="list",
             count=len(users),